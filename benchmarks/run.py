@@ -0,0 +1,215 @@
+"""
+Throughput and peak-memory benchmarks for every simulator.
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json
+
+Absolute timings only mean something on the machine that produced them, so
+every run also times a fixed pure-Python reference workload and stores it
+in "meta" with the machine and Python version. --baseline compares speed
+relative to that reference (refs/s scaled by the ratio of the two reference
+timings), which cancels most of the difference between machines. The
+checked-in baseline.json still comes from one machine and interpreter;
+for a strict check, regenerate it locally with --output before changing
+the code and compare against that.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from benchmarks.workloads import DISK_WORKLOADS, PAGE_WORKLOADS
+from disk_scheduling import DISK_ALGORITHMS, run_disk_algorithm
+from page_replacement import PAGE_ALGORITHMS
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+DEFAULT_FRAMES = 64
+DEFAULT_DISK_SIZE = 10000
+
+
+def _measure(func, repeat=3, min_time=0.05):
+    """
+    Best per-call wall time over repeat samples (each sample loops until it
+    takes at least min_time), then peak traced memory of one more call.
+    """
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 2
+    seconds = elapsed / loops
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        seconds = min(seconds, (time.perf_counter() - start) / loops)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def _reference_workload():
+    # Dict, list and integer work in the same proportions as the simulators
+    counts = {}
+    order = []
+    for i in range(20000):
+        key = (i * 7919) % 1021
+        counts[key] = counts.get(key, 0) + 1
+        order.append(key)
+        if len(order) > 64:
+            order.pop(0)
+    return len(counts)
+
+
+def reference_seconds():
+    """Best time of the reference workload on this machine."""
+    return _measure(_reference_workload, repeat=7, min_time=0.2)[0]
+
+
+def machine_info():
+    """What produced a set of results, stored in the JSON "meta"."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "reference_seconds": reference_seconds(),
+    }
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, frames=DEFAULT_FRAMES, disk_size=DEFAULT_DISK_SIZE,
+                   page_algorithms=None, disk_algorithms=None, seed=0, on_result=None):
+    """Time every (workload, algorithm, size) combination and return the rows."""
+    if page_algorithms is None:
+        page_algorithms = list(PAGE_ALGORITHMS)
+    if disk_algorithms is None:
+        disk_algorithms = list(DISK_ALGORITHMS)
+    results = []
+
+    def record(kind, workload, algorithm, size, seconds, peak):
+        row = {
+            "kind": kind,
+            "workload": workload,
+            "algorithm": algorithm,
+            "size": size,
+            "seconds": seconds,
+            "refs_per_sec": size / seconds if seconds else float("inf"),
+            "peak_bytes": peak,
+        }
+        results.append(row)
+        if on_result is not None:
+            on_result(row)
+
+    for size in sizes:
+        for workload, generate in (PAGE_WORKLOADS.items() if page_algorithms else ()):
+            pages = generate(size, seed=seed)
+            for algorithm in page_algorithms:
+                simulate = PAGE_ALGORITHMS[algorithm]
+                seconds, peak = _measure(lambda: simulate(pages, frames, summary_only=True, verbose=False))
+                record("page", workload, algorithm, size, seconds, peak)
+
+        for workload, generate in (DISK_WORKLOADS.items() if disk_algorithms else ()):
+            requests = generate(size, disk_size=disk_size, seed=seed)
+            head = disk_size // 2
+            for algorithm in disk_algorithms:
+                seconds, peak = _measure(lambda: run_disk_algorithm(algorithm, requests, head, disk_size))
+                record("disk", workload, algorithm, size, seconds, peak)
+
+    return results
+
+
+def _key(row):
+    return (row["kind"], row["workload"], row["algorithm"], row["size"])
+
+
+def compare(results, baseline, tolerance=0.5, speed_scale=1.0):
+    """
+    Rows that got slower or hungrier than the baseline by more than
+    tolerance (a fraction). Cases missing from the baseline are skipped.
+
+    speed_scale is the baseline's reference time over this machine's
+    (see reference_seconds): baseline refs/s are multiplied by it, so a
+    machine twice as fast is expected to be twice as fast everywhere.
+    """
+    reference = {_key(row): row for row in baseline}
+    regressions = []
+    for row in results:
+        base = reference.get(_key(row))
+        if base is None:
+            continue
+        if row["refs_per_sec"] < base["refs_per_sec"] * speed_scale * (1 - tolerance):
+            regressions.append((row, base, "refs_per_sec"))
+        if row["peak_bytes"] > base["peak_bytes"] * (1 + tolerance):
+            regressions.append((row, base, "peak_bytes"))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the page-replacement and disk-scheduling algorithms.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES)
+    parser.add_argument("--disk-size", type=int, default=DEFAULT_DISK_SIZE)
+    parser.add_argument("--algorithms", nargs="+", help="limit to these algorithm names")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    args = parser.parse_args(argv)
+
+    page_algorithms = disk_algorithms = None
+    if args.algorithms:
+        page_algorithms = [a for a in args.algorithms if a in PAGE_ALGORITHMS]
+        disk_algorithms = [a for a in args.algorithms if a in DISK_ALGORITHMS]
+        if not page_algorithms and not disk_algorithms:
+            parser.error("no known algorithm in --algorithms")
+
+    def show(row):
+        print(f"{row['kind']:4} {row['workload']:10} {row['algorithm']:13} n={row['size']:<8} "
+              f"{row['refs_per_sec']:>12,.0f} refs/s  peak {row['peak_bytes'] / 1024:>9,.1f} KiB")
+
+    meta = machine_info()
+    meta.update(seed=args.seed, frames=args.frames, disk_size=args.disk_size)
+    results = run_benchmarks(args.sizes, args.frames, args.disk_size, page_algorithms,
+                             disk_algorithms, args.seed, on_result=show)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"meta": meta, "results": results}, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        base_meta = baseline.get("meta", {})
+        speed_scale = 1.0
+        if "reference_seconds" in base_meta:
+            speed_scale = base_meta["reference_seconds"] / meta["reference_seconds"]
+            print(f"Reference workload: this machine is {speed_scale:.2f}x the baseline's speed.")
+        else:
+            print("⚠️ Baseline has no reference timing; comparing absolute speed. Regenerate it on this machine.")
+        if base_meta.get("python") != meta["python"]:
+            print(f"⚠️ Baseline was made with Python {base_meta.get('python')}, this is {meta['python']}.")
+        regressions = compare(results, baseline["results"], args.tolerance, speed_scale)
+        for row, base, metric in regressions:
+            expected = base[metric] * (speed_scale if metric == "refs_per_sec" else 1)
+            print(f"❌ Regression in {metric}: {row['kind']} {row['workload']} {row['algorithm']} "
+                  f"n={row['size']}: {row[metric]:,.0f} vs baseline {expected:,.0f}")
+        if regressions:
+            return 1
+        print("✅ No regressions against the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+import random
+from itertools import accumulate
+
+# Every generator takes an explicit seed so runs are reproducible
+
+
+def zipf_pages(n, page_count=1000, skew=1.0, seed=0):
+    """Page references with Zipf-distributed popularity."""
+    rng = random.Random(seed)
+    weights = [1 / (rank ** skew) for rank in range(1, page_count + 1)]
+    pages = list(range(page_count))
+    rng.shuffle(pages)
+    return rng.choices(pages, cum_weights=list(accumulate(weights)), k=n)
+
+
+def looping_pages(n, loop_length=100, seed=0):
+    """A scan that loops over the same loop_length pages."""
+    start = random.Random(seed).randrange(1000)
+    return [start + i % loop_length for i in range(n)]
+
+
+def phase_pages(n, page_count=1000, working_set=50, phase_length=5000, seed=0):
+    """Uniform references inside a working set that changes every phase."""
+    rng = random.Random(seed)
+    pages = []
+    while len(pages) < n:
+        current = rng.sample(range(page_count), working_set)
+        pages.extend(rng.choice(current) for _ in range(min(phase_length, n - len(pages))))
+    return pages
+
+
+def strided_pages(n, page_count=1000, stride=7, seed=0):
+    """Fixed-stride walk over page_count pages from a random start."""
+    start = random.Random(seed).randrange(page_count)
+    return [(start + i * stride) % page_count for i in range(n)]
+
+
+def uniform_requests(n, disk_size=10000, seed=0):
+    """Cylinder requests spread uniformly over the disk."""
+    rng = random.Random(seed)
+    return [rng.randrange(disk_size) for _ in range(n)]
+
+
+def clustered_requests(n, disk_size=10000, clusters=8, spread=50, seed=0):
+    """Requests bunched around a few hot cylinders."""
+    rng = random.Random(seed)
+    centers = [rng.randrange(disk_size) for _ in range(clusters)]
+    return [min(disk_size - 1, max(0, int(rng.gauss(rng.choice(centers), spread)))) for _ in range(n)]
+
+
+def sequential_requests(n, disk_size=10000, run_length=64, seed=0):
+    """Runs of consecutive cylinders starting at random places."""
+    rng = random.Random(seed)
+    requests = []
+    while len(requests) < n:
+        start = rng.randrange(disk_size)
+        requests.extend((start + i) % disk_size for i in range(min(run_length, n - len(requests))))
+    return requests
+
+
+PAGE_WORKLOADS = {
+    "zipf": zipf_pages,
+    "looping": looping_pages,
+    "phases": phase_pages,
+    "strided": strided_pages,
+}
+
+DISK_WORKLOADS = {
+    "uniform": uniform_requests,
+    "clustered": clustered_requests,
+    "sequential": sequential_requests,
+}
@@ -0,0 +1,280 @@
+"""
+Headless command line for the simulators.
+
+    python -m cli page --pages "7 0 1 2 0 3" --frames 3 --algorithm all
+    python -m cli page --trace refs.txt --frames 64 --algorithm Optimal --profile
+    python -m cli disk --trace queue.txt --head 53 --disk-size 200 --format csv
+    python -m cli sweep --trace refs.bin --trace-format int32 --max-frames 64
+    python -m cli window --trace sample.txt --frames 64 --windows 64 1024 16384
+    python -m cli variable --trace refs.txt --algorithm "Working Set" --params 100 1000 10000
+    python -m cli batch page --inputs a.txt b.txt --algorithm LRU --frames 4 8 16
+    python -m cli plot --pages "1 2 3 4 1 2 5 1 2 3 4 5" --max-frames 6
+    python -m cli gui
+
+Only the simulators are imported at startup; customtkinter and matplotlib
+are loaded by the gui and plot subcommands alone.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+
+from page_replacement import PAGE_ALGORITHMS, VARIABLE_ALGORITHMS
+from disk_scheduling import DISK_ALGORITHMS, run_disk_algorithm
+
+# Simulators that take an observer= for --profile
+OBSERVABLE_ALGORITHMS = {"Optimal", "Second Chance"}
+
+
+def _read_input(args):
+    if args.trace:
+        from utils.trace_loader import load_trace
+        return load_trace(args.trace, args.trace_format)
+    if args.pages is not None:
+        return list(map(int, args.pages.split()))
+    raise ValueError("Give either --pages or --trace.")
+
+
+def _algorithms(names, registry):
+    if names == ["all"]:
+        return list(registry)
+    for name in names:
+        if name not in registry:
+            raise ValueError(f"Unknown algorithm: {name} (choose from {', '.join(registry)})")
+    return names
+
+
+def run_page(args):
+    pages = _read_input(args)
+    if args.frames <= 0:
+        raise ValueError("Number of frames must be greater than 0.")
+    rows = []
+    for algo in _algorithms(args.algorithm, PAGE_ALGORITHMS):
+        options = {}
+        if args.profile and algo in OBSERVABLE_ALGORITHMS:
+            from page_replacement.observer import CountingObserver
+            options["observer"] = CountingObserver()
+        result = PAGE_ALGORITHMS[algo](pages, args.frames, summary_only=True, verbose=False, **options)
+        if options:
+            print(f"{algo}\n{options['observer'].report()}", file=sys.stderr)
+        rows.append({
+            "algorithm": algo,
+            "frames": args.frames,
+            "references": len(pages),
+            "page_faults": result["page_faults"],
+            "hits": result["hits"],
+        })
+    return rows
+
+
+def run_disk(args):
+    requests = list(_read_input(args))
+    if args.disk_size <= 0 or args.head < 0 or args.head >= args.disk_size:
+        raise ValueError("Head must be within disk size range.")
+    if any(r < 0 or r >= args.disk_size for r in requests):
+        raise ValueError(f"Requests must be in range 0 to {args.disk_size - 1}.")
+    rows = []
+    for algo in _algorithms(args.algorithm, DISK_ALGORITHMS):
+        seek_order, total_seek = run_disk_algorithm(algo, requests, args.head, args.disk_size)
+        row = {
+            "algorithm": algo,
+            "head": args.head,
+            "disk_size": args.disk_size,
+            "request_count": len(requests),
+            "seek_distance": total_seek,
+        }
+        if args.order:
+            row["seek_order"] = list(seek_order)
+        rows.append(row)
+    return rows
+
+
+def run_sweep(args):
+    from page_replacement.sweep import fault_curve
+
+    pages = _read_input(args)
+    rows = []
+    for algo in _algorithms(args.algorithm, PAGE_ALGORITHMS):
+        curve = fault_curve(pages, args.max_frames, algo)
+        anomalies = set(curve["belady_anomalies"])
+        for frames, faults, hits in zip(curve["frames"], curve["page_faults"], curve["hits"]):
+            rows.append({
+                "algorithm": algo,
+                "frames": frames,
+                "page_faults": faults,
+                "hits": hits,
+                "belady_anomaly": frames in anomalies,
+            })
+    return rows
+
+
+def run_window_report(args):
+    from page_replacement.windowed_optimal import window_error_report
+
+    return window_error_report(list(_read_input(args)), args.frames, args.windows, args.tie_break)
+
+
+def run_variable(args):
+    pages = _read_input(args)
+    rows = []
+    for algo in _algorithms(args.algorithm, VARIABLE_ALGORITHMS):
+        for param in args.params:
+            result = VARIABLE_ALGORITHMS[algo](pages, param, summary_only=True, verbose=False)
+            rows.append({
+                "algorithm": algo,
+                "param": param,
+                "references": len(pages),
+                "page_faults": result["page_faults"],
+                "hits": result["hits"],
+                "mean_resident_set_size": result["mean_resident_set_size"],
+                "max_resident_set_size": result["max_resident_set_size"],
+            })
+    return rows
+
+
+def run_batch_jobs(args):
+    from utils.batch_runner import disk_jobs, page_jobs, run_batch
+
+    inputs = {os.path.basename(path): path for path in args.inputs}
+    if args.kind == "page":
+        jobs = page_jobs(inputs, _algorithms(args.algorithm, PAGE_ALGORITHMS), args.frames)
+    else:
+        jobs = disk_jobs(inputs, _algorithms(args.algorithm, DISK_ALGORITHMS), args.head, args.disk_size)
+    return run_batch(jobs, args.workers)
+
+
+def run_plot(args):
+    import matplotlib
+    if args.output:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    rows = run_sweep(args)
+    for algo in dict.fromkeys(row["algorithm"] for row in rows):
+        points = [row for row in rows if row["algorithm"] == algo]
+        plt.plot([row["frames"] for row in points], [row["page_faults"] for row in points], marker="o", label=algo)
+    plt.xlabel("Frames")
+    plt.ylabel("Page Faults")
+    plt.title("Page Faults vs Frames")
+    plt.legend()
+    if args.output:
+        plt.savefig(args.output)
+    else:
+        plt.show()
+    return None
+
+
+def run_gui(args):
+    import runpy
+
+    gui_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gui")
+    # gui/main.py imports its siblings as top-level modules
+    sys.path.insert(0, gui_dir)
+    runpy.run_path(os.path.join(gui_dir, "main.py"), run_name="__main__")
+    return None
+
+
+def write_rows(rows, fmt, out):
+    if fmt == "json":
+        json.dump(rows, out, indent=2)
+        out.write("\n")
+        return
+    fields = list(dict.fromkeys(key for row in rows for key in row))
+    writer = csv.DictWriter(out, fieldnames=fields, lineterminator="\n")
+    writer.writeheader()
+    for row in rows:
+        writer.writerow({k: " ".join(map(str, v)) if isinstance(v, list) else v for k, v in row.items()})
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m cli", description="Run the OS algorithm simulators without the GUI.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_input(sub, what):
+        group = sub.add_mutually_exclusive_group(required=True)
+        group.add_argument("--pages", "--requests", dest="pages", help=f"space-separated {what}")
+        group.add_argument("--trace", help=f"trace file of {what}")
+        sub.add_argument("--trace-format", default="text", choices=["text", "int32", "int64"])
+
+    def add_output(sub):
+        sub.add_argument("--format", default="json", choices=["json", "csv"])
+
+    page = commands.add_parser("page", help="run page-replacement algorithms")
+    add_input(page, "page numbers")
+    page.add_argument("--frames", type=int, required=True)
+    page.add_argument("--algorithm", nargs="+", default=["all"], help="names from PAGE_ALGORITHMS, or all")
+    page.add_argument("--profile", action="store_true", help="print operation counters to stderr (Optimal, Second Chance)")
+    add_output(page)
+    page.set_defaults(run=run_page)
+
+    disk = commands.add_parser("disk", help="run disk-scheduling algorithms")
+    add_input(disk, "cylinder requests")
+    disk.add_argument("--head", type=int, required=True)
+    disk.add_argument("--disk-size", type=int, required=True)
+    disk.add_argument("--algorithm", nargs="+", default=["all"], help="names from DISK_ALGORITHMS, or all")
+    disk.add_argument("--order", action="store_true", help="include the seek order")
+    add_output(disk)
+    disk.set_defaults(run=run_disk)
+
+    sweep = commands.add_parser("sweep", help="page faults for every frame count up to --max-frames")
+    add_input(sweep, "page numbers")
+    sweep.add_argument("--max-frames", type=int, required=True)
+    sweep.add_argument("--algorithm", nargs="+", default=["Optimal"])
+    add_output(sweep)
+    sweep.set_defaults(run=run_sweep)
+
+    window = commands.add_parser("window", help="windowed Optimal's extra faults against exact Optimal per window size")
+    add_input(window, "page numbers")
+    window.add_argument("--frames", type=int, required=True)
+    window.add_argument("--windows", type=int, nargs="+", default=[0, 16, 64, 256, 1024, 4096])
+    window.add_argument("--tie-break", default="lowest_slot", choices=["lowest_slot", "fifo", "lru"])
+    add_output(window)
+    window.set_defaults(run=run_window_report)
+
+    variable = commands.add_parser("variable", help="Working Set / PFF faults and resident set size per window or threshold")
+    add_input(variable, "page numbers")
+    variable.add_argument("--algorithm", nargs="+", default=["all"], help="names from VARIABLE_ALGORITHMS, or all")
+    variable.add_argument("--params", type=int, nargs="+", required=True,
+                          help="Working Set window τ or PFF fault-gap threshold, in references")
+    add_output(variable)
+    variable.set_defaults(run=run_variable)
+
+    batch = commands.add_parser("batch", help="run a grid of jobs on a process pool")
+    batch.add_argument("kind", choices=["page", "disk"])
+    batch.add_argument("--inputs", nargs="+", required=True, help="text trace files")
+    batch.add_argument("--algorithm", nargs="+", default=["all"])
+    batch.add_argument("--frames", type=int, nargs="+", default=[3])
+    batch.add_argument("--head", type=int, nargs="+", default=[0])
+    batch.add_argument("--disk-size", type=int, nargs="+", default=[200])
+    batch.add_argument("--workers", type=int)
+    add_output(batch)
+    batch.set_defaults(run=run_batch_jobs)
+
+    plot = commands.add_parser("plot", help="plot fault curves with matplotlib")
+    add_input(plot, "page numbers")
+    plot.add_argument("--max-frames", type=int, required=True)
+    plot.add_argument("--algorithm", nargs="+", default=["Optimal"])
+    plot.add_argument("--output", help="save to this image file instead of showing a window")
+    plot.set_defaults(run=run_plot)
+
+    gui = commands.add_parser("gui", help="open the customtkinter GUI")
+    gui.set_defaults(run=run_gui)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        rows = args.run(args)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    if rows is not None:
+        write_rows(rows, args.format, sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
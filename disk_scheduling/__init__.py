@@ -0,0 +1,26 @@
+from disk_scheduling.c_scan import cscan_schedule
+from disk_scheduling.c_look import clook_schedule
+from disk_scheduling.fcfs import fcfs_schedule
+from disk_scheduling.sstf import sstf_schedule
+from disk_scheduling.scan import scan_schedule
+from disk_scheduling.look import look_schedule
+
+# Name → scheduler returning (seek_order, total_seek)
+DISK_ALGORITHMS = {
+    "C-SCAN": cscan_schedule,
+    "C-LOOK": clook_schedule,
+    "FCFS": fcfs_schedule,
+    "SSTF": sstf_schedule,
+    "SCAN": scan_schedule,
+    "LOOK": look_schedule,
+}
+
+# Schedulers that sweep to the disk end and so need its size
+NEEDS_DISK_SIZE = {"C-SCAN", "SCAN"}
+
+
+def run_disk_algorithm(name, requests, head, disk_size):
+    """Run any registered scheduler with one common signature."""
+    if name in NEEDS_DISK_SIZE:
+        return DISK_ALGORITHMS[name](requests, head, disk_size)
+    return DISK_ALGORITHMS[name](requests, head)
@@ -0,0 +1,109 @@
+import numpy as np
+
+BATCH_ALGORITHMS = ("C-SCAN", "C-LOOK")
+
+
+def batch_schedule(requests_list, heads, disk_sizes=None, algorithm="C-SCAN"):
+    """
+    Run C-SCAN or C-LOOK on many workloads at once with NumPy.
+
+    Parameters:
+        requests_list: sequence of request queues (lists or 1-D arrays)
+        heads: starting head position for each queue
+        disk_sizes: total cylinders for each queue (required for C-SCAN)
+        algorithm: "C-SCAN" or "C-LOOK"
+
+    All queues are concatenated and sorted together (by queue, then
+    cylinder), split at each head with one searchsorted call, laid out in
+    service order with index arithmetic, and the total seek comes from
+    np.diff over the laid-out orders.
+
+    Returns:
+        dict with
+            "seek_orders": list of int64 arrays, one per queue, identical to
+                the seek_order of cscan_schedule / clook_schedule
+            "total_seeks": int64 array of total head movement per queue
+    """
+    if algorithm not in BATCH_ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+
+    heads = np.asarray(heads, dtype=np.int64)
+    count = len(heads)
+    if len(requests_list) != count:
+        raise ValueError("requests_list and heads must have the same length.")
+    if algorithm == "C-SCAN" and disk_sizes is None:
+        raise ValueError("C-SCAN needs disk_sizes.")
+    if disk_sizes is not None:
+        disk_ends = np.asarray(disk_sizes, dtype=np.int64) - 1
+        if len(disk_ends) != count:
+            raise ValueError("disk_sizes and heads must have the same length.")
+    if count == 0:
+        return {"seek_orders": [], "total_seeks": np.zeros(0, dtype=np.int64)}
+
+    # The composite sort key below needs every cylinder to be non-negative
+    if heads.min() < 0 or (disk_sizes is not None and np.any(heads > disk_ends)):
+        raise ValueError("Head must be within disk size range.")
+
+    lengths = np.fromiter((len(r) for r in requests_list), dtype=np.int64, count=count)
+    starts = np.cumsum(lengths) - lengths
+    if lengths.sum():
+        flat = np.concatenate([np.asarray(r, dtype=np.int64) for r in requests_list])
+    else:
+        flat = np.zeros(0, dtype=np.int64)
+    if flat.min(initial=0) < 0:
+        raise ValueError("Requests must be non-negative cylinder numbers.")
+    queue_of = np.repeat(np.arange(count, dtype=np.int64), lengths)
+
+    # Sort every queue in place of the concatenation via a composite key
+    span = int(max(flat.max(initial=0), heads.max(initial=0))) + 1
+    keys = queue_of * span + flat
+    keys.sort()
+    values = keys - queue_of * span
+
+    # Requests below the head form the "left" part of each queue
+    splits = np.searchsorted(keys, np.arange(count, dtype=np.int64) * span + heads)
+    n_left = splits - starts
+    n_right = lengths - n_left
+
+    # Where the head is after serving the right part
+    has_right = n_right > 0
+    last_right = heads.copy()
+    last_right[has_right] = values[(starts + lengths - 1)[has_right]]
+
+    if algorithm == "C-SCAN":
+        has_left = n_left > 0
+        end_marker = has_left & (last_right != disk_ends)
+        zero_marker = has_left
+    else:
+        end_marker = zero_marker = np.zeros(count, dtype=bool)
+    extras = end_marker.astype(np.int64) + zero_marker
+
+    out_lengths = 1 + lengths + extras
+    out_starts = np.cumsum(out_lengths) - out_lengths
+    out = np.empty(int(out_lengths.sum()), dtype=np.int64)
+
+    out[out_starts] = heads
+
+    index = np.arange(len(values), dtype=np.int64)
+    is_left = index < splits[queue_of]
+    positions = np.where(
+        is_left,
+        out_starts[queue_of] + 1 + n_right[queue_of] + extras[queue_of] + (index - starts[queue_of]),
+        out_starts[queue_of] + 1 + (index - splits[queue_of]),
+    )
+    out[positions] = values
+
+    if algorithm == "C-SCAN":
+        marker_at = out_starts + 1 + n_right
+        out[marker_at[end_marker]] = disk_ends[end_marker]
+        out[(marker_at + end_marker)[zero_marker]] = 0
+
+    # Total seek = sum of |diff| inside each queue's order
+    moves = np.concatenate(([0], np.cumsum(np.abs(np.diff(out)))))
+    total_seeks = moves[out_starts + out_lengths - 1] - moves[out_starts]
+
+    seek_orders = np.split(out, (out_starts + out_lengths)[:-1])
+    return {
+        "seek_orders": seek_orders,
+        "total_seeks": total_seeks,
+    }
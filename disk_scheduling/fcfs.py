@@ -0,0 +1,23 @@
+def fcfs_schedule(requests, head):
+    """
+    Simulate FCFS (First Come, First Served) Disk Scheduling.
+
+    Parameters:
+        requests: List[int] - requested cylinders, in arrival order
+        head: int - starting position of the disk head
+
+    Returns:
+        seek_order: List[int] - order in which requests are served
+        total_seek: int - total head movement
+    """
+    seek_order = [head]
+    total_seek = 0
+    current = head
+
+    # Serve requests exactly in the order they arrived
+    for r in requests:
+        seek_order.append(r)
+        total_seek += abs(current - r)
+        current = r
+
+    return seek_order, total_seek
@@ -0,0 +1,33 @@
+def look_schedule(requests, head):
+    """
+    Simulate LOOK Disk Scheduling Algorithm.
+
+    Parameters:
+        requests: List[int] - requested cylinders
+        head: int - starting position of the disk head
+
+    Returns:
+        seek_order: List[int] - order in which requests are served
+        total_seek: int - total head movement
+    """
+    requests = sorted(requests)
+    left = [r for r in requests if r < head]
+    right = [r for r in requests if r >= head]
+
+    seek_order = [head]
+    total_seek = 0
+    current = head
+
+    # Serve right side (higher than head)
+    for r in right:
+        seek_order.append(r)
+        total_seek += abs(current - r)
+        current = r
+
+    # Reverse at the last request and serve the left side downward
+    for r in reversed(left):
+        seek_order.append(r)
+        total_seek += abs(current - r)
+        current = r
+
+    return seek_order, total_seek
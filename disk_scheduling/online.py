@@ -0,0 +1,144 @@
+import heapq
+from array import array
+
+ONLINE_ALGORITHMS = ("C-SCAN", "C-LOOK")
+
+
+def _percentiles(values, points=(50, 95, 99)):
+    """Nearest-rank percentiles of a sequence of numbers."""
+    ordered = sorted(values)
+    if not ordered:
+        return {f"p{p}": 0.0 for p in points}
+    result = {}
+    for p in points:
+        rank = max(1, -(-p * len(ordered) // 100))   # ceil(p/100 * n)
+        result[f"p{p}"] = ordered[rank - 1]
+    return result
+
+
+def online_schedule(arrivals, disk_size, head=0, algorithm="C-SCAN", seek_time=1.0, service_time=0.0):
+    """
+    Event-driven C-SCAN / C-LOOK with requests arriving over time.
+
+    Parameters:
+        arrivals: iterable of (arrival_time, cylinder), sorted by time
+        disk_size: total cylinders
+        head: starting head position
+        algorithm: "C-SCAN" or "C-LOOK"
+        seek_time: time to move the head by one cylinder
+        service_time: time to serve a request once the head is on it
+
+    Pending requests are split into two min-heaps of (cylinder, request
+    id): those at or above the head, still ahead in this sweep, and those
+    behind it. An arrival goes into one of them and the next request is the
+    top of the "ahead" heap, so both cost O(log n) however many requests
+    are queued; at the end of a sweep the heaps swap roles.
+
+    The head always sweeps upward; a request that arrives ahead of the head
+    while it is moving is picked up on the way (the head position is rounded
+    down to a whole cylinder at that moment). The return jump (to 0 for
+    C-SCAN, to the lowest pending request for C-LOOK) is not interrupted.
+    With every arrival at time 0 and no service time, seek_order and
+    total_seek match cscan_schedule / clook_schedule.
+
+    Returns:
+        dict with "seek_order", "total_seek", "finish_time", per-request
+        "wait_times" (arrival → head on the cylinder) and "response_times"
+        (arrival → service done) in arrival order, and their p50/p95/p99 in
+        "wait_percentiles" / "response_percentiles"
+    """
+    if algorithm not in ONLINE_ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    if head < 0 or head >= disk_size:
+        raise ValueError("Head must be within disk size range.")
+
+    disk_end = disk_size - 1
+    ahead = []                   # (cylinder, request id) heap, cylinder >= position
+    behind = []                  # (cylinder, request id) heap, cylinder < position
+    arrival_times = array("d")
+    wait_times = array("d")
+    response_times = array("d")
+    seek_order = array("q", [head])
+    total_seek = 0
+    now = 0.0
+    position = head
+
+    stream = iter(arrivals)
+    upcoming = next(stream, None)
+
+    def admit():
+        nonlocal upcoming
+        while upcoming is not None and upcoming[0] <= now:
+            arrival_time, cylinder = upcoming
+            if cylinder < 0 or cylinder >= disk_size:
+                raise ValueError(f"Requests must be in range 0 to {disk_end}.")
+            request_id = len(arrival_times)
+            arrival_times.append(arrival_time)
+            wait_times.append(0.0)
+            response_times.append(0.0)
+            heapq.heappush(ahead if cylinder >= position else behind, (cylinder, request_id))
+            upcoming = next(stream, None)
+            if upcoming is not None and upcoming[0] < arrival_time:
+                raise ValueError("Arrivals must be sorted by time.")
+
+    while True:
+        admit()
+        if not ahead and not behind:
+            if upcoming is None:
+                break
+            # Idle until the next request shows up
+            now = max(now, upcoming[0])
+            continue
+
+        if ahead:
+            target = ahead[0][0]
+        elif algorithm == "C-SCAN":
+            target = disk_end
+        else:
+            # C-LOOK: jump straight to the lowest pending request
+            target = behind[0][0]
+            total_seek += abs(position - target)
+            now += abs(position - target) * seek_time
+            position = target
+            ahead, behind = behind, ahead
+            continue
+
+        travel = (target - position) * seek_time
+        if upcoming is not None and upcoming[0] < now + travel:
+            # Something arrives on the way: move partway and decide again
+            moved = int((upcoming[0] - now) / seek_time)
+            position += moved
+            total_seek += moved
+            now = upcoming[0]
+            continue
+
+        total_seek += target - position
+        now += travel
+        position = target
+
+        if not ahead:
+            # C-SCAN reached the end: jump back to cylinder 0
+            if seek_order[-1] != disk_end:
+                seek_order.append(disk_end)
+            seek_order.append(0)
+            total_seek += disk_end
+            now += disk_end * seek_time
+            position = 0
+            ahead, behind = behind, ahead
+            continue
+
+        _, request_id = heapq.heappop(ahead)
+        seek_order.append(target)
+        wait_times[request_id] = now - arrival_times[request_id]
+        now += service_time
+        response_times[request_id] = now - arrival_times[request_id]
+
+    return {
+        "seek_order": seek_order,
+        "total_seek": total_seek,
+        "finish_time": now,
+        "wait_times": wait_times,
+        "response_times": response_times,
+        "wait_percentiles": _percentiles(wait_times),
+        "response_percentiles": _percentiles(response_times),
+    }
@@ -0,0 +1,40 @@
+def scan_schedule(requests, head, disk_size):
+    """
+    Simulate SCAN (elevator) Disk Scheduling.
+    - requests: list of integers (requested cylinders)
+    - head: current head position (int)
+    - disk_size: total cylinders (int)
+    - Moves toward the end (disk_size - 1), then reverses
+
+    Returns:
+        - seek_order: list of cylinders in service order
+        - total_seek: total distance moved by the head
+    """
+    requests = sorted(requests)
+    left = [r for r in requests if r < head]
+    right = [r for r in requests if r >= head]
+
+    seek_order = [head]
+    total_seek = 0
+    current = head
+
+    # Move toward the end
+    for r in right:
+        seek_order.append(r)
+        total_seek += abs(current - r)
+        current = r
+
+    if left:
+        # Reach the end of the disk before reversing
+        if current != disk_size - 1:
+            seek_order.append(disk_size - 1)
+            total_seek += abs(current - (disk_size - 1))
+            current = disk_size - 1
+
+    # Sweep back down through the left requests
+    for r in reversed(left):
+        seek_order.append(r)
+        total_seek += abs(current - r)
+        current = r
+
+    return seek_order, total_seek
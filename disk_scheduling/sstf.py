@@ -0,0 +1,41 @@
+from bisect import bisect_left
+
+
+def sstf_schedule(requests, head):
+    """
+    Simulate SSTF (Shortest Seek Time First) Disk Scheduling.
+
+    Parameters:
+        requests: List[int] - requested cylinders
+        head: int - starting position of the disk head
+
+    The served requests always form one contiguous block of the sorted
+    queue (the closest pending request is a neighbour of that block), so
+    after sorting, each pick only compares the two neighbours:
+    O(n log n) overall instead of rescanning the queue. Ties go to the
+    lower cylinder.
+
+    Returns:
+        seek_order: List[int] - order in which requests are served
+        total_seek: int - total head movement
+    """
+    requests = sorted(requests)
+    lo = bisect_left(requests, head) - 1    # nearest pending below
+    hi = lo + 1                             # nearest pending at or above
+
+    seek_order = [head]
+    total_seek = 0
+    current = head
+
+    while lo >= 0 or hi < len(requests):
+        if hi >= len(requests) or (lo >= 0 and current - requests[lo] <= requests[hi] - current):
+            r = requests[lo]
+            lo -= 1
+        else:
+            r = requests[hi]
+            hi += 1
+        seek_order.append(r)
+        total_seek += abs(current - r)
+        current = r
+
+    return seek_order, total_seek
@@ -1,9 +1,14 @@
 def open_disk_gui(parent, disk_results):
     import customtkinter as ctk
-    import threading
-    import time
     from disk_scheduling.c_scan import cscan_schedule
     from disk_scheduling.c_look import clook_schedule
+    from disk_scheduling.fcfs import fcfs_schedule
+    from disk_scheduling.sstf import sstf_schedule
+    from disk_scheduling.scan import scan_schedule
+    from disk_scheduling.look import look_schedule
+    from utils.result_cache import cache_key, default_cache
+    from utils.background import BackgroundTask
+    from gui.widgets import paged_table
 
     # Global state for window
     seek_data = []
@@ -12,6 +17,9 @@ def open_disk_gui(parent, disk_results):
     is_playing = False
     disk_max = 200
     points_xy = []
+    segments = []          # [item, coords, first step] per drawn polyline
+    play_job = None
+    task = None            # BackgroundTask of the schedule in progress
 
     # Setup window
     app = ctk.CTkToplevel(parent)
@@ -23,7 +31,7 @@ def open_disk_gui(parent, disk_results):
     scrollable_frame = ctk.CTkScrollableFrame(app, width=850, height=750)
     scrollable_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
-    ctk.CTkLabel(scrollable_frame, text="C-SCAN Disk Scheduling", font=ctk.CTkFont(size=20, weight="bold")).pack(pady=10)
+    ctk.CTkLabel(scrollable_frame, text="Disk Scheduling", font=ctk.CTkFont(size=20, weight="bold")).pack(pady=10)
 
     entry_disk = ctk.CTkEntry(scrollable_frame, placeholder_text="Total Cylinders (e.g. 200)", width=400)
     entry_disk.pack(pady=5)
@@ -36,7 +44,7 @@ def open_disk_gui(parent, disk_results):
 
     algo_choice = ctk.StringVar(value="C-SCAN")
     ctk.CTkLabel(scrollable_frame, text="Choose Algorithm").pack(pady=3)
-    ctk.CTkOptionMenu(scrollable_frame, variable=algo_choice, values=["C-SCAN", "C-LOOK"]).pack()
+    ctk.CTkOptionMenu(scrollable_frame, variable=algo_choice, values=["C-SCAN", "C-LOOK", "FCFS", "SSTF", "SCAN", "LOOK"]).pack()
 
     output_box = ctk.CTkTextbox(scrollable_frame, height=150, width=800)
     output_box.pack(pady=10)
@@ -51,6 +59,9 @@ def open_disk_gui(parent, disk_results):
         for item in canvas_labels:
             canvas.delete(item)
         canvas_labels.clear()
+        for item, _coords, _first in segments:
+            canvas.delete(item)
+        segments.clear()
 
     def get_scaled_x(value):
         margin = 50
@@ -63,45 +74,80 @@ def open_disk_gui(parent, disk_results):
         points_xy.clear()
         radius = 6
         margin_y = 40
-        height_spacing = 40
+        plot_height = int(canvas.cget("height")) - 2 * margin_y
+        # Auto-scale the y axis so every request fits on the canvas
+        height_spacing = min(40, plot_height / max(len(seek_data) - 1, 1))
 
         for i, cylinder in enumerate(seek_data):
-            x = get_scaled_x(cylinder)
-            y = margin_y + i * height_spacing
-            circle = canvas.create_oval(x - radius, y - radius, x + radius, y + radius, fill="red")
-            label = canvas.create_text(x, y - 15, text=str(cylinder), fill="white", font=("Arial", 9))
-            canvas_labels.extend([circle, label])
-            points_xy.append((x, y))
+            points_xy.append((get_scaled_x(cylinder), margin_y + i * height_spacing))
+
+        if height_spacing >= 1:
+            if height_spacing < 20:
+                radius = max(1, int(height_spacing / 3))
+            for i, (x, y) in enumerate(points_xy):
+                circle = canvas.create_oval(x - radius, y - radius, x + radius, y + radius, fill="red")
+                canvas_labels.append(circle)
+                if height_spacing >= 20:
+                    label = canvas.create_text(x, y - 15, text=str(seek_data[i]), fill="white", font=("Arial", 9))
+                    canvas_labels.append(label)
+            return
+
+        # More requests than pixel rows: one min–max mark per pixel row
+        rows = {}
+        for x, y in points_xy:
+            row = int(y)
+            low, high = rows.get(row, (x, x))
+            rows[row] = (min(low, x), max(high, x))
+        for row, (low, high) in rows.items():
+            mark = canvas.create_line(low - 1, row, high + 1, row, fill="red")
+            canvas_labels.append(mark)
 
     def draw_seek_step():
         nonlocal seek_index
         if seek_index >= len(points_xy) - 1:
             return
-        x1, y1 = points_xy[seek_index]
         x2, y2 = points_xy[seek_index + 1]
-        line = canvas.create_line(x1, y1, x2, y2, fill="deepskyblue", width=2)
-        canvas_labels.append(line)
+        # Extend the last polyline while it stays within a couple of pixel
+        # rows, so long paths need only a few hundred canvas items
+        if segments and points_xy[segments[-1][2]][1] + 2 > y2:
+            item, coords, _first = segments[-1]
+            coords.extend((x2, y2))
+            canvas.coords(item, *coords)
+        else:
+            x1, y1 = points_xy[seek_index]
+            coords = [x1, y1, x2, y2]
+            item = canvas.create_line(*coords, fill="deepskyblue", width=2)
+            segments.append([item, coords, seek_index])
         seek_index += 1
 
     def previous_step():
         nonlocal seek_index
         if seek_index > 0:
+            # Only take the last point off the last polyline
+            item, coords, _first = segments[-1]
+            del coords[-2:]
+            if len(coords) < 4:
+                canvas.delete(item)
+                segments.pop()
+            else:
+                canvas.coords(item, *coords)
             seek_index -= 1
-            draw_points_only()
-            for i in range(seek_index):
-                x1, y1 = points_xy[i]
-                x2, y2 = points_xy[i + 1]
-                line = canvas.create_line(x1, y1, x2, y2, fill="deepskyblue", width=2)
-                canvas_labels.append(line)
+
+    def stop_playback():
+        nonlocal is_playing, play_job
+        is_playing = False
+        if play_job is not None:
+            app.after_cancel(play_job)
+            play_job = None
+        play_btn.configure(text="Play")
 
     def full_reset():
-        nonlocal seek_data, seek_index, is_playing, points_xy
+        nonlocal seek_data, seek_index, points_xy
+        stop_playback()
+        reset_canvas()
         seek_data = []
         seek_index = 0
         points_xy = []
-        is_playing = False
-        play_btn.configure(text="Play")
-        reset_canvas()
         entry_disk.delete(0, "end")
         entry_requests.delete(0, "end")
         entry_head.delete(0, "end")
@@ -111,28 +157,38 @@ def open_disk_gui(parent, disk_results):
         nonlocal is_playing
         if not seek_data:
             return
+        if is_playing:
+            stop_playback()
+            return
 
-        is_playing = not is_playing
-        play_btn.configure(text="Pause" if is_playing else "Play")
-
-        def loop():
-            nonlocal seek_index, is_playing
-            while is_playing and seek_index < len(points_xy) - 1:
+        is_playing = True
+        play_btn.configure(text="Pause")
+        # Long paths advance several steps per frame so playback finishes
+        steps_per_tick = max(1, len(points_xy) // 500)
+        delay = 500 if steps_per_tick == 1 else 20
+
+        def tick():
+            # Runs on the Tk thread via after(), never from a worker thread
+            nonlocal play_job
+            play_job = None
+            for _ in range(steps_per_tick):
                 draw_seek_step()
-                time.sleep(0.5)
-            if seek_index >= len(points_xy) - 1:
-                is_playing = False
-                play_btn.configure(text="Play")
+            if is_playing and seek_index < len(points_xy) - 1:
+                play_job = app.after(delay, tick)
+            else:
+                stop_playback()
 
-        threading.Thread(target=loop, daemon=True).start()
+        tick()
 
     def run_algorithm():
-        nonlocal seek_data, seek_index, is_playing, disk_max
+        nonlocal seek_index, disk_max, task
+        if task is not None and task.running:
+            output_box.insert("end", "⚠️ A schedule is already running. Cancel it first.\n")
+            return
         output_box.delete("0.0", "end")
+        stop_playback()
         reset_canvas()
         seek_index = 0
-        is_playing = False
-        play_btn.configure(text="Play")
 
         try:
             disk_max = int(entry_disk.get().strip())
@@ -152,29 +208,85 @@ def open_disk_gui(parent, disk_results):
                 return
 
             algo = algo_choice.get()
+            size = disk_max
             if algo == "C-SCAN":
-                seek_data, total_seek = cscan_schedule(requests, head, disk_max)
+                schedule = lambda: cscan_schedule(requests, head, size)
             elif algo == "C-LOOK":
-                seek_data, total_seek = clook_schedule(requests, head)
+                schedule = lambda: clook_schedule(requests, head)
+            elif algo == "FCFS":
+                schedule = lambda: fcfs_schedule(requests, head)
+            elif algo == "SSTF":
+                schedule = lambda: sstf_schedule(requests, head)
+            elif algo == "SCAN":
+                schedule = lambda: scan_schedule(requests, head, size)
+            elif algo == "LOOK":
+                schedule = lambda: look_schedule(requests, head)
             else:
                 output_box.insert("end", "❌ Algorithm not implemented.\n")
                 return
 
-            draw_points_only()
-            output_box.insert("end", f"✅ {algo} completed.\n")
-            output_box.insert("end", f"🔢 Request Order: {seek_data}\n")
-            output_box.insert("end", f"📏 Total Seek Distance: {total_seek}\n")
-
-            disk_results.append({
-                "algorithm": algo,
-                "seek_distance": total_seek,
-                "request_count": len(requests)
-            })
-
         except ValueError:
             output_box.insert("end", "❌ Invalid input. Use numeric values.\n")
-        except Exception as e:
-            output_box.insert("end", f"❌ Error: {str(e)}\n")
+            return
+
+        # Identical (algorithm, queue, head, disk size) runs come from the cache
+        key = cache_key(algo, {"head": head, "disk_size": size}, requests)
+        cached = default_cache().get(key)
+        if cached is not None:
+            finish_run(algo, head, size, requests, cached)
+            return
+
+        def done(outcome):
+            default_cache().put(key, outcome)
+            finish_run(algo, head, size, requests, outcome)
+
+        def cancelled():
+            end_progress()
+            output_box.insert("end", f"⚠️ {algo} cancelled.\n")
+
+        def failed(error):
+            end_progress()
+            output_box.insert("end", f"❌ Error: {str(error)}\n")
+
+        # The schedulers are single sorts/scans with no natural chunks, so the
+        # bar just shows activity; a cancelled run's result is dropped
+        progress.configure(mode="indeterminate")
+        progress.start()
+        cancel_btn.configure(state="normal")
+        task = BackgroundTask(
+            app, lambda report, is_cancelled: schedule(), done,
+            on_cancel=cancelled, on_error=failed,
+        ).start()
+
+    def end_progress():
+        progress.stop()
+        progress.configure(mode="determinate")
+        progress.set(0)
+        cancel_btn.configure(state="disabled")
+
+    def cancel_run():
+        if task is not None:
+            task.cancel()
+
+    def finish_run(algo, head, size, requests, outcome):
+        nonlocal seek_data
+        end_progress()
+        progress.set(1)
+        seek_data, total_seek = outcome
+
+        draw_points_only()
+        output_box.insert("end", f"✅ {algo} completed.\n")
+        order_text = seek_data if len(seek_data) <= 200 else f"{seek_data[:200]} ... ({len(seek_data)} stops)"
+        output_box.insert("end", f"🔢 Request Order: {order_text}\n")
+        output_box.insert("end", f"📏 Total Seek Distance: {total_seek}\n")
+
+        disk_results.append({
+            "algorithm": algo,
+            "head": head,
+            "disk_size": size,
+            "seek_distance": total_seek,
+            "request_count": len(requests)
+        })
 
     def show_summary():
         if not disk_results:
@@ -183,19 +295,26 @@ def open_disk_gui(parent, disk_results):
 
         summary_win = ctk.CTkToplevel(app)
         summary_win.title("Disk Scheduling Summary")
-        headers = ["Algorithm", "Seek Distance", "# of Requests"]
-        for i, h in enumerate(headers):
-            ctk.CTkLabel(summary_win, text=h, font=("Arial", 14, "bold")).grid(row=0, column=i)
-        for idx, res in enumerate(disk_results, start=1):
-            ctk.CTkLabel(summary_win, text=res["algorithm"]).grid(row=idx, column=0)
-            ctk.CTkLabel(summary_win, text=res["seek_distance"]).grid(row=idx, column=1)
-            ctk.CTkLabel(summary_win, text=res["request_count"]).grid(row=idx, column=2)
+        # disk_results is a ResultTable: only the page on screen is read
+        headers = ["Algorithm", "Seek Distance", "# of Requests", "Head / Size"]
+        paged_table(
+            summary_win, headers, lambda: len(disk_results),
+            lambda offset, limit: [(r["algorithm"], r["seek_distance"], r["request_count"],
+                                    f"{r['head']} / {r['disk_size']}" if r["head"] is not None else None)
+                                   for r in disk_results.page(offset, limit)],
+        ).pack(padx=10, pady=10)
 
     # Buttons
     button_frame = ctk.CTkFrame(scrollable_frame)
     button_frame.pack(pady=5)
     ctk.CTkButton(button_frame, text="Run Algorithm", command=run_algorithm).pack(side="left", padx=10)
     ctk.CTkButton(button_frame, text="Show Summary", command=show_summary).pack(side="left", padx=10)
+    cancel_btn = ctk.CTkButton(button_frame, text="Cancel", command=cancel_run, state="disabled")
+    cancel_btn.pack(side="left", padx=10)
+
+    progress = ctk.CTkProgressBar(scrollable_frame, width=400)
+    progress.set(0)
+    progress.pack(pady=5)
 
     nav_frame = ctk.CTkFrame(scrollable_frame)
     nav_frame.pack(pady=5)
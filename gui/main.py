@@ -1,48 +1,183 @@
+import os
 import customtkinter as ctk
 from page_gui import open_page_gui
 from disk_gui import open_disk_gui
-
-# Shared results across modules
-vm_results = []
-disk_results = []
+from page_replacement import PAGE_ALGORITHMS
+from disk_scheduling import DISK_ALGORITHMS
+from utils.batch_runner import BatchRunner, page_jobs, disk_jobs
+from utils.background import BackgroundTask
+from utils.results_store import open_store
+from gui.widgets import paged_table, summary_rows
 
 
 def show_master_dashboard():
     win = ctk.CTkToplevel(app)
     win.title("Master Comparative Dashboard")
+    body = ctk.CTkScrollableFrame(win, width=900, height=700)
+    body.pack(fill="both", expand=True)
+
+    def section(title):
+        ctk.CTkLabel(body, text=title, font=("Arial", 16, "bold")).pack(pady=(15, 5))
 
     # --- Virtual Memory Summary ---
-    ctk.CTkLabel(win, text="Virtual Memory", font=("Arial", 16, "bold")).grid(row=0, column=0, columnspan=3, pady=10)
-    headers_vm = ["Algorithm", "Page Faults", "Hits"]
-    for i, h in enumerate(headers_vm):
-        ctk.CTkLabel(win, text=h).grid(row=1, column=i)
+    section("Virtual Memory")
+    paged_table(
+        body, ["Algorithm", "Page Faults", "Hits", "Trace", "Frames"], lambda: len(vm_results),
+        lambda offset, limit: [(r["algorithm"], r["faults"], r["hits"], r["trace"], r["frames"])
+                               for r in vm_results.page(offset, limit)],
+    ).pack()
+    section("Page Faults per Algorithm")
+    vm_summary = summary_rows(results_store.vm_summary())
+    paged_table(
+        body, ["Algorithm", "Runs", "Mean", "Min", "Max"], lambda: len(vm_summary),
+        lambda offset, limit: vm_summary[offset:offset + limit], page_size=8,
+    ).pack()
+    section("Best Algorithm per Trace")
+    paged_table(
+        body, ["Trace", "Frames", "Algorithm", "Mean Faults"], results_store.count_vm_traces,
+        lambda offset, limit: [(r["trace"], r["frames"], r["algorithm"], f"{r['mean']:.1f}")
+                               for r in results_store.best_vm_per_trace(offset, limit)],
+        page_size=10,
+    ).pack()
+
+    section("Disk Scheduling")
+    paged_table(
+        body, ["Algorithm", "Seek Distance", "# of Requests", "Trace", "Head / Size"], lambda: len(disk_results),
+        lambda offset, limit: [(r["algorithm"], r["seek_distance"], r["request_count"], r["trace"],
+                                f"{r['head']} / {r['disk_size']}" if r["head"] is not None else None)
+                               for r in disk_results.page(offset, limit)],
+    ).pack()
+    section("Seek Distance per Algorithm")
+    disk_summary = summary_rows(results_store.disk_summary())
+    paged_table(
+        body, ["Algorithm", "Runs", "Mean", "Min", "Max"], lambda: len(disk_summary),
+        lambda offset, limit: disk_summary[offset:offset + limit], page_size=8,
+    ).pack()
+    section("Best Algorithm per Queue")
+    paged_table(
+        body, ["Trace", "Head / Size", "Algorithm", "Mean Seek"], results_store.count_disk_traces,
+        lambda offset, limit: [(r["trace"], f"{r['head']} / {r['disk_size']}", r["algorithm"], f"{r['mean']:.1f}")
+                               for r in results_store.best_disk_per_trace(offset, limit)],
+        page_size=10,
+    ).pack()
+
+
+def _parse_inputs(text, prefix):
+    # ';' separates inputs; each is either a file path or space-separated numbers
+    inputs = {}
+    for i, part in enumerate(p.strip() for p in text.split(";")):
+        if not part:
+            continue
+        if os.path.exists(part):
+            inputs[os.path.basename(part)] = part
+        else:
+            inputs[f"{prefix}{i + 1}"] = list(map(int, part.split()))
+    return inputs
+
+
+def open_batch_window():
+    win = ctk.CTkToplevel(app)
+    win.title("Batch Comparison")
+    runner = None
+    task = None             # BackgroundTask driving runner
+
+    def add_entry(label, placeholder):
+        ctk.CTkLabel(win, text=label).pack(pady=(8, 2))
+        entry = ctk.CTkEntry(win, width=500, placeholder_text=placeholder)
+        entry.pack()
+        return entry
 
-    for idx, res in enumerate(vm_results, start=2):
-        ctk.CTkLabel(win, text=res["algorithm"]).grid(row=idx, column=0)
-        ctk.CTkLabel(win, text=str(res["faults"])).grid(row=idx, column=1)
-        ctk.CTkLabel(win, text=str(res["hits"])).grid(row=idx, column=2)
+    entry_traces = add_entry("Reference strings or trace files (';' separated)", "7 0 1 2 0 3; traces/big.txt")
+    entry_frames = add_entry("Frame counts", "3 4 5")
+    entry_queues = add_entry("Disk request queues or files (';' separated)", "98 183 37 122 14")
+    entry_heads = add_entry("Head positions", "53")
+    entry_sizes = add_entry("Disk sizes", "200")
 
-    row_offset = len(vm_results) + 3
-    ctk.CTkLabel(win, text="Disk Scheduling", font=("Arial", 16, "bold")).grid(row=row_offset, column=0, columnspan=3, pady=10)
-    headers_disk = ["Algorithm", "Seek Distance", "# of Requests"]
-    for i, h in enumerate(headers_disk):
-        ctk.CTkLabel(win, text=h).grid(row=row_offset + 1, column=i)
+    progress = ctk.CTkProgressBar(win, width=500)
+    progress.set(0)
+    progress.pack(pady=10)
+    status_var = ctk.StringVar(value="Idle")
+    ctk.CTkLabel(win, textvariable=status_var).pack()
 
-    for idx, res in enumerate(disk_results, start=row_offset + 2):
-        ctk.CTkLabel(win, text=res["algorithm"]).grid(row=idx, column=0)
-        ctk.CTkLabel(win, text=str(res["seek_distance"])).grid(row=idx, column=1)
-        ctk.CTkLabel(win, text=str(res["request_count"])).grid(row=idx, column=2)
+    def run_batch():
+        nonlocal runner, task
+        if task is not None and task.running:
+            return
+        try:
+            jobs = []
+            traces = _parse_inputs(entry_traces.get(), "T")
+            if traces:
+                frames = [int(f) for f in entry_frames.get().split()]
+                jobs += page_jobs(traces, list(PAGE_ALGORITHMS), frames)
+            queues = _parse_inputs(entry_queues.get(), "Q")
+            if queues:
+                heads = [int(h) for h in entry_heads.get().split()]
+                sizes = [int(d) for d in entry_sizes.get().split()]
+                jobs += disk_jobs(queues, list(DISK_ALGORITHMS), heads, sizes)
+        except ValueError:
+            status_var.set("❌ Invalid input. Use numeric values or existing file paths.")
+            return
+        if not jobs:
+            status_var.set("⚠️ Nothing to run.")
+            return
+
+        runner = BatchRunner(jobs)
+        progress.set(0)
+        status_var.set(f"Running {len(jobs)} jobs...")
+        run_btn.configure(state="disabled")
+
+        def work(report, is_cancelled):
+            # Runs on the worker thread; cancel_batch stops the runner itself,
+            # so the rows finished before the cancel still come back
+            return runner.run(on_progress=lambda done, total, _row: report(done, total))
+
+        def show_progress(done, total):
+            progress.set(done / total)
+            status_var.set(f"{done}/{total} jobs done")
+
+        def done(rows):
+            run_btn.configure(state="normal")
+            vm_results.extend(r for r in rows if "faults" in r)
+            disk_results.extend(r for r in rows if "seek_distance" in r)
+            status_var.set(("Cancelled" if runner.cancelled else "Finished") + f" ({len(rows)} results)")
+            show_master_dashboard()
+
+        def failed(error):
+            run_btn.configure(state="normal")
+            status_var.set(f"❌ Batch failed: {error}")
+
+        task = BackgroundTask(win, work, done, on_progress=show_progress, on_error=failed, poll_ms=100).start()
+
+    def cancel_batch():
+        if task is not None and task.running:
+            runner.cancel()
+            status_var.set("Cancelling...")
+
+    button_frame = ctk.CTkFrame(win)
+    button_frame.pack(pady=10)
+    run_btn = ctk.CTkButton(button_frame, text="Run Batch", command=run_batch)
+    run_btn.pack(side="left", padx=10)
+    ctk.CTkButton(button_frame, text="Cancel", command=cancel_batch).pack(side="left", padx=10)
 
 
 # ---------------- MAIN HOME WINDOW ----------------
-ctk.set_appearance_mode("dark")
-app = ctk.CTk()
-app.title("OS Simulator Home")
-app.geometry("400x300")
+# Guarded so batch worker processes started with spawn (the macOS and
+# Windows default) can re-import this module without opening a window
+if __name__ == "__main__":
+    # Shared results across modules, kept in SQLite so history survives restarts
+    results_store = open_store()
+    vm_results = results_store.vm
+    disk_results = results_store.disk
+
+    ctk.set_appearance_mode("dark")
+    app = ctk.CTk()
+    app.title("OS Simulator Home")
+    app.geometry("400x350")
 
-ctk.CTkLabel(app, text="\U0001F9E0 OS Simulator", font=("Arial", 20, "bold")).pack(pady=20)
-ctk.CTkButton(app, text="Run Page Replacement", command=lambda: open_page_gui(app, vm_results)).pack(pady=10)
-ctk.CTkButton(app, text="Run Disk Scheduling", command=lambda: open_disk_gui(app, disk_results)).pack(pady=10)
-ctk.CTkButton(app, text="Show Master Dashboard", command=show_master_dashboard).pack(pady=10)
+    ctk.CTkLabel(app, text="\U0001F9E0 OS Simulator", font=("Arial", 20, "bold")).pack(pady=20)
+    ctk.CTkButton(app, text="Run Page Replacement", command=lambda: open_page_gui(app, vm_results)).pack(pady=10)
+    ctk.CTkButton(app, text="Run Disk Scheduling", command=lambda: open_disk_gui(app, disk_results)).pack(pady=10)
+    ctk.CTkButton(app, text="Run Batch Comparison", command=open_batch_window).pack(pady=10)
+    ctk.CTkButton(app, text="Show Master Dashboard", command=show_master_dashboard).pack(pady=10)
 
-app.mainloop()
\ No newline at end of file
+    app.mainloop()
@@ -1,7 +1,18 @@
 import customtkinter as ctk
+from collections import OrderedDict
 from page_replacement.optimal import optimal_page_replacement
 from page_replacement.second_chance import second_chance_page_replacement
+from page_replacement.lru import lru_page_replacement
+from page_replacement.lfu import lfu_page_replacement
+from page_replacement.clock import clock_page_replacement
+from page_replacement.arc import arc_page_replacement
+from page_replacement.aging import aging_page_replacement
+from page_replacement.windowed_optimal import windowed_optimal_page_replacement
+from page_replacement.replay import Replay, REPLAY_ALGORITHMS
 from utils.validator import validate_reference_string, validate_frame_count
+from utils.result_cache import cache_key, default_cache
+from utils.background import BackgroundTask, ProgressObserver, progress_pages
+from gui.widgets import paged_table
 
 def open_page_gui(parent, vm_results):
     # Create new window instead of root
@@ -11,12 +22,23 @@ def open_page_gui(parent, vm_results):
 
     # Global references for simulation
     simulation_data = None
+    last_run = None         # (algo, frames, pages) of simulation_data
+    replay = None           # incremental re-simulation of last_run, built on demand
+    task = None             # BackgroundTask of the simulation in progress
     current_step = 0
-    grid_labels = []
     is_playing = False
 
+    # Canvas grid: only the columns/rows inside the viewport are drawn
+    CELL = 38
+    grid_rows = 0
+    drawn_columns = set()
+    drawn_rows = (0, 0)
+
     def run_algorithm():
-        nonlocal simulation_data, current_step, is_playing
+        nonlocal replay, task
+        if task is not None and task.running:
+            output_box.insert("end", "⚠️ A simulation is already running. Cancel it first.\n")
+            return
         output_box.delete("0.0", "end")
         reset_grid()
 
@@ -38,47 +60,113 @@ def open_page_gui(parent, vm_results):
         algo = algo_option.get()
 
         if algo == "Optimal":
-            simulation_data = optimal_page_replacement(pages, frames)
+            simulate = optimal_page_replacement
         elif algo == "Second Chance":
-            simulation_data = second_chance_page_replacement(pages, frames)
-            compute_aging_registers()
+            simulate = second_chance_page_replacement
+        elif algo == "LRU":
+            simulate = lru_page_replacement
+        elif algo == "LFU":
+            simulate = lfu_page_replacement
+        elif algo == "Clock":
+            simulate = clock_page_replacement
+        elif algo == "ARC":
+            simulate = arc_page_replacement
+        elif algo == "Aging":
+            simulate = aging_page_replacement
+        elif algo == "Windowed Optimal":
+            simulate = windowed_optimal_page_replacement
         else:
             output_box.insert("end", "❌ Algorithm not implemented.\n")
             return
 
+        incremental = (algo in REPLAY_ALGORITHMS and last_run is not None and last_run[:2] == (algo, frames)
+                       and len(last_run[2]) == len(pages) and last_run[2] != pages)
+        key = None if incremental else cache_key(algo, {"frames": frames, "compact_trace": True}, pages)
+        cached = None if incremental else default_cache().get(key)
+        if cached is not None:
+            # Identical (algorithm, pages, frames) runs come straight from the cache
+            replay = None
+            finish_run(algo, frames, pages, cached)
+            return
+
+        # Everything the worker needs is bound here, on the Tk thread
+        replay_session = replay
+        base_pages = last_run[2] if incremental else None
+        previous_steps = simulation_data["steps"] if incremental else None
+
+        def work(report, is_cancelled):
+            # Runs on the worker thread: no widget access in here
+            if incremental:
+                # Same run with some references edited: resume from before the first edit
+                session = replay_session or Replay(base_pages, frames, algo, trace=previous_steps)
+                session.update(pages)
+                return session, session.result()
+            if algo == "Optimal":
+                observer = ProgressObserver(len(pages), report, is_cancelled)
+                return None, simulate(pages, frames, verbose=False, compact_trace=True, observer=observer)
+            feed = progress_pages(pages, report, is_cancelled)
+            return None, simulate(feed, frames, verbose=False, compact_trace=True)
+
+        def done(outcome):
+            nonlocal replay
+            session, result = outcome
+            replay = session
+            if session is None:
+                default_cache().put(key, result)
+            finish_run(algo, frames, pages, result)
+
+        def cancelled():
+            nonlocal replay, last_run
+            # An interrupted incremental update leaves the session half-edited
+            replay = None
+            last_run = None
+            end_progress()
+            output_box.insert("end", f"⚠️ {algo} cancelled.\n")
+
+        def failed(error):
+            end_progress()
+            output_box.insert("end", f"❌ Error: {error}\n")
+
+        progress.set(0)
+        cancel_btn.configure(state="normal")
+        task = BackgroundTask(
+            app, work, done,
+            on_progress=lambda done_count, total: progress.set(done_count / total),
+            on_cancel=cancelled, on_error=failed,
+        ).start()
+
+    def end_progress():
+        cancel_btn.configure(state="disabled")
+
+    def cancel_run():
+        if task is not None:
+            task.cancel()
+
+    def finish_run(algo, frames, pages, result):
+        nonlocal simulation_data, current_step, grid_rows, last_run
+        end_progress()
+        progress.set(1)
+        simulation_data = result
+        last_run = (algo, frames, pages)
+
         # Save results
         faults = simulation_data["page_faults"]
         hits = simulation_data["hits"]
 
         vm_results.append({
             "algorithm": algo,
+            "frames": frames,
             "faults": faults,
             "hits": hits
         })
 
         current_step = 0
+        grid_rows = len(simulation_data["steps"][-1]["frame"]) if simulation_data["steps"] else 0
+        grid_canvas.configure(height=min(max(grid_rows, 1) * CELL, 300))
+        row_header.configure(height=min(max(grid_rows, 1) * CELL, 300))
         draw_grid(current_step)
         output_box.insert("end", f"✅ {algo} done. Page Faults: {faults}, Hits: {hits}\n")
 
-    def compute_aging_registers():
-        aging_history = {}
-        steps = simulation_data["steps"]
-
-        for step in steps:
-            current_aging = {}
-            pages = step["frame"]
-            ref_bits = step["ref_bits"]
-            for i, page in enumerate(pages):
-                if page == -1:
-                    continue
-                prev = aging_history.get(page, 0)
-                shifted = prev >> 1
-                if ref_bits[i] == 1:
-                    shifted |= 0b10000000
-                current_aging[page] = shifted
-            step["aging_registers"] = current_aging.copy()
-            aging_history = current_aging.copy()
-
     def reset_gui():
         entry_ref.delete(0, 'end')
         entry_frames.delete(0, 'end')
@@ -86,57 +174,100 @@ def open_page_gui(parent, vm_results):
         reset_grid()
 
     def reset_grid():
-        nonlocal grid_labels
-        for label in grid_labels:
-            label.destroy()
-        grid_labels = []
+        nonlocal drawn_columns, drawn_rows
+        for canvas in (grid_canvas, col_header, row_header):
+            canvas.delete("all")
+        drawn_columns = set()
+        drawn_rows = (0, 0)
+
+    def visible_range(count, start_px, size_px):
+        first = max(0, int(start_px // CELL))
+        last = min(count, int((start_px + size_px) // CELL) + 1)
+        return first, last
+
+    def drop_column(step_index):
+        grid_canvas.delete(f"col{step_index}")
+        col_header.delete(f"col{step_index}")
+        drawn_columns.discard(step_index)
+
+    def draw_column(step_index):
+        step = simulation_data["steps"][step_index]
+        tag = f"col{step_index}"
+        x = step_index * CELL
+        col_header.create_text(x + CELL / 2, CELL / 2, text=f"T{step_index + 1}", fill="white", tags=tag)
+
+        frame = step["frame"]
+        for row in range(*drawn_rows):
+            y = row * CELL
+            frame_val = frame[row] if row < len(frame) else -1
+            if frame_val == -1:
+                grid_canvas.create_rectangle(x + 2, y + 1, x + CELL - 2, y + CELL - 1,
+                                             fill="#2c2c2c", outline="", tags=tag)
+                continue
+            text = str(frame_val)
+            if "ref_bits" in step:
+                text = f"{frame_val}\n(R{step['ref_bits'][row]})"
+            grid_canvas.create_rectangle(x + 2, y + 1, x + CELL - 2, y + CELL - 1,
+                                         fill="#e74c3c" if step["fault"] else "#2ecc71", outline="", tags=tag)
+            grid_canvas.create_text(x + CELL / 2, y + CELL / 2, text=text, fill="white",
+                                    font=("Arial", 9, "bold"), justify="center", tags=tag)
+        drawn_columns.add(step_index)
+
+    def render_visible():
+        # Draw what entered the viewport, drop what left it
+        nonlocal drawn_rows
+        if not simulation_data or not simulation_data["steps"]:
+            return
+        width = max(grid_canvas.winfo_width(), int(grid_canvas.cget("width")))
+        height = max(grid_canvas.winfo_height(), int(grid_canvas.cget("height")))
+        cols = visible_range(current_step + 1, grid_canvas.canvasx(0), width)
+        rows = visible_range(grid_rows, grid_canvas.canvasy(0), height)
+
+        if rows != drawn_rows:
+            for step_index in list(drawn_columns):
+                drop_column(step_index)
+            drawn_rows = rows
+            row_header.delete("all")
+            for row in range(*rows):
+                row_header.create_text(25, row * CELL + CELL / 2, text=f"F{row + 1}", fill="white")
+
+        for step_index in list(drawn_columns):
+            if not cols[0] <= step_index < cols[1]:
+                drop_column(step_index)
+        for step_index in range(*cols):
+            if step_index not in drawn_columns:
+                draw_column(step_index)
+
+    def scroll_x(*args):
+        grid_canvas.xview(*args)
+        col_header.xview(*args)
+        render_visible()
+
+    def scroll_y(*args):
+        grid_canvas.yview(*args)
+        row_header.yview(*args)
+        render_visible()
 
     def draw_grid(step_index):
-        nonlocal grid_labels
-        for label in grid_labels:
-            label.destroy()
-        grid_labels = []
-
-        if not simulation_data:
+        if not simulation_data or not simulation_data["steps"]:
             return
 
-        steps = simulation_data["steps"]
-        num_frames = max(len(step["frame"]) for step in steps)
-
-        for row in range(num_frames + 1):
-            for col in range(step_index + 2):
-                if row == 0 and col == 0:
-                    text = "Frame"
-                elif row == 0:
-                    text = f"T{col}"
-                elif col == 0:
-                    text = f"F{row}"
-                else:
-                    try:
-                        frame_val = steps[col - 1]["frame"][row - 1]
-                        is_fault = steps[col - 1]["fault"]
-                        text = str(frame_val) if frame_val != -1 else ""
-                        if algo_option.get() == "Second Chance":
-                            ref_bit = steps[col - 1]["ref_bits"][row - 1]
-                            text = f"{frame_val}\n(R{ref_bit})" if frame_val != -1 else ""
-                    except IndexError:
-                        text = ""
-                        is_fault = False
-
-                label = ctk.CTkLabel(grid_frame, text=text, width=35, height=35)
-                if row > 0 and col > 0:
-                    if text != "":
-                        label.configure(
-                            fg_color="#e74c3c" if is_fault else "#2ecc71",
-                            text_color="white",
-                            font=ctk.CTkFont(weight="bold")
-                        )
-                    else:
-                        label.configure(fg_color="#2c2c2c", text_color="white")
-                label.grid(row=row, column=col, padx=2, pady=1)
-                grid_labels.append(label)
-
-        step = steps[step_index]
+        # Grow/shrink the scrollable area to the current step and keep the
+        # newest column in view; only the changed columns get redrawn
+        content_width = (step_index + 1) * CELL
+        grid_canvas.configure(scrollregion=(0, 0, content_width, grid_rows * CELL))
+        col_header.configure(scrollregion=(0, 0, content_width, CELL))
+        row_header.configure(scrollregion=(0, 0, 50, grid_rows * CELL))
+        width = max(grid_canvas.winfo_width(), int(grid_canvas.cget("width")))
+        offset = max(0.0, (content_width - width) / content_width)
+        grid_canvas.xview_moveto(offset)
+        col_header.xview_moveto(offset)
+
+        for stale in [c for c in drawn_columns if c > step_index]:
+            drop_column(stale)
+        render_visible()
+
+        step = simulation_data["steps"][step_index]
         page = step["page"]
         fault = step["fault"]
         feedback = "❌ Page Fault: Loaded" if fault else "✅ Page Hit: Page"
@@ -172,27 +303,26 @@ def open_page_gui(parent, vm_results):
         step()
 
     def draw_aging_history():
-        steps = simulation_data["steps"]
-        if not steps or "aging_registers" not in steps[0]:
-            output_box.insert("end", "⚠️ No aging data found.\n")
+        registers = simulation_data.get("aging_registers") if simulation_data else None
+        if not registers:
+            output_box.insert("end", "⚠️ No aging data found. Run the Aging algorithm first.\n")
             return
 
-        win = ctk.CTkToplevel(app)
-        win.title("Aging Bit History")
-        all_pages = sorted({p for step in steps for p in step["aging_registers"]})
+        steps = simulation_data["steps"]
+        time_steps = len(steps)
 
-        ctk.CTkLabel(win, text="Page", font=("Arial", 12, "bold")).grid(row=0, column=0)
-        for t in range(len(steps)):
-            ctk.CTkLabel(win, text=f"T{t+1}").grid(row=0, column=t+1)
+        # Every referenced page gets loaded, so the rows are the distinct pages
+        referenced = steps.pages if hasattr(steps, "pages") else (step["page"] for step in steps)
+        all_pages = sorted(set(referenced))
 
-        for r, page in enumerate(all_pages, start=1):
-            ctk.CTkLabel(win, text=str(page)).grid(row=r, column=0)
-            for c, step in enumerate(steps):
-                reg = step["aging_registers"].get(page, 0)
-                reg_str = format(reg, '08b')
-                fg = "#555555" if reg_str == "00000000" else "#27ae60" if reg_str.startswith("1") else "#ffffff"
-                label = ctk.CTkLabel(win, text=reg_str, text_color="black", fg_color=fg, corner_radius=4)
-                label.grid(row=r, column=c+1, padx=5, pady=2)
+        def registers_at(t):
+            # {page: register} at step t, rebuilt from the history on demand
+            slot_registers = registers.registers_at(t)
+            return {page: slot_registers[slot]
+                    for slot, page in enumerate(steps[t]["frame"]) if page != -1}
+
+        show_aging_heatmap(app, registers_at, all_pages, time_steps, simulation_data["register_bits"],
+                           registers.checkpoint_interval)
 
     # -------------- GUI Layout ----------------
     ctk.CTkLabel(app, text="Reference String:").pack(pady=5)
@@ -204,13 +334,19 @@ def open_page_gui(parent, vm_results):
     entry_frames.pack()
 
     algo_option = ctk.StringVar(value="Optimal")
-    ctk.CTkOptionMenu(app, variable=algo_option, values=["Optimal", "Second Chance"]).pack(pady=10)
+    ctk.CTkOptionMenu(app, variable=algo_option, values=["Optimal", "Second Chance", "LRU", "LFU", "Clock", "ARC", "Aging", "Windowed Optimal"]).pack(pady=10)
 
     button_frame = ctk.CTkFrame(app)
     button_frame.pack(pady=10)
 
     ctk.CTkButton(button_frame, text="Run Algorithm", command=run_algorithm).pack(side="left", padx=10)
     ctk.CTkButton(button_frame, text="Reset", command=reset_gui).pack(side="left", padx=10)
+    cancel_btn = ctk.CTkButton(button_frame, text="Cancel", command=cancel_run, state="disabled")
+    cancel_btn.pack(side="left", padx=10)
+
+    progress = ctk.CTkProgressBar(app, width=400)
+    progress.set(0)
+    progress.pack(pady=5)
     ctk.CTkButton(app, text="Show Summary", command=lambda: show_summary(app, vm_results)).pack(pady=5)
     ctk.CTkButton(app, text="Show Aging Bit History", command=draw_aging_history).pack(pady=5)
 
@@ -228,6 +364,20 @@ def open_page_gui(parent, vm_results):
     grid_frame = ctk.CTkFrame(app)
     grid_frame.pack(pady=10)
 
+    ctk.CTkLabel(grid_frame, text="Frame", width=50).grid(row=0, column=0)
+    col_header = ctk.CTkCanvas(grid_frame, width=560, height=CELL, bg="#1e1e1e", highlightthickness=0)
+    col_header.grid(row=0, column=1)
+    row_header = ctk.CTkCanvas(grid_frame, width=50, height=CELL * 4, bg="#1e1e1e", highlightthickness=0)
+    row_header.grid(row=1, column=0)
+    grid_canvas = ctk.CTkCanvas(grid_frame, width=560, height=CELL * 4, bg="#1e1e1e", highlightthickness=0)
+    grid_canvas.grid(row=1, column=1)
+
+    y_scroll = ctk.CTkScrollbar(grid_frame, orientation="vertical", command=scroll_y)
+    y_scroll.grid(row=1, column=2, sticky="ns")
+    x_scroll = ctk.CTkScrollbar(grid_frame, orientation="horizontal", command=scroll_x)
+    x_scroll.grid(row=2, column=1, sticky="ew")
+    grid_canvas.configure(xscrollcommand=x_scroll.set, yscrollcommand=y_scroll.set)
+
     feedback_var = ctk.StringVar()
     ctk.CTkLabel(app, textvariable=feedback_var, font=ctk.CTkFont(size=14)).pack(pady=5)
 
@@ -237,12 +387,159 @@ def open_page_gui(parent, vm_results):
 def show_summary(parent, vm_results):
     win = ctk.CTkToplevel(parent)
     win.title("Virtual Memory Summary")
-    
-    headers = ["Algorithm", "Page Faults", "Hits"]
-    for i, h in enumerate(headers):
-        ctk.CTkLabel(win, text=h, font=("Arial", 14, "bold")).grid(row=0, column=i, padx=10)
-
-    for r, res in enumerate(vm_results, start=1):
-        ctk.CTkLabel(win, text=res["algorithm"]).grid(row=r, column=0)
-        ctk.CTkLabel(win, text=str(res["faults"])).grid(row=r, column=1)
-        ctk.CTkLabel(win, text=str(res["hits"])).grid(row=r, column=2)
+
+    # vm_results is a ResultTable: only the page on screen is read
+    headers = ["Algorithm", "Page Faults", "Hits", "Frames"]
+    paged_table(
+        win, headers, lambda: len(vm_results),
+        lambda offset, limit: [(r["algorithm"], r["faults"], r["hits"], r["frames"])
+                               for r in vm_results.page(offset, limit)],
+    ).pack(padx=10, pady=10)
+
+
+def _heat_color(value, max_value):
+    # Grey for an empty register, then toward green as it fills up
+    if value == 0:
+        return "#555555"
+    share = value / max_value
+    red = int(0x55 + (0x27 - 0x55) * share)
+    green = int(0x55 + (0xae - 0x55) * share)
+    blue = int(0x55 + (0x60 - 0x55) * share)
+    return f"#{red:02x}{green:02x}{blue:02x}"
+
+
+def show_aging_heatmap(parent, registers_at, pages, time_steps, register_bits, checkpoint_interval=1):
+    """
+    Scrollable heatmap of aging registers.
+
+    registers_at(t) gives {page: register} for the pages resident at step
+    t; pages are the rows. Only the rows and columns in the viewport are
+    drawn, and zooming out merges 2, 4, 8, ... time steps into one cell,
+    keeping the largest register. A merged cell reads at most MAX_SAMPLES
+    evenly spaced steps of its range, and only multiples of
+    checkpoint_interval (where the history is cheapest to rebuild) once the
+    range spans a checkpoint interval, so a redraw costs what is on screen
+    whatever the trace length. Recently drawn cells are kept in a bounded LRU.
+    """
+    CELL_H = 24
+    MAX_SAMPLES = 16
+    CACHE_SIZE = 4096
+    win = ctk.CTkToplevel(parent)
+    win.title("Aging Bit History")
+
+    max_value = (1 << register_bits) - 1
+    row_count = len(pages)
+    cells = OrderedDict()   # (zoom, column) → {page: register}, least recently drawn first
+    zoom = 0
+
+    def sample_steps(lo, hi):
+        if hi - lo <= MAX_SAMPLES:
+            return range(lo, hi)
+        if hi - lo < checkpoint_interval:
+            return range(lo, hi, -(-(hi - lo) // MAX_SAMPLES))
+        # Wide ranges: read only checkpointed steps, at most MAX_SAMPLES of them
+        first = -(-lo // checkpoint_interval) * checkpoint_interval
+        count = -(-(hi - first) // checkpoint_interval)
+        stride = -(-count // MAX_SAMPLES) * checkpoint_interval
+        return range(first, hi, stride) or range(lo, lo + 1)
+
+    def column(k, c):
+        key = (k, c)
+        cached = cells.get(key)
+        if cached is not None:
+            cells.move_to_end(key)
+            return cached
+        lo = c << k
+        cached = {}
+        for t in sample_steps(lo, min(time_steps, lo + (1 << k))):
+            for page, value in registers_at(t).items():
+                if value > cached.get(page, 0):
+                    cached[page] = value
+        cells[key] = cached
+        if len(cells) > CACHE_SIZE:
+            cells.popitem(last=False)
+        return cached
+
+    def cell_width():
+        return max(10, 9 * register_bits) if zoom == 0 else 14
+
+    def redraw(*_):
+        cols = -(-time_steps >> zoom)
+        cw = cell_width()
+        for canvas in (body, col_header, row_header):
+            canvas.delete("all")
+        body.configure(scrollregion=(0, 0, cols * cw, row_count * CELL_H))
+        col_header.configure(scrollregion=(0, 0, cols * cw, CELL_H))
+        row_header.configure(scrollregion=(0, 0, 60, row_count * CELL_H))
+
+        x0, y0 = body.canvasx(0), body.canvasy(0)
+        width = max(body.winfo_width(), int(body.cget("width")))
+        height = max(body.winfo_height(), int(body.cget("height")))
+        first_col, last_col = max(0, int(x0 // cw)), min(cols, int((x0 + width) // cw) + 1)
+        first_row, last_row = max(0, int(y0 // CELL_H)), min(row_count, int((y0 + height) // CELL_H) + 1)
+
+        span = 1 << zoom
+        label_every = max(1, 60 // cw)
+        for c in range(first_col, last_col):
+            if c % label_every == 0:
+                text = f"T{c * span + 1}" if span == 1 else f"T{c * span + 1}+"
+                col_header.create_text(c * cw + 2, CELL_H / 2, text=text, fill="white", anchor="w", font=("Arial", 9))
+        visible = [column(zoom, c) for c in range(first_col, last_col)]
+        for r in range(first_row, last_row):
+            y = r * CELL_H
+            page = pages[r]
+            row_header.create_text(30, y + CELL_H / 2, text=str(page), fill="white")
+            for c, registers in enumerate(visible, first_col):
+                value = registers.get(page, 0)
+                x = c * cw
+                body.create_rectangle(x + 1, y + 1, x + cw - 1, y + CELL_H - 1,
+                                      fill=_heat_color(value, max_value), outline="")
+                if zoom == 0:
+                    body.create_text(x + cw / 2, y + CELL_H / 2, text=format(value, f"0{register_bits}b"),
+                                     fill="black", font=("Courier", 9))
+        sampled = " (sampled)" if span > MAX_SAMPLES else ""
+        zoom_var.set(f"{span} step{'s' if span > 1 else ''} per cell{sampled}")
+
+    def scroll_x(*args):
+        body.xview(*args)
+        col_header.xview(*args)
+        redraw()
+
+    def scroll_y(*args):
+        body.yview(*args)
+        row_header.yview(*args)
+        redraw()
+
+    def set_zoom(delta):
+        nonlocal zoom
+        new_zoom = max(0, zoom + delta)
+        if (time_steps >> new_zoom) == 0 and new_zoom > zoom:
+            return
+        zoom = new_zoom
+        body.xview_moveto(0)
+        col_header.xview_moveto(0)
+        redraw()
+
+    controls = ctk.CTkFrame(win)
+    controls.grid(row=0, column=0, columnspan=3, pady=5)
+    ctk.CTkButton(controls, text="Zoom Out", command=lambda: set_zoom(1)).pack(side="left", padx=5)
+    ctk.CTkButton(controls, text="Zoom In", command=lambda: set_zoom(-1)).pack(side="left", padx=5)
+    zoom_var = ctk.StringVar()
+    ctk.CTkLabel(controls, textvariable=zoom_var).pack(side="left", padx=10)
+
+    ctk.CTkLabel(win, text="Page", font=("Arial", 12, "bold"), width=60).grid(row=1, column=0)
+    col_header = ctk.CTkCanvas(win, width=800, height=CELL_H, bg="#1e1e1e", highlightthickness=0)
+    col_header.grid(row=1, column=1)
+    row_header = ctk.CTkCanvas(win, width=60, height=480, bg="#1e1e1e", highlightthickness=0)
+    row_header.grid(row=2, column=0)
+    body = ctk.CTkCanvas(win, width=800, height=480, bg="#1e1e1e", highlightthickness=0)
+    body.grid(row=2, column=1)
+
+    y_scroll = ctk.CTkScrollbar(win, orientation="vertical", command=scroll_y)
+    y_scroll.grid(row=2, column=2, sticky="ns")
+    x_scroll = ctk.CTkScrollbar(win, orientation="horizontal", command=scroll_x)
+    x_scroll.grid(row=3, column=1, sticky="ew")
+    body.configure(xscrollcommand=x_scroll.set, yscrollcommand=y_scroll.set)
+    body.bind("<Configure>", redraw)
+
+    redraw()
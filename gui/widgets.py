@@ -0,0 +1,56 @@
+import customtkinter as ctk
+
+
+def paged_table(parent, headers, count, fetch, page_size=25):
+    """
+    Table that shows one page of rows at a time.
+
+    count() returns the total number of rows and fetch(offset, limit) the
+    cell values for one page, so only page_size rows are ever loaded and
+    the same page_size × len(headers) labels are reused on every page.
+    Returns the frame holding the table (not yet packed).
+    """
+    frame = ctk.CTkFrame(parent)
+    for i, h in enumerate(headers):
+        ctk.CTkLabel(frame, text=h, font=("Arial", 14, "bold")).grid(row=0, column=i, padx=10)
+
+    cells = [
+        [ctk.CTkLabel(frame, text="") for _ in headers]
+        for _ in range(page_size)
+    ]
+    for r, row in enumerate(cells, start=1):
+        for c, label in enumerate(row):
+            label.grid(row=r, column=c)
+
+    nav = ctk.CTkFrame(frame)
+    nav.grid(row=page_size + 1, column=0, columnspan=len(headers), pady=5)
+    page_var = ctk.StringVar()
+    page = 0
+
+    def show(new_page):
+        nonlocal page
+        total = count()
+        pages = max(1, -(-total // page_size))
+        page = min(max(new_page, 0), pages - 1)
+        rows = fetch(page * page_size, page_size)
+        for r, labels in enumerate(cells):
+            values = rows[r] if r < len(rows) else ("",) * len(headers)
+            for label, value in zip(labels, values):
+                label.configure(text="-" if value is None else str(value))
+        page_var.set(f"Page {page + 1} of {pages} ({total} rows)")
+
+    ctk.CTkButton(nav, text="◀ Prev", width=80, command=lambda: show(page - 1)).pack(side="left", padx=5)
+    ctk.CTkLabel(nav, textvariable=page_var).pack(side="left", padx=5)
+    ctk.CTkButton(nav, text="Next ▶", width=80, command=lambda: show(page + 1)).pack(side="left", padx=5)
+
+    show(0)
+    return frame
+
+
+def _format_mean(value):
+    return f"{value:.1f}" if value is not None else None
+
+
+def summary_rows(summary):
+    """Cells for a ResultsStore vm_summary() / disk_summary() result."""
+    return [(s["algorithm"], s["runs"], _format_mean(s["mean"]), s["min"], s["max"]) for s in summary]
@@ -0,0 +1,29 @@
+from page_replacement.optimal import optimal_page_replacement
+from page_replacement.second_chance import second_chance_page_replacement
+from page_replacement.lru import lru_page_replacement
+from page_replacement.lfu import lfu_page_replacement
+from page_replacement.clock import clock_page_replacement
+from page_replacement.arc import arc_page_replacement
+from page_replacement.aging import aging_page_replacement
+from page_replacement.windowed_optimal import windowed_optimal_page_replacement
+from page_replacement.working_set import working_set_page_replacement
+from page_replacement.pff import pff_page_replacement
+
+# Name → simulator, all called as f(pages, frames, summary_only=..., verbose=...)
+PAGE_ALGORITHMS = {
+    "Optimal": optimal_page_replacement,
+    "Second Chance": second_chance_page_replacement,
+    "LRU": lru_page_replacement,
+    "LFU": lfu_page_replacement,
+    "Clock": clock_page_replacement,
+    "ARC": arc_page_replacement,
+    "Aging": aging_page_replacement,
+    "Windowed Optimal": windowed_optimal_page_replacement,
+}
+
+# Variable-allocation policies, called as f(pages, parameter, summary_only=..., verbose=...)
+# where parameter is the window τ (Working Set) or the fault-gap threshold (PFF)
+VARIABLE_ALGORITHMS = {
+    "Working Set": working_set_page_replacement,
+    "PFF": pff_page_replacement,
+}
@@ -0,0 +1,200 @@
+import heapq
+from array import array
+
+from page_replacement.results import collect_results, iter_steps
+
+
+def _run_aging(pages, frame_count, register_bits=8, tick_interval=1):
+    """
+    Aging engine.
+
+    Every resident page has a register_bits-wide counter in a compact array.
+    Hits only set the page's reference bit; every tick_interval references
+    all counters shift right and take the reference bit as their new top
+    bit. The victim is the page with the smallest counter (lowest slot on
+    ties), taken from a min-heap that is rebuilt only when a fault follows
+    a tick. A newly loaded page starts with only the top bit set so it is
+    not evicted right away.
+
+    Cost: each tick shifts every counter, O(F), so with the default
+    tick_interval=1 a reference costs O(F). Hits between faults skip the
+    heap rebuild; a fault costs O(F) for the rebuild after a tick and
+    O(log F) otherwise.
+
+    Yields (page, fault, slot, evicted, slot_pages, registers, ref_bits)
+    for every reference, where registers and ref_bits are the live counter
+    array and reference bits (after any tick).
+    """
+    if not 1 <= register_bits <= 64:
+        raise ValueError("register_bits must be between 1 and 64.")
+    if tick_interval <= 0:
+        raise ValueError("tick_interval must be greater than 0.")
+
+    top = 1 << (register_bits - 1)
+    slot_pages = array("q", [-1]) * frame_count
+    registers = array("Q", [0]) * frame_count
+    ref_bits = bytearray(frame_count)
+    slot_of = {}           # page → slot
+    heap = []              # (register, slot), stale after a tick
+    heap_stale = False
+
+    for i, page in enumerate(pages):
+        slot = slot_of.get(page)
+        fault = slot is None
+        evicted = -1
+        if not fault:
+            ref_bits[slot] = 1
+        else:
+            if len(slot_of) < frame_count:
+                slot = len(slot_of)
+            else:
+                if heap_stale:
+                    heap = [(registers[s], s) for s in range(frame_count)]
+                    heapq.heapify(heap)
+                    heap_stale = False
+                while True:
+                    register, slot = heapq.heappop(heap)
+                    if registers[slot] == register:
+                        break
+                evicted = slot_pages[slot]
+                del slot_of[evicted]
+            slot_pages[slot] = page
+            slot_of[page] = slot
+            registers[slot] = top
+            ref_bits[slot] = 0
+            if not heap_stale:
+                heapq.heappush(heap, (top, slot))
+
+        if (i + 1) % tick_interval == 0:
+            filled = len(slot_of)
+            for s in range(filled):
+                registers[s] = (registers[s] >> 1) | (top if ref_bits[s] else 0)
+            ref_bits[:] = bytes(frame_count)
+            heap_stale = True
+
+        yield page, fault, slot, evicted, slot_pages, registers, ref_bits
+
+
+class AgingHistory:
+    """
+    Every slot's aging register after every step of an Aging run, stored
+    the way CompactTrace stores frames.
+
+    Per step only the slot that was hit or loaded and a fault flag are kept
+    (5 bytes); the registers and reference bits are checkpointed every
+    checkpoint_interval steps, and registers_at(step) replays the Aging
+    rules from the nearest checkpoint. Memory is O(n + n * F / interval)
+    instead of a full copy of the F registers per step.
+    """
+
+    def __init__(self, frame_count, register_bits=8, tick_interval=1, checkpoint_interval=256):
+        self.frame_count = frame_count
+        self.register_bits = register_bits
+        self.tick_interval = tick_interval
+        self.checkpoint_interval = checkpoint_interval
+        self.slots = array("i")
+        self.faults = bytearray()
+        # (registers, ref_bits) after step i * interval - 1, i.e. before step i * interval
+        self._checkpoints = [(array("Q", [0]) * frame_count, bytearray(frame_count))]
+        self._cursor = None     # last rebuilt (step, registers, ref_bits)
+
+    def record(self, fault, slot, registers, ref_bits):
+        """Append one step, given the engine's live registers and bits after it."""
+        self.slots.append(slot)
+        self.faults.append(fault)
+        if len(self.slots) % self.checkpoint_interval == 0:
+            self._checkpoints.append((array("Q", registers), bytearray(ref_bits)))
+
+    def __len__(self):
+        return len(self.slots)
+
+    def _apply(self, registers, ref_bits, step):
+        slot = self.slots[step]
+        if self.faults[step]:
+            registers[slot] = 1 << (self.register_bits - 1)
+            ref_bits[slot] = 0
+        else:
+            ref_bits[slot] = 1
+        if (step + 1) % self.tick_interval == 0:
+            top = 1 << (self.register_bits - 1)
+            for s in range(self.frame_count):
+                registers[s] = (registers[s] >> 1) | (top if ref_bits[s] else 0)
+            ref_bits[:] = bytes(self.frame_count)
+
+    def registers_at(self, step):
+        """
+        Array of every slot's register after `step`. It is shared with the
+        cursor and must not be modified; like CompactTrace.state_at, the
+        cursor is swapped rather than advanced in place.
+        """
+        if step < 0:
+            step += len(self.slots)
+        if not 0 <= step < len(self.slots):
+            raise IndexError("history index out of range")
+        index = (step + 1) // self.checkpoint_interval
+        base = index * self.checkpoint_interval     # first step not in the checkpoint
+        cursor = self._cursor
+        if cursor is not None and base - 1 <= cursor[0] <= step:
+            registers, ref_bits = array("Q", cursor[1]), bytearray(cursor[2])
+            begin = cursor[0] + 1
+        else:
+            registers, ref_bits = self._checkpoints[index]
+            registers, ref_bits = array("Q", registers), bytearray(ref_bits)
+            begin = base
+        for i in range(begin, step + 1):
+            self._apply(registers, ref_bits, i)
+        self._cursor = (step, registers, ref_bits)
+        return registers
+
+    def nbytes(self):
+        """Approximate memory held by the columns and checkpoints."""
+        per_checkpoint = 8 * self.frame_count + self.frame_count
+        return self.slots.itemsize * len(self.slots) + len(self.faults) + per_checkpoint * len(self._checkpoints)
+
+
+def iter_aging_steps(pages, frame_count, register_bits=8, tick_interval=1, verbose=False):
+    """Stream the Aging simulation one step dict at a time."""
+    events = (event[:5] for event in _run_aging(pages, frame_count, register_bits, tick_interval))
+    return iter_steps(events, verbose)
+
+
+def aging_page_replacement(pages, frame_count, register_bits=8, tick_interval=1,
+                           summary_only=False, verbose=True, compact_trace=False):
+    """
+    Simulate Aging page replacement.
+
+    Parameters:
+        pages: iterable of page numbers (reference string)
+        frame_count: number of frames
+        register_bits: width of each aging register (1-64)
+        tick_interval: references between register shifts
+        summary_only / verbose / compact_trace: as for the other algorithms
+
+    Returns:
+        dict with "steps", "page_faults", "hits", plus "aging_registers"
+        (an AgingHistory: registers_at(step) gives every slot's register
+        after that step) and "register_bits"
+        (only "page_faults" and "hits" when summary_only is set)
+    """
+    history = AgingHistory(frame_count, register_bits, tick_interval)
+
+    def events():
+        for page, fault, slot, evicted, slot_pages, registers, ref_bits in _run_aging(
+                pages, frame_count, register_bits, tick_interval):
+            if not summary_only:
+                history.record(fault, slot, registers, ref_bits)
+            yield page, fault, slot, evicted, slot_pages
+
+    result = collect_results(events(), frame_count, summary_only, verbose, compact_trace)
+    if not summary_only:
+        result["aging_registers"] = history
+        result["register_bits"] = register_bits
+    return result
+
+
+if __name__ == "__main__":
+    ref_str = input("Enter reference string (space-separated): ").strip()
+    reference_string = list(map(int, ref_str.split()))
+    frame_count = int(input("Enter number of frames: "))
+
+    aging_page_replacement(reference_string, frame_count)
@@ -0,0 +1,105 @@
+from array import array
+from collections import OrderedDict
+
+from page_replacement.results import collect_results, iter_steps
+
+
+def _run_arc(pages, frame_count):
+    """
+    ARC (Adaptive Replacement Cache) engine.
+
+    T1 holds pages seen once recently, T2 pages seen at least twice; B1/B2
+    are ghost lists remembering pages recently evicted from T1/T2. A hit in
+    a ghost list moves the target size p of T1 toward whichever side would
+    have hit. All four lists are OrderedDicts (LRU end first), so every
+    reference is O(1) amortized.
+
+    Yields (page, fault, slot, evicted, slot_pages) for every reference.
+    """
+    c = frame_count
+    slot_pages = array("q", [-1]) * c
+    slot_of = {}           # resident page → slot
+    t1, t2 = OrderedDict(), OrderedDict()
+    b1, b2 = OrderedDict(), OrderedDict()
+    p = 0                  # target size of T1
+
+    def replace(in_b2):
+        # Move the LRU page of T1 or T2 into its ghost list and free its slot
+        if t1 and (len(t1) > p or (in_b2 and len(t1) == p)):
+            victim, _ = t1.popitem(last=False)
+            b1[victim] = None
+        else:
+            victim, _ = t2.popitem(last=False)
+            b2[victim] = None
+        return victim
+
+    for page in pages:
+        if page in t1:
+            del t1[page]
+            t2[page] = None
+            yield page, False, slot_of[page], -1, slot_pages
+            continue
+        if page in t2:
+            t2.move_to_end(page)
+            yield page, False, slot_of[page], -1, slot_pages
+            continue
+
+        evicted = -1
+        full = len(t1) + len(t2) >= c
+        if page in b1:
+            p = min(c, p + max(len(b2) / len(b1), 1))
+            if full:
+                evicted = replace(False)
+            del b1[page]
+            t2[page] = None
+        elif page in b2:
+            p = max(0, p - max(len(b1) / len(b2), 1))
+            if full:
+                evicted = replace(True)
+            del b2[page]
+            t2[page] = None
+        else:
+            if len(t1) + len(b1) == c:
+                if len(t1) < c:
+                    b1.popitem(last=False)
+                    evicted = replace(False)
+                else:
+                    # T1 alone fills the cache: drop its LRU page entirely
+                    evicted, _ = t1.popitem(last=False)
+            elif full:
+                if len(t1) + len(t2) + len(b1) + len(b2) >= 2 * c:
+                    b2.popitem(last=False)
+                evicted = replace(False)
+            t1[page] = None
+
+        if evicted == -1:
+            slot = len(slot_of)
+        else:
+            slot = slot_of.pop(evicted)
+        slot_pages[slot] = page
+        slot_of[page] = slot
+        yield page, True, slot, evicted, slot_pages
+
+
+def iter_arc_steps(pages, frame_count, verbose=False):
+    """Stream the ARC simulation one step dict at a time."""
+    return iter_steps(_run_arc(pages, frame_count), verbose)
+
+
+def arc_page_replacement(pages, frame_count, summary_only=False, verbose=True, compact_trace=False):
+    """
+    Simulate ARC (Adaptive Replacement Cache) page replacement.
+
+    Returns:
+        dict with "steps", "page_faults" and "hits"
+        (only "page_faults" and "hits" when summary_only is set)
+    """
+    return collect_results(_run_arc(pages, frame_count), frame_count, summary_only, verbose, compact_trace)
+
+
+if __name__ == "__main__":
+    ref_str = input("Enter reference string (space-separated): ").strip()
+    reference_string = list(map(int, ref_str.split()))
+    frame_count = int(input("Enter number of frames: "))
+
+    arc_page_replacement(reference_string, frame_count)
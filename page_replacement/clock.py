@@ -0,0 +1,68 @@
+from array import array
+
+from page_replacement.results import collect_results, iter_steps
+
+
+def _run_clock(pages, frame_count):
+    """
+    Plain Clock engine.
+
+    Unlike Second Chance, a page is loaded with R=0: only later hits set
+    its reference bit. The hand skips referenced slots with bytearray.find
+    and clears the skipped run in one slice assignment, and a page → slot
+    dict makes hits O(1).
+
+    Yields (page, fault, slot, evicted, slot_pages) for every reference.
+    """
+    slot_pages = array("q", [-1]) * frame_count
+    ref_bits = bytearray(frame_count)
+    slot_of = {}           # page → slot
+    hand = 0
+
+    for page in pages:
+        slot = slot_of.get(page)
+        evicted = -1
+        if slot is not None:
+            ref_bits[slot] = 1
+            yield page, False, slot, evicted, slot_pages
+            continue
+
+        slot = ref_bits.find(0, hand)
+        if slot == -1:
+            ref_bits[hand:] = bytes(frame_count - hand)
+            slot = ref_bits.find(0)
+            ref_bits[:slot] = bytes(slot)
+        else:
+            ref_bits[hand:slot] = bytes(slot - hand)
+
+        evicted = slot_pages[slot]
+        if evicted != -1:
+            del slot_of[evicted]
+        slot_pages[slot] = page
+        slot_of[page] = slot
+        hand = (slot + 1) % frame_count
+        yield page, True, slot, evicted, slot_pages
+
+
+def iter_clock_steps(pages, frame_count, verbose=False):
+    """Stream the Clock simulation one step dict at a time."""
+    return iter_steps(_run_clock(pages, frame_count), verbose)
+
+
+def clock_page_replacement(pages, frame_count, summary_only=False, verbose=True, compact_trace=False):
+    """
+    Simulate plain Clock page replacement.
+
+    Returns:
+        dict with "steps", "page_faults" and "hits"
+        (only "page_faults" and "hits" when summary_only is set)
+    """
+    return collect_results(_run_clock(pages, frame_count), frame_count, summary_only, verbose, compact_trace)
+
+
+if __name__ == "__main__":
+    ref_str = input("Enter reference string (space-separated): ").strip()
+    reference_string = list(map(int, ref_str.split()))
+    frame_count = int(input("Enter number of frames: "))
+
+    clock_page_replacement(reference_string, frame_count)
@@ -0,0 +1,79 @@
+from array import array
+from collections import OrderedDict
+
+from page_replacement.results import collect_results, iter_steps
+
+
+def _run_lfu(pages, frame_count):
+    """
+    LFU engine with O(1) frequency buckets.
+
+    Each use count maps to an OrderedDict of the resident pages with that
+    count (oldest first), and the smallest non-empty count is tracked, so
+    the victim is always the least recently used page of the least
+    frequently used bucket. Counts are forgotten on eviction.
+
+    Yields (page, fault, slot, evicted, slot_pages) for every reference.
+    """
+    slot_pages = array("q", [-1]) * frame_count
+    slot_of = {}           # page → slot
+    count_of = {}          # page → use count
+    buckets = {}           # use count → OrderedDict of pages
+    min_count = 0
+
+    for page in pages:
+        slot = slot_of.get(page)
+        evicted = -1
+        if slot is not None:
+            count = count_of[page]
+            bucket = buckets[count]
+            del bucket[page]
+            if not bucket:
+                del buckets[count]
+                if min_count == count:
+                    min_count = count + 1
+            count_of[page] = count + 1
+            buckets.setdefault(count + 1, OrderedDict())[page] = None
+            yield page, False, slot, evicted, slot_pages
+            continue
+
+        if len(slot_of) < frame_count:
+            slot = len(slot_of)
+        else:
+            bucket = buckets[min_count]
+            evicted, _ = bucket.popitem(last=False)
+            if not bucket:
+                del buckets[min_count]
+            slot = slot_of.pop(evicted)
+            del count_of[evicted]
+
+        slot_pages[slot] = page
+        slot_of[page] = slot
+        count_of[page] = 1
+        buckets.setdefault(1, OrderedDict())[page] = None
+        min_count = 1
+        yield page, True, slot, evicted, slot_pages
+
+
+def iter_lfu_steps(pages, frame_count, verbose=False):
+    """Stream the LFU simulation one step dict at a time."""
+    return iter_steps(_run_lfu(pages, frame_count), verbose)
+
+
+def lfu_page_replacement(pages, frame_count, summary_only=False, verbose=True, compact_trace=False):
+    """
+    Simulate LFU (Least Frequently Used) page replacement.
+
+    Returns:
+        dict with "steps", "page_faults" and "hits"
+        (only "page_faults" and "hits" when summary_only is set)
+    """
+    return collect_results(_run_lfu(pages, frame_count), frame_count, summary_only, verbose, compact_trace)
+
+
+if __name__ == "__main__":
+    ref_str = input("Enter reference string (space-separated): ").strip()
+    reference_string = list(map(int, ref_str.split()))
+    frame_count = int(input("Enter number of frames: "))
+
+    lfu_page_replacement(reference_string, frame_count)
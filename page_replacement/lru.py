@@ -0,0 +1,55 @@
+from array import array
+from collections import OrderedDict
+
+from page_replacement.results import collect_results, iter_steps
+
+
+def _run_lru(pages, frame_count):
+    """
+    LRU engine: an OrderedDict of page → slot in recency order (oldest
+    first), so hits, loads and evictions are all O(1).
+
+    Yields (page, fault, slot, evicted, slot_pages) for every reference.
+    """
+    slot_pages = array("q", [-1]) * frame_count
+    recency = OrderedDict()     # page → slot, least recently used first
+
+    for page in pages:
+        slot = recency.get(page)
+        evicted = -1
+        if slot is not None:
+            recency.move_to_end(page)
+            yield page, False, slot, evicted, slot_pages
+            continue
+
+        if len(recency) < frame_count:
+            slot = len(recency)
+        else:
+            evicted, slot = recency.popitem(last=False)
+        slot_pages[slot] = page
+        recency[page] = slot
+        yield page, True, slot, evicted, slot_pages
+
+
+def iter_lru_steps(pages, frame_count, verbose=False):
+    """Stream the LRU simulation one step dict at a time."""
+    return iter_steps(_run_lru(pages, frame_count), verbose)
+
+
+def lru_page_replacement(pages, frame_count, summary_only=False, verbose=True, compact_trace=False):
+    """
+    Simulate LRU (Least Recently Used) page replacement.
+
+    Returns:
+        dict with "steps", "page_faults" and "hits"
+        (only "page_faults" and "hits" when summary_only is set)
+    """
+    return collect_results(_run_lru(pages, frame_count), frame_count, summary_only, verbose, compact_trace)
+
+
+if __name__ == "__main__":
+    ref_str = input("Enter reference string (space-separated): ").strip()
+    reference_string = list(map(int, ref_str.split()))
+    frame_count = int(input("Enter number of frames: "))
+
+    lru_page_replacement(reference_string, frame_count)
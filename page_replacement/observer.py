@@ -0,0 +1,131 @@
+class Observer:
+    """
+    Hooks the Optimal and Second Chance engines call while they run.
+
+    Every hook is a no-op here; subclass and override the ones you need.
+    Engines only call hooks when an observer is passed, so a run without one
+    does no extra work. Hooks that get state receive the engine's live
+    frame structures (not copies) and must not modify them:
+        Optimal:       the frame list
+        Second Chance: (slot_pages, ref_bits)
+    """
+
+    def request(self, page):
+        """A reference to page is about to be handled."""
+
+    def hit(self, page, slot, state):
+        """page was found in slot."""
+
+    def second_chance(self, page, slot):
+        """The clock hand cleared page's reference bit and moved past it."""
+
+    def hand_advance(self, steps):
+        """The clock hand moved steps slots to find a victim."""
+
+    def fault(self, page, slot, evicted, state):
+        """page is loaded into slot, replacing evicted (-1 or None if empty)."""
+
+    def heap_push(self):
+        """Optimal pushed a next-use entry onto its heap."""
+
+    def heap_pop(self, stale):
+        """Optimal popped a heap entry; stale entries are skipped."""
+
+    def heap_rebuild(self, size):
+        """Optimal rebuilt its heap from the size live frames."""
+
+    def step(self, page, fault, slot, evicted, state):
+        """The reference to page is done."""
+
+
+class MultiObserver(Observer):
+    """Forward every hook to several observers in order."""
+
+    def __init__(self, *observers):
+        self.observers = observers
+
+
+def _fan_out(name):
+    def hook(self, *args):
+        for observer in self.observers:
+            getattr(observer, name)(*args)
+    hook.__name__ = name
+    return hook
+
+
+for _name in ("request", "hit", "second_chance", "hand_advance", "fault",
+              "heap_push", "heap_pop", "heap_rebuild", "step"):
+    setattr(MultiObserver, _name, _fan_out(_name))
+
+
+def combine(*observers):
+    """One observer out of any number of observers or Nones (None if none are left)."""
+    observers = [o for o in observers if o is not None]
+    if not observers:
+        return None
+    if len(observers) == 1:
+        return observers[0]
+    return MultiObserver(*observers)
+
+
+class CountingObserver(Observer):
+    """
+    Count the work an engine does, for finding hot spots.
+
+    counters holds references, hits, faults, evictions, hand_advances,
+    second_chances, heap_pushes, heap_pops, stale_pops and heap_rebuilds;
+    report() turns them into per-reference / per-fault figures. Hits are
+    page → slot lookups in both engines, so no frames are scanned on a hit;
+    hand_advances is the number of slots the clock hand looked at.
+    """
+
+    COUNTERS = ("references", "hits", "faults", "evictions", "hand_advances", "second_chances",
+                "heap_pushes", "heap_pops", "stale_pops", "heap_rebuilds")
+
+    def __init__(self):
+        self.counters = dict.fromkeys(self.COUNTERS, 0)
+
+    def request(self, page):
+        self.counters["references"] += 1
+
+    def hit(self, page, slot, state):
+        self.counters["hits"] += 1
+
+    def second_chance(self, page, slot):
+        self.counters["second_chances"] += 1
+
+    def hand_advance(self, steps):
+        self.counters["hand_advances"] += steps
+
+    def fault(self, page, slot, evicted, state):
+        self.counters["faults"] += 1
+        if evicted is not None and evicted != -1:
+            self.counters["evictions"] += 1
+
+    def heap_push(self):
+        self.counters["heap_pushes"] += 1
+
+    def heap_pop(self, stale):
+        self.counters["heap_pops"] += 1
+        if stale:
+            self.counters["stale_pops"] += 1
+
+    def heap_rebuild(self, size):
+        self.counters["heap_rebuilds"] += 1
+
+    def report(self):
+        """Counters plus per-reference and per-fault ratios as printable text."""
+        c = self.counters
+        references = c["references"] or 1
+        faults = c["faults"] or 1
+        lines = ["📊 Profile"]
+        lines += [f"  {name:<20} {c[name]:>7,}" for name in self.COUNTERS]
+        ratios = (
+            ("hit ratio", c["hits"] / references),
+            ("hand advances/fault", c["hand_advances"] / faults),
+            ("second chances/fault", c["second_chances"] / faults),
+            ("heap ops/reference", (c["heap_pushes"] + c["heap_pops"]) / references),
+            ("stale pops/fault", c["stale_pops"] / faults),
+        )
+        lines += [f"  {label:<20} {value:>7.3f}" for label, value in ratios]
+        return "\n".join(lines)
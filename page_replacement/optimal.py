@@ -1,61 +1,197 @@
-def optimal_page_replacement(pages, frames_count):
-    memory = []             # Current pages in memory
-    page_faults = 0         # Count of page faults
-    hits = 0                # Total number of page hits
-    simulation_steps = []  # Store history of frames at each step for visualization
+import heapq
+from array import array
+
+from page_replacement.observer import Observer, combine
+from page_replacement.trace import CompactTrace
 
 
-    for i in range(len(pages)):
+def compute_next_use(pages):
+    """
+    Precompute the position of the next reference to the same page.
+
+    One backward pass over the reference string: next_use[i] is the index of
+    the next occurrence of pages[i] after i, or len(pages) if the page is
+    never used again.
+    """
+    never = len(pages)
+    next_use = array("q", [never]) * never
+    last_seen = {}
+
+    for i in range(never - 1, -1, -1):
         page = pages[i]
-        frame_snapshot = memory.copy()
+        next_use[i] = last_seen.get(page, never)
+        last_seen[page] = i
 
-        # If page is already in memory → no page fault (HIT)
-        if page in memory:
-            hits += 1
-            print(f"[No Fault] Page {page} already in memory: {memory}")
-            simulation_steps.append({
-                "frame": memory.copy(),
-                "page": page,
-                "fault": False
-            })
-            continue
+    return next_use
+
+
+def _run_optimal(pages, frames_count, observer=None, start=0, initial=None, next_use=None):
+    """
+    Optimal replacement engine.
 
+    Resident pages live in a max-heap keyed by their next use (stored as
+    (-next_use, slot) so heapq gives the farthest one first). Entries are
+    invalidated lazily: a popped entry only counts if it still matches the
+    slot's current next use. Ties between pages that are never used again
+    go to the lowest slot, exactly like the original linear scan.
+
+    observer (see page_replacement.observer) is told about every request,
+    hit, fault and heap operation; without one the loop makes no calls.
+
+    To resume part-way, pass start (first index to simulate), initial =
+    (memory, slot_next) with the next use of each resident page counted
+    from start, and the next_use array if one is already at hand.
+
+    Yields (page, fault, slot, replaced, memory) for every reference, where
+    slot is the frame that was hit or loaded, replaced is the evicted page
+    (or None) and memory is the live frame list.
+    """
+    if next_use is None:
+        next_use = compute_next_use(pages)
+    if initial is None:
+        memory = []         # Current pages in memory
+        slot_next = []      # next use of the page held in each slot
+    else:
+        memory, slot_next = initial
+    slot_of = {page: slot for slot, page in enumerate(memory)}     # page → index in memory
+    heap = [(-n, slot) for slot, n in enumerate(slot_next)]        # (-next_use, slot), may contain stale entries
+    heapq.heapify(heap)
+    max_heap_size = 2 * frames_count + 16
+
+    for i in range(start, len(pages)):
+        page = pages[i]
+        if observer is not None:
+            observer.request(page)
+        slot = slot_of.get(page)
+
+        # If page is already in memory → no page fault (HIT)
+        if slot is not None:
+            replaced = None
+            fault = False
+            if observer is not None:
+                observer.hit(page, slot, memory)
         # If there's still space → just add the page
-        if len(memory) < frames_count:
+        elif len(memory) < frames_count:
+            slot = len(memory)
+            if observer is not None:
+                observer.fault(page, slot, None, memory)
             memory.append(page)
-            page_faults += 1
-            print(f"[Fault] Page {page} added → {memory}")
+            slot_next.append(0)
+            slot_of[page] = slot
+            replaced = None
+            fault = True
         else:
-            # Replace page using Optimal strategy
-            future = pages[i+1:]  # Remaining pages
-            index_to_replace = -1
-            farthest_use = -1
-
-            for mem_index in range(len(memory)):
-                mem_page = memory[mem_index]
-                if mem_page not in future:
-                    index_to_replace = mem_index
+            # Replace the page whose next use is farthest in the future
+            while True:
+                neg_next, slot = heapq.heappop(heap)
+                live = slot_next[slot] == -neg_next
+                if observer is not None:
+                    observer.heap_pop(not live)
+                if live:
                     break
-                else:
-                    next_use = future.index(mem_page)# return the number of steps to reach the first occurence of this value
-                    if next_use > farthest_use:
-                        farthest_use = next_use
-                        index_to_replace = mem_index
-
-            replaced = memory[index_to_replace]
-            memory[index_to_replace] = page
-            page_faults += 1
+            replaced = memory[slot]
+            if observer is not None:
+                observer.fault(page, slot, replaced, memory)
+            del slot_of[replaced]
+            memory[slot] = page
+            slot_of[page] = slot
+            fault = True
+
+        slot_next[slot] = next_use[i]
+        heapq.heappush(heap, (-next_use[i], slot))
+
+        # Drop stale entries once they outnumber the live ones
+        if len(heap) > max_heap_size:
+            heap = [(-slot_next[s], s) for s in range(len(memory))]
+            heapq.heapify(heap)
+            if observer is not None:
+                observer.heap_rebuild(len(memory))
+
+        if observer is not None:
+            observer.heap_push()
+            observer.step(page, fault, slot, replaced, memory)
+
+        yield page, fault, slot, replaced, memory
+
+
+class _OptimalPrinter(Observer):
+    """Prints every step the way the simulator always has."""
+
+    def step(self, page, fault, slot, replaced, memory):
+        if not fault:
+            print(f"[No Fault] Page {page} already in memory: {memory}")
+        elif replaced is None:
+            print(f"[Fault] Page {page} added → {memory}")
+        else:
             print(f"[Replace] {replaced} → {page} → {memory}")
-        
-        # Add step to simulation log
-        simulation_steps.append({
+
+
+def iter_optimal_steps(pages, frames_count, verbose=False, observer=None):
+    """
+    Stream the Optimal simulation one step at a time.
+
+    Yields the same dicts as the "steps" list of optimal_page_replacement,
+    without keeping any of them, so memory stays constant in the number of
+    steps. pages must support len() and indexing (OPT needs the future).
+    """
+    observer = combine(_OptimalPrinter() if verbose else None, observer)
+    for page, fault, _slot, _replaced, memory in _run_optimal(pages, frames_count, observer):
+        yield {
             "frame": memory.copy(),
             "page": page,
-            "fault": True
-        })
-    print("\nTotal page faults:", page_faults)
-    print(f"Total hits: {hits}")
-    
+            "fault": fault
+        }
+
+
+def optimal_page_replacement(pages, frames_count, summary_only=False, verbose=True, compact_trace=False,
+                             observer=None):
+    """
+    Simulate Optimal page replacement.
+
+    Parameters:
+        pages: sequence of page numbers (reference string)
+        frames_count: number of frames
+        summary_only: skip the per-step history and return only the counts
+        verbose: print every step and the totals
+        compact_trace: return "steps" as a CompactTrace instead of a list
+        observer: page_replacement.observer.Observer to notify of every
+            event (e.g. a CountingObserver for a profile)
+
+    Returns:
+        dict with "steps", "page_faults" and "hits"
+        (only "page_faults" and "hits" when summary_only is set)
+    """
+    page_faults = 0         # Count of page faults
+    hits = 0                # Total number of page hits
+    simulation_steps = []  # Store history of frames at each step for visualization
+    if compact_trace:
+        simulation_steps = CompactTrace(frames_count, trim_empty=True)
+
+    engine_observer = combine(_OptimalPrinter() if verbose else None, observer)
+    for page, fault, slot, replaced, memory in _run_optimal(pages, frames_count, engine_observer):
+        if fault:
+            page_faults += 1
+        else:
+            hits += 1
+
+        # Add step to simulation log
+        if summary_only:
+            continue
+        if compact_trace:
+            simulation_steps.record(page, fault, slot, -1 if replaced is None else replaced)
+        else:
+            simulation_steps.append({
+                "frame": memory.copy(),
+                "page": page,
+                "fault": fault
+            })
+    if verbose:
+        print("\nTotal page faults:", page_faults)
+        print(f"Total hits: {hits}")
+
+    if summary_only:
+        return {"page_faults": page_faults, "hits": hits}
+
     return {
         "steps": simulation_steps,
         "page_faults": page_faults,
@@ -0,0 +1,92 @@
+from array import array
+from collections import OrderedDict
+
+from page_replacement.results import collect_variable_results, iter_steps
+
+
+def _run_pff(pages, threshold):
+    """
+    Page-Fault-Frequency engine.
+
+    On a fault, if more than `threshold` references have passed since the
+    previous fault, every page not referenced since that fault is released
+    before the new page is loaded; otherwise the resident set just grows.
+    Resident pages are kept in an OrderedDict in order of last reference,
+    so releasing them pops from the front and stops at the first page used
+    since the last fault: each page is released at most once per load,
+    which keeps every reference O(1) amortized. Slots are stable and freed
+    slots are reused, as in the Working Set engine.
+
+    Yields (page, fault, slot, evicted, slot_pages, resident) for every
+    reference, where evicted is always -1 and resident is the resident set
+    size after the reference.
+    """
+    if threshold < 0:
+        raise ValueError("threshold must be 0 or more.")
+
+    slot_pages = array("q")
+    free = []               # vacated slots, reused last-in first-out
+    slot_of = {}            # page → slot
+    recency = OrderedDict() # page → time of last reference, least recent first
+    last_fault = None
+
+    for t, page in enumerate(pages):
+        slot = slot_of.get(page)
+        fault = slot is None
+        if fault:
+            if last_fault is not None and t - last_fault > threshold:
+                # Faults are rare: shrink to the pages used since the last one
+                while recency:
+                    old, when = next(iter(recency.items()))
+                    if when >= last_fault:
+                        break
+                    del recency[old]
+                    gone = slot_of.pop(old)
+                    slot_pages[gone] = -1
+                    free.append(gone)
+            last_fault = t
+
+            if free:
+                slot = free.pop()
+            else:
+                slot = len(slot_pages)
+                slot_pages.append(-1)
+            slot_pages[slot] = page
+            slot_of[page] = slot
+
+        recency[page] = t
+        recency.move_to_end(page)
+        yield page, fault, slot, -1, slot_pages, len(slot_of)
+
+
+def iter_pff_steps(pages, threshold, verbose=False):
+    """Stream the PFF simulation one step dict at a time."""
+    events = (event[:5] for event in _run_pff(pages, threshold))
+    return iter_steps(events, verbose)
+
+
+def pff_page_replacement(pages, threshold, summary_only=False, verbose=True, compact_trace=False):
+    """
+    Simulate Page-Fault-Frequency replacement.
+
+    Parameters:
+        pages: iterable of page numbers (reference string)
+        threshold: longest gap between faults (in references) before the
+            resident set is trimmed
+        summary_only / verbose: as for the other algorithms
+
+    Returns:
+        dict with "steps", "page_faults", "hits", "resident_set_sizes",
+        "mean_resident_set_size" and "max_resident_set_size"
+        ("steps" and "resident_set_sizes" are left out when summary_only
+        is set)
+    """
+    return collect_variable_results(_run_pff(pages, threshold), summary_only, verbose, compact_trace)
+
+
+if __name__ == "__main__":
+    ref_str = input("Enter reference string (space-separated): ").strip()
+    reference_string = list(map(int, ref_str.split()))
+    threshold = int(input("Enter fault-gap threshold: "))
+
+    pff_page_replacement(reference_string, threshold)
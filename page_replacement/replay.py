@@ -0,0 +1,189 @@
+from array import array
+from bisect import bisect_left, insort
+
+from page_replacement.optimal import _run_optimal, compute_next_use
+from page_replacement.second_chance import _run_second_chance
+from page_replacement.trace import CompactTrace
+
+REPLAY_ALGORITHMS = ("Optimal", "Second Chance")
+
+
+class Replay:
+    """
+    Random-access, incrementally re-simulated page-replacement run.
+
+    The run is kept as a CompactTrace, whose state checkpoints every
+    checkpoint_interval steps make step(t) a replay of at most that many
+    deltas. Editing a reference with set_page() does not rerun the whole
+    trace:
+
+        Second Chance: the engine resumes from the state just before the
+            edit, since nothing earlier depends on the future.
+        Optimal: changing pages[p] from a to b also changes the next use of
+            the previous a and the previous b, so the engine resumes before
+            the earliest of those.
+
+    From the edit on, every time the new run reaches a checkpoint in the
+    same frame state as the old run, the rest of the old run is reused
+    as-is (the future is unchanged past the edit, so it would play out the
+    same way). Changing the frame count needs a full rerun.
+
+    Parameters:
+        pages: reference string (copied into an array)
+        frame_count: number of frames
+        algorithm: "Optimal" or "Second Chance"
+        checkpoint_interval: steps between state checkpoints
+        trace: an existing CompactTrace of this exact run (e.g. the
+            "steps" of a compact_trace=True result) to start from instead
+            of simulating; it is copied, not modified
+    """
+
+    def __init__(self, pages, frame_count, algorithm="Optimal", checkpoint_interval=256, trace=None):
+        if algorithm not in REPLAY_ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        if frame_count <= 0:
+            raise ValueError("Number of frames must be greater than 0.")
+        self.algorithm = algorithm
+        self.frame_count = frame_count
+        self.checkpoint_interval = checkpoint_interval
+        self.pages = array("q", pages)
+        self.rerun_steps = 0        # steps simulated by the last (re)run
+
+        if algorithm == "Optimal":
+            self._next_use = compute_next_use(self.pages)
+            self._positions = {}    # page → sorted positions in pages
+            for i, page in enumerate(self.pages):
+                self._positions.setdefault(page, []).append(i)
+
+        if trace is not None and len(trace) == len(self.pages):
+            self.checkpoint_interval = trace.checkpoint_interval
+            self.trace = trace.head(len(trace))
+        else:
+            self._rerun(0)
+
+    def _new_trace(self):
+        return CompactTrace(self.frame_count, ref_bits=self.algorithm == "Second Chance",
+                            trim_empty=self.algorithm == "Optimal",
+                            checkpoint_interval=self.checkpoint_interval)
+
+    def _events(self, start, state):
+        frames, bits, hand, filled = state
+        if self.algorithm == "Second Chance":
+            for page, fault, slot, evicted, _slot_pages, _ref_bits in _run_second_chance(
+                    self.pages[start:], self.frame_count, initial=(frames, bits, hand)):
+                yield page, fault, slot, evicted
+            return
+
+        memory = frames[:filled].tolist()
+        slot_next = []
+        for page in memory:
+            positions = self._positions[page]
+            at = bisect_left(positions, start)
+            slot_next.append(positions[at] if at < len(positions) else len(self.pages))
+        for page, fault, slot, replaced, _memory in _run_optimal(
+                self.pages, self.frame_count, start=start, initial=(memory, slot_next), next_use=self._next_use):
+            yield page, fault, slot, -1 if replaced is None else replaced
+
+    def _rerun(self, start, edited=None):
+        """Simulate from `start`, reusing the old tail once the states agree past `edited`."""
+        old = getattr(self, "trace", None)
+        if old is None or start == 0:
+            trace = self._new_trace()
+        else:
+            trace = old.head(start)
+
+        # Past the edit, check for convergence at every old checkpoint
+        can_converge = old is not None and edited is not None
+        interval = self.checkpoint_interval
+        step = start
+        for page, fault, slot, evicted in self._events(start, trace.state_before(start)):
+            if (can_converge and step > edited and step % interval == 0 and step < len(old)
+                    and trace.live_state_matches(old, step)):
+                trace.adopt_tail(old, step)
+                break
+            trace.record(page, fault, slot, evicted)
+            step += 1
+
+        self.rerun_steps = step - start
+        self.trace = trace
+
+    def set_page(self, position, page):
+        """
+        Change one reference and re-simulate incrementally.
+
+        Returns the step the simulation resumed from.
+        """
+        if not 0 <= position < len(self.pages):
+            raise IndexError("reference index out of range")
+        if page < 0:
+            raise ValueError("Page numbers must be non-negative integers.")
+        old_page = self.pages[position]
+        if old_page == page:
+            self.rerun_steps = 0
+            return position
+        self.pages[position] = page
+        resume = position
+
+        if self.algorithm == "Optimal":
+            never = len(self.pages)
+            next_use = self._next_use
+
+            # Take position out of old_page's occurrences
+            positions = self._positions[old_page]
+            at = bisect_left(positions, position)
+            del positions[at]
+            if at > 0:
+                next_use[positions[at - 1]] = positions[at] if at < len(positions) else never
+                resume = min(resume, positions[at - 1])
+            if not positions:
+                del self._positions[old_page]
+
+            # ... and into page's
+            positions = self._positions.setdefault(page, [])
+            insort(positions, position)
+            at = bisect_left(positions, position)
+            next_use[position] = positions[at + 1] if at + 1 < len(positions) else never
+            if at > 0:
+                next_use[positions[at - 1]] = position
+                resume = min(resume, positions[at - 1])
+
+        self._rerun(resume, edited=position)
+        return resume
+
+    def update(self, pages):
+        """
+        Bring the run in line with a new reference string of the same
+        length by applying each changed position; a different length means
+        a full rerun. Returns the number of references that changed.
+        """
+        pages = array("q", pages)
+        if len(pages) != len(self.pages):
+            self.__init__(pages, self.frame_count, self.algorithm, self.checkpoint_interval)
+            return len(pages)
+        changed = [i for i in range(len(pages)) if pages[i] != self.pages[i]]
+        for i in changed:
+            self.set_page(i, pages[i])
+        return len(changed)
+
+    def set_frame_count(self, frame_count):
+        """Change the number of frames; every decision can change, so this reruns from scratch."""
+        if frame_count <= 0:
+            raise ValueError("Number of frames must be greater than 0.")
+        self.frame_count = frame_count
+        self.trace = None
+        self._rerun(0)
+
+    def __len__(self):
+        return len(self.trace)
+
+    def step(self, t):
+        """The step dict at t, rebuilt from the nearest checkpoint."""
+        return self.trace[t]
+
+    def result(self):
+        """The run as a compact_trace=True style result dict."""
+        return {
+            "steps": self.trace,
+            "page_faults": self.trace.page_faults,
+            "hits": self.trace.hits,
+        }
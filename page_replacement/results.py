@@ -0,0 +1,110 @@
+from array import array
+
+from page_replacement.trace import CompactTrace
+
+
+def print_step(page, fault, evicted, slot_pages):
+    frames = slot_pages.tolist()
+    if not fault:
+        print(f"[No Fault] Page {page} already in memory: {frames}")
+    elif evicted == -1:
+        print(f"[Fault] Page {page} added → {frames}")
+    else:
+        print(f"[Replace] {evicted} → {page} → {frames}")
+
+
+def iter_steps(events, verbose=False):
+    """
+    Turn an engine's (page, fault, slot, evicted, slot_pages) events into the
+    usual step dicts, one at a time.
+    """
+    for page, fault, _slot, evicted, slot_pages in events:
+        if verbose:
+            print_step(page, fault, evicted, slot_pages)
+        yield {
+            "frame": slot_pages.tolist(),
+            "page": page,
+            "fault": fault
+        }
+
+
+def collect_results(events, frame_count, summary_only=False, verbose=True, compact_trace=False, trim_empty=False):
+    """
+    Build the standard {"steps", "page_faults", "hits"} result from an
+    engine's (page, fault, slot, evicted, slot_pages) events, with the same
+    summary_only / verbose / compact_trace options as the Optimal and Second
+    Chance functions.
+
+    trim_empty is for engines whose slot_pages grows as frames fill (like
+    Optimal's memory list): the compact trace then reports only the filled
+    prefix too, so both step formats match.
+    """
+    page_faults = 0
+    hits = 0
+    simulation_steps = []
+    if compact_trace:
+        simulation_steps = CompactTrace(frame_count, trim_empty=trim_empty)
+
+    for page, fault, slot, evicted, slot_pages in events:
+        if fault:
+            page_faults += 1
+        else:
+            hits += 1
+        if verbose:
+            print_step(page, fault, evicted, slot_pages)
+        if summary_only:
+            continue
+        if compact_trace:
+            simulation_steps.record(page, fault, slot, evicted)
+        else:
+            simulation_steps.append({
+                "frame": slot_pages.tolist(),
+                "page": page,
+                "fault": fault
+            })
+
+    if verbose:
+        print(f"\nTotal page faults: {page_faults}")
+        print(f"Total hits: {hits}")
+
+    if summary_only:
+        return {"page_faults": page_faults, "hits": hits}
+
+    return {
+        "steps": simulation_steps,
+        "page_faults": page_faults,
+        "hits": hits
+    }
+
+
+def collect_variable_results(events, summary_only=False, verbose=True, compact_trace=False):
+    """
+    collect_results for variable-allocation engines, whose events carry the
+    resident set size as a sixth field. Adds "resident_set_sizes" (array of
+    int, one per reference; left out when summary_only is set) and its
+    "mean_resident_set_size" / "max_resident_set_size".
+
+    compact_trace is not supported: pages leave without a fault, which the
+    CompactTrace deltas cannot express.
+    """
+    if compact_trace:
+        raise ValueError("compact_trace needs a fixed frame count; use the list steps.")
+
+    sizes = array("i")
+    totals = [0, 0, 0]      # references, sum of sizes, max size
+
+    def events_with_sizes():
+        for page, fault, slot, evicted, slot_pages, resident in events:
+            if not summary_only:
+                sizes.append(resident)
+            totals[0] += 1
+            totals[1] += resident
+            totals[2] = max(totals[2], resident)
+            yield page, fault, slot, evicted, slot_pages
+
+    result = collect_results(events_with_sizes(), 0, summary_only, verbose)
+    if not summary_only:
+        result["resident_set_sizes"] = sizes
+    result["mean_resident_set_size"] = totals[1] / totals[0] if totals[0] else 0.0
+    result["max_resident_set_size"] = totals[2]
+    return result
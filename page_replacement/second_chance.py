@@ -1,61 +1,180 @@
-def second_chance_page_replacement(pages, frame_count):
-    # Initialize frames as an empty list of tuples: (page_number, reference_bit)
-    frames = []
-    pointer = 0            # This will rotate through frames like a circular queue
+from array import array
+
+from page_replacement.observer import Observer, combine
+from page_replacement.trace import CompactTrace
+
+
+def _frame_list(slot_pages, ref_bits):
+    # Same [page, R] pairs the simulator used to keep, for debug output
+    return [[p, r] for p, r in zip(slot_pages, ref_bits)]
+
+
+class _SecondChancePrinter(Observer):
+    """Prints every step the way the simulator always has."""
+
+    def request(self, page):
+        print(f"\n🔍 Requesting page: {page}")
+
+    def hit(self, page, slot, state):
+        print(f"✅ Page {page} found → set R=1 → Frames: {_frame_list(*state)}")
+
+    def second_chance(self, page, slot):
+        print(f"🔄 Giving second chance to page {page} at position {slot}")
+
+    def fault(self, page, slot, evicted, state):
+        print(f"🔁 Replacing page {evicted} with {page} at position {slot}")
+
+    def step(self, page, fault, slot, evicted, state):
+        print(f"📦 Frame state: {_frame_list(*state)}")
+
+
+def _run_second_chance(pages, frame_count, observer=None, initial=None):
+    """
+    Second Chance (clock) engine.
+
+    Frame state is packed: slot_pages is an array of page numbers (-1 means
+    empty) and ref_bits a bytearray of reference bits, with a page → slot
+    dict so hits are O(1). On a fault the hand jumps straight to the next
+    clear bit with bytearray.find and clears the skipped run in one slice
+    assignment instead of stepping slot by slot.
+
+    observer (see page_replacement.observer) is told about every request,
+    hit, second chance, hand movement and replacement; without one the loop
+    makes no calls at all.
+
+    initial = (slot_pages, ref_bits, pointer) resumes from a saved state
+    instead of empty frames; the engine takes ownership of the containers.
+
+    Yields (page, fault, slot, evicted, slot_pages, ref_bits) for every
+    reference: slot is the frame that was hit or loaded, evicted the page it
+    held before a fault (-1 if empty), and the last two are the live state.
+    Works on any iterable of pages, so it can consume a stream.
+    """
+    if initial is None:
+        slot_pages = array("q", [-1]) * frame_count
+        ref_bits = bytearray(frame_count)
+        pointer = 0        # This will rotate through frames like a circular queue
+    else:
+        slot_pages, ref_bits, pointer = initial
+    state = (slot_pages, ref_bits)
+    slot_of = {page: slot for slot, page in enumerate(slot_pages) if page != -1}   # page → slot
+
+    for page in pages:
+        if observer is not None:
+            observer.request(page)
+
+        # Check if page is already in memory
+        slot = slot_of.get(page)
+        fault = slot is None
+        evicted = -1
+        if not fault:
+            ref_bits[slot] = 1  # Set reference bit to 1
+            if observer is not None:
+                observer.hit(page, slot, state)
+        else:
+            # Need to replace a page: find the first slot with R=0
+            victim = ref_bits.find(0, pointer)
+            if victim == -1:
+                # Every slot from the hand to the end is referenced → wrap
+                ref_bits[pointer:] = bytes(frame_count - pointer)
+                victim = ref_bits.find(0)
+                ref_bits[:victim] = bytes(victim)
+                skipped = (*range(pointer, frame_count), *range(victim)) if observer is not None else ()
+            else:
+                skipped = range(pointer, victim) if observer is not None else ()
+                ref_bits[pointer:victim] = bytes(victim - pointer)
+
+            # Found the page to replace
+            evicted = slot_pages[victim]
+            if observer is not None:
+                # Give second chance: reset R and move on
+                for i in skipped:
+                    observer.second_chance(slot_pages[i], i)
+                observer.hand_advance(len(skipped) + 1)
+                observer.fault(page, victim, evicted, state)
+
+            if evicted != -1:
+                del slot_of[evicted]
+            slot_pages[victim] = page
+            ref_bits[victim] = 1  # Insert new page with R=1
+            slot_of[page] = victim
+            pointer = (victim + 1) % frame_count
+            slot = victim
+
+        if observer is not None:
+            observer.step(page, fault, slot, evicted, state)
+
+        yield page, fault, slot, evicted, slot_pages, ref_bits
+
+
+def _snapshot(page, fault, slot_pages, ref_bits):
+    # 🧠 Snapshot of frame states and ref bits
+    return {
+        "frame": slot_pages.tolist(),
+        "ref_bits": list(ref_bits),
+        "page": page,
+        "fault": fault
+    }
+
+
+def iter_second_chance_steps(pages, frame_count, verbose=False, observer=None):
+    """
+    Stream the Second Chance simulation one step at a time.
+
+    Yields the same dicts as the "steps" list of
+    second_chance_page_replacement without keeping any of them. pages can be
+    any iterable, including a generator over a trace file.
+    """
+    observer = combine(_SecondChancePrinter() if verbose else None, observer)
+    for page, fault, _slot, _evicted, slot_pages, ref_bits in _run_second_chance(pages, frame_count, observer):
+        yield _snapshot(page, fault, slot_pages, ref_bits)
+
+
+def second_chance_page_replacement(pages, frame_count, summary_only=False, verbose=True, compact_trace=False,
+                                   observer=None):
+    """
+    Simulate Second Chance page replacement.
+
+    Parameters:
+        pages: iterable of page numbers (reference string)
+        frame_count: number of frames
+        summary_only: skip the per-step history and return only the counts,
+            using O(frame_count) memory
+        verbose: print every step and the totals
+        compact_trace: return "steps" as a CompactTrace instead of a list
+        observer: page_replacement.observer.Observer to notify of every
+            event (e.g. a CountingObserver for a profile)
+
+    Returns:
+        dict with "steps", "page_faults" and "hits"
+        (only "page_faults" and "hits" when summary_only is set)
+    """
     page_faults = 0
     hits = 0
     simulation_steps = []
+    if compact_trace:
+        simulation_steps = CompactTrace(frame_count, ref_bits=True)
 
-    # Create fixed-size frame slots
-    for _ in range(frame_count):
-        frames.append([-1, 0])  # [-1 means empty], reference bit = 0
+    engine_observer = combine(_SecondChancePrinter() if verbose else None, observer)
+    for page, fault, slot, evicted, slot_pages, ref_bits in _run_second_chance(pages, frame_count, engine_observer):
+        if fault:
+            page_faults += 1
+        else:
+            hits += 1
+        if summary_only:
+            continue
+        if compact_trace:
+            simulation_steps.record(page, fault, slot, evicted)
+        else:
+            simulation_steps.append(_snapshot(page, fault, slot_pages, ref_bits))
 
-    for page in pages:
-        print(f"\n🔍 Requesting page: {page}")
+    if verbose:
+        print(f"\n✅ Total page faults: {page_faults}")
+        print(f"✅ Total hits: {hits}")
+
+    if summary_only:
+        return {"page_faults": page_faults, "hits": hits}
 
-        # Check if page is already in memory
-        in_memory = False
-        for frame in frames:
-            if frame[0] == page:
-                frame[1] = 1  # Set reference bit to 1
-                in_memory = True
-                hits += 1
-                print(f"✅ Page {page} found → set R=1 → Frames: {frames}")
-                break
-
-        if not in_memory:
-            # Need to replace a page
-            while True:
-                current_page, ref_bit = frames[pointer]
-
-                if ref_bit == 0:
-                    # Found the page to replace
-                    print(f"🔁 Replacing page {current_page} with {page} at position {pointer}")
-                    frames[pointer] = [page, 1]  # Insert new page with R=1
-                    pointer = (pointer + 1) % frame_count
-                    page_faults += 1
-                    break
-                else:
-                    # Give second chance: reset R and move on
-                    print(f"🔄 Giving second chance to page {current_page} at position {pointer}")
-                    frames[pointer][1] = 0
-                    pointer = (pointer + 1) % frame_count
-        
-        # 🧠 Save a snapshot of frame states and ref bits
-        snapshot = {
-            "frame": [slot[0] for slot in frames],
-            "ref_bits": [slot[1] for slot in frames],
-            "page": page,
-            "fault": not in_memory
-        }
-        simulation_steps.append(snapshot)
-        
-        # Debug: show current frame state
-        print(f"📦 Frame state: {frames}")
-
-    print(f"\n✅ Total page faults: {page_faults}")
-    print(f"✅ Total hits: {hits}")
-    
     return {
         "steps": simulation_steps,
         "page_faults": page_faults,
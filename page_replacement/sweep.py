@@ -0,0 +1,193 @@
+from itertools import accumulate
+
+from page_replacement.aging import _run_aging
+from page_replacement.arc import _run_arc
+from page_replacement.clock import _run_clock
+from page_replacement.lfu import _run_lfu
+from page_replacement.optimal import compute_next_use
+from page_replacement.second_chance import _run_second_chance
+from page_replacement.windowed_optimal import _run_windowed_optimal
+
+
+def _optimal_stack_distances(pages, max_frames):
+    """
+    Mattson-style stack processing for OPT.
+
+    The stack is ordered so that its top F entries are exactly what OPT keeps
+    with F frames. On each reference the page moves to the top and the old
+    entries are pushed down level by level, each level keeping whichever of
+    the two candidates is needed again sooner. The stack is cut at
+    max_frames, which is all the curve needs.
+
+    Returns (hist, misses): hist[d] counts references found at depth d,
+    misses counts references deeper than max_frames (or never seen).
+    """
+    next_use = compute_next_use(pages)
+    nxt = {}               # page → its next reference time
+    stack = []
+    in_stack = set()
+    hist = [0] * max_frames
+    misses = 0
+
+    for t in range(len(pages)):
+        page = pages[t]
+        nxt[page] = next_use[t]
+
+        if page in in_stack:
+            depth = stack.index(page)
+            hist[depth] += 1
+            if depth == 0:
+                continue
+        else:
+            misses += 1
+            in_stack.add(page)
+            if not stack:
+                stack.append(page)
+                continue
+            depth = len(stack)
+
+        # Push down: the page used later keeps sinking
+        carry = stack[0]
+        stack[0] = page
+        carry_next = nxt[carry]
+        for i in range(1, depth):
+            other = stack[i]
+            other_next = nxt[other]
+            if other_next >= carry_next:
+                stack[i] = carry
+                carry, carry_next = other, other_next
+
+        if depth < len(stack):
+            stack[depth] = carry
+        elif len(stack) < max_frames:
+            stack.append(carry)
+        else:
+            in_stack.discard(carry)
+
+    return hist, misses
+
+
+def _lru_stack_distances(pages, max_frames):
+    """
+    Stack processing for LRU: the stack is plain recency order, so a
+    reference just moves its page to the top. Works on any iterable.
+
+    Returns (hist, misses) like _optimal_stack_distances.
+    """
+    stack = []             # most recently used first
+    in_stack = set()
+    hist = [0] * max_frames
+    misses = 0
+
+    for page in pages:
+        if page in in_stack:
+            depth = stack.index(page)
+            hist[depth] += 1
+            del stack[depth]
+        else:
+            misses += 1
+            in_stack.add(page)
+            if len(stack) == max_frames:
+                in_stack.discard(stack.pop())
+        stack.insert(0, page)
+
+    return hist, misses
+
+
+def _simulated_faults(run, pages, max_frames):
+    """
+    Fallback for non-stack algorithms: one engine per frame count, all fed in
+    lockstep from a single pass over the trace (so streams work too).
+    """
+    current = [None]
+
+    def feed():
+        while True:
+            yield current[0]
+
+    engines = [run(feed(), frames) for frames in range(1, max_frames + 1)]
+    faults = [0] * max_frames
+    total = 0
+
+    for page in pages:
+        current[0] = page
+        total += 1
+        for i, engine in enumerate(engines):
+            if next(engine)[1]:
+                faults[i] += 1
+
+    return faults, total
+
+
+def _rerun_faults(run, pages, max_frames):
+    """
+    For engines that read ahead of the current reference and so can't share
+    a lockstep feed: one full pass per frame count (pages must be a
+    sequence).
+    """
+    faults = [sum(event[1] for event in run(pages, frames)) for frames in range(1, max_frames + 1)]
+    return faults, len(pages)
+
+
+# Stack algorithms: one pass gives the whole curve
+STACK_ALGORITHMS = {
+    "Optimal": _optimal_stack_distances,
+    "LRU": _lru_stack_distances,
+}
+
+# Everything else is simulated once per frame count
+SIMULATED_ALGORITHMS = {
+    "Second Chance": _run_second_chance,
+    "LFU": _run_lfu,
+    "Clock": _run_clock,
+    "ARC": _run_arc,
+    "Aging": _run_aging,
+}
+
+# Lookahead engines, rerun once per frame count
+READAHEAD_ALGORITHMS = {
+    "Windowed Optimal": _run_windowed_optimal,
+}
+
+
+def fault_curve(pages, max_frames, algorithm="Optimal"):
+    """
+    Page faults for every frame count from 1 to max_frames.
+
+    Stack algorithms (inclusion property holds) are answered from a single
+    stack-distance pass; other algorithms fall back to a lockstep per-F
+    simulation and are checked for Belady's anomaly.
+
+    Returns:
+        dict with "frames", "page_faults", "hits", "method"
+        ("stack" or "simulation") and "belady_anomalies" (frame counts that
+        fault more than the one just below them)
+    """
+    if max_frames <= 0:
+        raise ValueError("max_frames must be greater than 0.")
+
+    if algorithm in STACK_ALGORITHMS:
+        hist, misses = STACK_ALGORITHMS[algorithm](pages, max_frames)
+        # faults(F) = misses + references found at depth >= F
+        deeper = list(accumulate(reversed(hist)))[::-1] + [0]
+        faults = [misses + deeper[f] for f in range(1, max_frames + 1)]
+        total = misses + sum(hist)
+        method = "stack"
+    elif algorithm in SIMULATED_ALGORITHMS:
+        faults, total = _simulated_faults(SIMULATED_ALGORITHMS[algorithm], pages, max_frames)
+        method = "simulation"
+    elif algorithm in READAHEAD_ALGORITHMS:
+        faults, total = _rerun_faults(READAHEAD_ALGORITHMS[algorithm], pages, max_frames)
+        method = "simulation"
+    else:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+
+    anomalies = [f + 1 for f in range(1, max_frames) if faults[f] > faults[f - 1]]
+
+    return {
+        "frames": list(range(1, max_frames + 1)),
+        "page_faults": faults,
+        "hits": [total - f for f in faults],
+        "method": method,
+        "belady_anomalies": anomalies,
+    }
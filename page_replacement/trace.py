@@ -0,0 +1,229 @@
+from array import array
+
+
+class CompactTrace:
+    """
+    Columnar, delta-encoded history of a page-replacement run.
+
+    Instead of one dict with a full frame copy per step, every step stores
+    only what changed:
+        pages:   requested page per step
+        faults:  fault bitmap (one bit per step)
+        slots:   frame slot that was hit or loaded per step
+        evicted_slots / evicted_pages: one entry per fault
+                 (evicted page is -1 when an empty slot was filled)
+
+    Full frame states are checkpointed every `checkpoint_interval` steps and
+    rebuilt on demand by replaying the deltas from the nearest checkpoint.
+
+    The object behaves like the old "steps" list: len(), indexing (including
+    negative indices) and iteration all produce the same step dicts, so
+    existing consumers keep working.
+
+    Parameters:
+        frame_count: number of frames
+        ref_bits: also track clock reference bits (Second Chance); replaying
+            them follows the clock rules, so no per-step bits are stored
+        trim_empty: report only the filled prefix of the frames, like
+            Optimal's growing memory list (otherwise -1 marks empty slots)
+        checkpoint_interval: steps between full state checkpoints
+    """
+
+    def __init__(self, frame_count, ref_bits=False, trim_empty=False, checkpoint_interval=256):
+        self.frame_count = frame_count
+        self.has_ref_bits = ref_bits
+        self.trim_empty = trim_empty
+        self.checkpoint_interval = checkpoint_interval
+
+        self.pages = array("q")
+        self.faults = bytearray()
+        self.slots = array("i")
+        self.evicted_slots = array("i")
+        self.evicted_pages = array("q")
+        self.page_faults = 0
+
+        # (frames, ref_bits, hand, filled, fault_count) before step i * interval
+        self._checkpoints = []
+        self._live = self._initial_state()
+        self._cursor = None     # last rebuilt (step, state) for sequential access
+
+    def _initial_state(self):
+        frames = array("q", [-1]) * self.frame_count
+        bits = bytearray(self.frame_count) if self.has_ref_bits else None
+        return [frames, bits, 0, 0]
+
+    def _copy_state(self, state):
+        frames, bits, hand, filled = state
+        return [array("q", frames), bytearray(bits) if bits is not None else None, hand, filled]
+
+    def _apply(self, state, fault, slot, page):
+        frames, bits, hand, filled = state
+        if fault:
+            if frames[slot] == -1:
+                filled += 1
+            frames[slot] = page
+            if bits is not None:
+                # The clock hand cleared every bit it passed on the way to slot
+                if slot == hand and bits[slot]:
+                    bits[:] = bytes(self.frame_count)   # went all the way round
+                elif slot >= hand:
+                    bits[hand:slot] = bytes(slot - hand)
+                else:
+                    bits[hand:] = bytes(self.frame_count - hand)
+                    bits[:slot] = bytes(slot)
+                hand = (slot + 1) % self.frame_count
+        if bits is not None:
+            bits[slot] = 1
+        state[2] = hand
+        state[3] = filled
+
+    def record(self, page, fault, slot, evicted=-1):
+        """Append one step: the requested page, whether it faulted, the slot
+        that was hit or loaded and the page evicted from it (-1 if none)."""
+        step = len(self.pages)
+        if step % self.checkpoint_interval == 0:
+            frames, bits, hand, filled = self._copy_state(self._live)
+            self._checkpoints.append((frames, bits, hand, filled, self.page_faults))
+
+        self.pages.append(page)
+        if step % 8 == 0:
+            self.faults.append(0)
+        if fault:
+            self.faults[step >> 3] |= 1 << (step & 7)
+            self.evicted_slots.append(slot)
+            self.evicted_pages.append(evicted)
+            self.page_faults += 1
+        self.slots.append(slot)
+        self._apply(self._live, fault, slot, page)
+
+    def is_fault(self, step):
+        return bool(self.faults[step >> 3] >> (step & 7) & 1)
+
+    @property
+    def hits(self):
+        return len(self.pages) - self.page_faults
+
+    def state_at(self, step):
+        """
+        Rebuild [frames, ref_bits, hand, filled] after `step`.
+
+        The returned state is shared with the cursor and must not be
+        modified. The cursor itself is never advanced in place: a fresh
+        state is built from a copy and swapped in, so the GUI thread can
+        step through a trace while a worker thread reads the same trace
+        (Replay.head / update).
+        """
+        cursor = self._cursor
+        start = (step // self.checkpoint_interval) * self.checkpoint_interval
+        if cursor is not None and start <= cursor[0] <= step:
+            state = self._copy_state(cursor[1])
+            begin = cursor[0] + 1
+        else:
+            frames, bits, hand, filled, _ = self._checkpoints[step // self.checkpoint_interval]
+            state = self._copy_state([frames, bits, hand, filled])
+            begin = start
+
+        pages, slots = self.pages, self.slots
+        for i in range(begin, step + 1):
+            self._apply(state, self.is_fault(i), slots[i], pages[i])
+        self._cursor = (step, state)
+        return state
+
+    def fault_count_before(self, step):
+        """Number of faults in steps 0 .. step-1."""
+        if step >= len(self.pages):
+            return self.page_faults
+        index = step // self.checkpoint_interval
+        count = self._checkpoints[index][4]
+        for i in range(index * self.checkpoint_interval, step):
+            count += self.is_fault(i)
+        return count
+
+    def state_before(self, step):
+        """A private copy of [frames, ref_bits, hand, filled] before `step`."""
+        if step == 0:
+            return self._initial_state()
+        return self._copy_state(self.state_at(step - 1))
+
+    def head(self, step):
+        """A new trace holding only the first `step` steps, ready to record more."""
+        trace = CompactTrace(self.frame_count, self.has_ref_bits, self.trim_empty, self.checkpoint_interval)
+        kept_faults = self.fault_count_before(step)
+        trace.pages = self.pages[:step]
+        trace.slots = self.slots[:step]
+        trace.faults = self.faults[:(step + 7) >> 3]
+        if step & 7:
+            trace.faults[-1] &= (1 << (step & 7)) - 1
+        trace.evicted_slots = self.evicted_slots[:kept_faults]
+        trace.evicted_pages = self.evicted_pages[:kept_faults]
+        trace.page_faults = kept_faults
+        # Checkpoint states are never modified in place, so they can be shared
+        trace._checkpoints = self._checkpoints[:-(-step // self.checkpoint_interval)]
+        trace._live = self.state_before(step)
+        return trace
+
+    def live_state_matches(self, other, step):
+        """Whether this trace's current state equals other's checkpoint before `step`."""
+        frames, bits, hand, _filled, _faults = other._checkpoints[step // self.checkpoint_interval]
+        live_frames, live_bits, live_hand, _live_filled = self._live
+        return live_frames == frames and live_bits == bits and live_hand == hand
+
+    def adopt_tail(self, other, step):
+        """
+        Append other's steps from `step` on, where this trace has exactly
+        `step` steps, step is a checkpoint boundary and both traces are in
+        the same state there (see live_state_matches).
+        """
+        faults_here = self.page_faults
+        faults_there = other.fault_count_before(step)
+        self.pages.extend(other.pages[step:])
+        self.slots.extend(other.slots[step:])
+        if step & 7 == 0:
+            self.faults[step >> 3:] = other.faults[step >> 3:]
+        else:
+            for i in range(step, len(other.pages)):
+                if i % 8 == 0:
+                    self.faults.append(0)
+                if other.is_fault(i):
+                    self.faults[i >> 3] |= 1 << (i & 7)
+        self.evicted_slots.extend(other.evicted_slots[faults_there:])
+        self.evicted_pages.extend(other.evicted_pages[faults_there:])
+        delta = faults_here - faults_there
+        for frames, bits, hand, filled, count in other._checkpoints[step // self.checkpoint_interval:]:
+            self._checkpoints.append((frames, bits, hand, filled, count + delta))
+        self.page_faults = faults_here + other.page_faults - faults_there
+        self._live = other._copy_state(other._live)
+        self._cursor = None
+
+    def __len__(self):
+        return len(self.pages)
+
+    def __getitem__(self, step):
+        if step < 0:
+            step += len(self.pages)
+        if not 0 <= step < len(self.pages):
+            raise IndexError("trace index out of range")
+
+        frames, bits, _hand, filled = self.state_at(step)
+        snapshot = {
+            "frame": frames[:filled].tolist() if self.trim_empty else frames.tolist()
+        }
+        if bits is not None:
+            snapshot["ref_bits"] = list(bits)
+        snapshot["page"] = self.pages[step]
+        snapshot["fault"] = self.is_fault(step)
+        return snapshot
+
+    def __iter__(self):
+        for step in range(len(self.pages)):
+            yield self[step]
+
+    def nbytes(self):
+        """Approximate memory held by the columns and checkpoints."""
+        total = (self.pages.itemsize * len(self.pages) + len(self.faults)
+                 + self.slots.itemsize * len(self.slots)
+                 + self.evicted_slots.itemsize * len(self.evicted_slots)
+                 + self.evicted_pages.itemsize * len(self.evicted_pages))
+        for frames, bits, _hand, _filled, _faults in self._checkpoints:
+            total += frames.itemsize * len(frames) + (len(bits) if bits is not None else 0)
+        return total
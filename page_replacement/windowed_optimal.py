@@ -0,0 +1,174 @@
+import heapq
+import sys
+from array import array
+from collections import deque
+from itertools import islice
+
+from page_replacement.optimal import optimal_page_replacement
+from page_replacement.results import collect_results, iter_steps
+
+NEVER = sys.maxsize
+TIE_BREAKS = ("lowest_slot", "fifo", "lru")
+
+
+def _run_windowed_optimal(pages, frame_count, window=1024, tie_break="lowest_slot"):
+    """
+    Optimal replacement with only `window` references of lookahead.
+
+    The next `window` references sit in a deque, and every page in it has a
+    deque of its positions there, so a page's next use is the head of its
+    deque and sliding the window is O(1). Resident pages live in a lazy
+    max-heap keyed by next use, as in _run_optimal. A page with no
+    reference inside the window counts as never used again; ties between
+    such pages go to tie_break:
+        "lowest_slot": the lowest frame slot (what exact OPT does)
+        "fifo": the page loaded longest ago
+        "lru": the page used longest ago
+
+    pages can be any iterable, including a stream over a trace file: only
+    the window is held in memory.
+
+    Yields (page, fault, slot, evicted, slot_pages) for every reference;
+    slot_pages holds only the filled frames, as Optimal's steps do.
+    """
+    if window < 0:
+        raise ValueError("window must be 0 or more.")
+    if tie_break not in TIE_BREAKS:
+        raise ValueError(f"Unknown tie break: {tie_break}")
+
+    stream = iter(pages)
+    lookahead = deque(islice(stream, window + 1))
+    positions = {}          # page → deque of its positions in the window
+    for i, page in enumerate(lookahead):
+        positions.setdefault(page, deque()).append(i)
+
+    slot_pages = array("q")     # grows as frames fill, like Optimal's memory list
+    slot_of = {}            # page → slot
+    slot_key = [None] * frame_count     # (next use, tie key) of each slot
+    heap = []               # (-next use, tie key, slot), may hold stale entries
+    max_heap_size = 2 * frame_count + 16
+    loaded = 0
+
+    i = 0
+    while lookahead:
+        page = lookahead.popleft()
+        occurrences = positions[page]
+        occurrences.popleft()
+        next_use = occurrences[0] if occurrences else NEVER
+        if not occurrences:
+            del positions[page]
+
+        slot = slot_of.get(page)
+        evicted = -1
+        fault = slot is None
+        if fault:
+            if loaded < frame_count:
+                slot = loaded
+                loaded += 1
+                slot_pages.append(page)
+            else:
+                # Farthest next use; among never-used pages the smallest tie key
+                while True:
+                    neg_next, tie, slot = heapq.heappop(heap)
+                    if slot_key[slot] == (-neg_next, tie):
+                        break
+                evicted = slot_pages[slot]
+                del slot_of[evicted]
+                slot_pages[slot] = page
+            slot_of[page] = slot
+            tie = slot if tie_break == "lowest_slot" else i
+        elif tie_break == "lru":
+            tie = i
+        else:
+            tie = slot_key[slot][1]
+
+        slot_key[slot] = (next_use, tie)
+        heapq.heappush(heap, (-next_use, tie, slot))
+
+        # Slide the window by one reference
+        incoming = next(stream, None)
+        if incoming is not None:
+            position = i + window + 1
+            lookahead.append(incoming)
+            occurrences = positions.get(incoming)
+            if occurrences is None:
+                positions[incoming] = deque((position,))
+                held = slot_of.get(incoming)
+                if held is not None:
+                    # A resident page that looked unused now has a next use
+                    slot_key[held] = (position, slot_key[held][1])
+                    heapq.heappush(heap, (-position, slot_key[held][1], held))
+            else:
+                occurrences.append(position)
+
+        if len(heap) > max_heap_size:
+            heap = [(-slot_key[s][0], slot_key[s][1], s) for s in range(loaded)]
+            heapq.heapify(heap)
+
+        i += 1
+        yield page, fault, slot, evicted, slot_pages
+
+
+def iter_windowed_optimal_steps(pages, frame_count, window=1024, tie_break="lowest_slot", verbose=False):
+    """Stream the windowed Optimal simulation one step dict at a time."""
+    return iter_steps(_run_windowed_optimal(pages, frame_count, window, tie_break), verbose)
+
+
+def windowed_optimal_page_replacement(pages, frame_count, window=1024, tie_break="lowest_slot",
+                                      summary_only=False, verbose=True, compact_trace=False):
+    """
+    Simulate Optimal page replacement with a bounded lookahead.
+
+    Parameters:
+        pages: iterable of page numbers (reference string or stream)
+        frame_count: number of frames
+        window: future references looked at for each decision; memory is
+            O(window + frame_count)
+        tie_break: "lowest_slot", "fifo" or "lru", for pages not seen in
+            the window
+        summary_only / verbose / compact_trace: as for the other algorithms
+
+    With window >= len(pages) - 1 and "lowest_slot" this matches
+    optimal_page_replacement step for step (same faults and frames).
+
+    Returns:
+        dict with "steps", "page_faults" and "hits"
+        (only "page_faults" and "hits" when summary_only is set)
+    """
+    events = _run_windowed_optimal(pages, frame_count, window, tie_break)
+    return collect_results(events, frame_count, summary_only, verbose, compact_trace, trim_empty=True)
+
+
+def window_error_report(pages, frame_count, windows=(0, 16, 64, 256, 1024, 4096), tie_break="lowest_slot"):
+    """
+    How far windowed Optimal is from exact Optimal for each window size.
+
+    Run it on a sample that fits in memory to choose a window for the full
+    trace. pages must be a sequence (exact OPT needs all of it).
+
+    Returns:
+        list of dicts with "window", "page_faults", "exact_faults",
+        "extra_faults" and "error" (extra faults / exact faults)
+    """
+    exact = optimal_page_replacement(pages, frame_count, summary_only=True, verbose=False)["page_faults"]
+    report = []
+    for window in windows:
+        faults = windowed_optimal_page_replacement(
+            pages, frame_count, window, tie_break, summary_only=True, verbose=False)["page_faults"]
+        report.append({
+            "window": window,
+            "page_faults": faults,
+            "exact_faults": exact,
+            "extra_faults": faults - exact,
+            "error": (faults - exact) / exact if exact else 0.0,
+        })
+    return report
+
+
+if __name__ == "__main__":
+    ref_str = input("Enter reference string (space-separated): ").strip()
+    reference_string = list(map(int, ref_str.split()))
+    frame_count = int(input("Enter number of frames: "))
+    window = int(input("Enter lookahead window: "))
+
+    windowed_optimal_page_replacement(reference_string, frame_count, window)
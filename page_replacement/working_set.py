@@ -0,0 +1,88 @@
+from array import array
+from collections import deque
+
+from page_replacement.results import collect_variable_results, iter_steps
+
+
+def _run_working_set(pages, window):
+    """
+    Working Set engine: the resident set is every page referenced in the
+    last `window` references.
+
+    The last `window` references sit in a deque and each resident page
+    keeps its last reference time, so when a reference slides out of the
+    window its page leaves only if that was its latest use: O(1) per
+    reference. Pages keep their slot while resident; a page that leaves
+    frees its slot (set to -1) for the next fault, and the frame array only
+    grows when no freed slot is left.
+
+    Yields (page, fault, slot, evicted, slot_pages, resident) for every
+    reference, where evicted is always -1 (pages leave by ageing out, not on
+    a fault) and resident is the resident set size after the reference.
+    """
+    if window <= 0:
+        raise ValueError("window must be greater than 0.")
+
+    slot_pages = array("q")
+    free = []               # vacated slots, reused last-in first-out
+    slot_of = {}            # page → slot
+    last_ref = {}           # page → time of its latest reference
+    recent = deque()        # the last `window` references
+
+    for t, page in enumerate(pages):
+        slot = slot_of.get(page)
+        fault = slot is None
+        if fault:
+            if free:
+                slot = free.pop()
+            else:
+                slot = len(slot_pages)
+                slot_pages.append(-1)
+            slot_pages[slot] = page
+            slot_of[page] = slot
+        last_ref[page] = t
+
+        recent.append(page)
+        if len(recent) > window:
+            old = recent.popleft()
+            if last_ref[old] == t - window:
+                # That was old's latest use, so it leaves the working set
+                del last_ref[old]
+                gone = slot_of.pop(old)
+                slot_pages[gone] = -1
+                free.append(gone)
+
+        yield page, fault, slot, -1, slot_pages, len(slot_of)
+
+
+def iter_working_set_steps(pages, window, verbose=False):
+    """Stream the Working Set simulation one step dict at a time."""
+    events = (event[:5] for event in _run_working_set(pages, window))
+    return iter_steps(events, verbose)
+
+
+def working_set_page_replacement(pages, window, summary_only=False, verbose=True, compact_trace=False):
+    """
+    Simulate Working Set replacement with window τ = `window` references.
+
+    There is no fixed frame count: a reference faults when its page was not
+    used in the previous `window` references, and the resident set is
+    exactly the pages used in the last `window` references. Each step's
+    "frame" list holds the resident pages in stable slots, padded with -1
+    where a page has left.
+
+    Returns:
+        dict with "steps", "page_faults", "hits", "resident_set_sizes",
+        "mean_resident_set_size" and "max_resident_set_size"
+        ("steps" and "resident_set_sizes" are left out when summary_only
+        is set)
+    """
+    return collect_variable_results(_run_working_set(pages, window), summary_only, verbose, compact_trace)
+
+
+if __name__ == "__main__":
+    ref_str = input("Enter reference string (space-separated): ").strip()
+    reference_string = list(map(int, ref_str.split()))
+    window = int(input("Enter working set window: "))
+
+    working_set_page_replacement(reference_string, window)
@@ -0,0 +1,304 @@
+"""
+Straightforward reference implementations the optimised simulators are
+checked against. optimal and second_chance are the original engines (minus
+their prints); the rest follow the textbook definitions as literally as
+possible.
+"""
+
+
+def optimal(pages, frames_count):
+    memory = []
+    page_faults = 0
+    hits = 0
+    simulation_steps = []
+
+    for i in range(len(pages)):
+        page = pages[i]
+        if page in memory:
+            hits += 1
+            simulation_steps.append({"frame": memory.copy(), "page": page, "fault": False})
+            continue
+
+        if len(memory) < frames_count:
+            memory.append(page)
+        else:
+            future = pages[i + 1:]
+            index_to_replace = -1
+            farthest_use = -1
+            for mem_index in range(len(memory)):
+                mem_page = memory[mem_index]
+                if mem_page not in future:
+                    index_to_replace = mem_index
+                    break
+                next_use = future.index(mem_page)
+                if next_use > farthest_use:
+                    farthest_use = next_use
+                    index_to_replace = mem_index
+            memory[index_to_replace] = page
+        page_faults += 1
+        simulation_steps.append({"frame": memory.copy(), "page": page, "fault": True})
+
+    return {"steps": simulation_steps, "page_faults": page_faults, "hits": hits}
+
+
+def second_chance(pages, frame_count):
+    frames = [[-1, 0] for _ in range(frame_count)]
+    pointer = 0
+    page_faults = 0
+    hits = 0
+    simulation_steps = []
+
+    for page in pages:
+        in_memory = False
+        for frame in frames:
+            if frame[0] == page:
+                frame[1] = 1
+                in_memory = True
+                hits += 1
+                break
+
+        if not in_memory:
+            while True:
+                current_page, ref_bit = frames[pointer]
+                if ref_bit == 0:
+                    frames[pointer] = [page, 1]
+                    pointer = (pointer + 1) % frame_count
+                    page_faults += 1
+                    break
+                frames[pointer][1] = 0
+                pointer = (pointer + 1) % frame_count
+
+        simulation_steps.append({
+            "frame": [slot[0] for slot in frames],
+            "ref_bits": [slot[1] for slot in frames],
+            "page": page,
+            "fault": not in_memory,
+        })
+
+    return {"steps": simulation_steps, "page_faults": page_faults, "hits": hits}
+
+
+def lru_faults(pages, frame_count):
+    memory = []
+    faults = 0
+    for page in pages:
+        if page in memory:
+            memory.remove(page)
+        else:
+            faults += 1
+            if len(memory) == frame_count:
+                memory.pop(0)
+        memory.append(page)
+    return faults
+
+
+def lfu_faults(pages, frame_count):
+    # Least frequently used, least recently used among equal counts
+    counts = {}
+    last = {}
+    faults = 0
+    for t, page in enumerate(pages):
+        if page in counts:
+            counts[page] += 1
+        else:
+            faults += 1
+            if len(counts) == frame_count:
+                victim = min(counts, key=lambda q: (counts[q], last[q]))
+                del counts[victim]
+            counts[page] = 1
+        last[page] = t
+    return faults
+
+
+def arc_faults(pages, c):
+    # Megiddo & Modha's ARC, with plain lists (LRU end first)
+    t1, t2, b1, b2 = [], [], [], []
+    p = 0
+    faults = 0
+
+    def replace(x):
+        if t1 and (len(t1) > p or (x in b2 and len(t1) == p)):
+            b1.append(t1.pop(0))
+        else:
+            b2.append(t2.pop(0))
+
+    for x in pages:
+        if x in t1:
+            t1.remove(x)
+            t2.append(x)
+            continue
+        if x in t2:
+            t2.remove(x)
+            t2.append(x)
+            continue
+        faults += 1
+        if x in b1:
+            p = min(c, p + max(len(b2) / len(b1), 1))
+            replace(x)
+            b1.remove(x)
+            t2.append(x)
+        elif x in b2:
+            p = max(0, p - max(len(b1) / len(b2), 1))
+            replace(x)
+            b2.remove(x)
+            t2.append(x)
+        else:
+            l1 = len(t1) + len(b1)
+            l2 = len(t2) + len(b2)
+            if l1 == c:
+                if len(t1) < c:
+                    b1.pop(0)
+                    replace(x)
+                else:
+                    t1.pop(0)
+            elif l1 < c and l1 + l2 >= c:
+                if l1 + l2 == 2 * c:
+                    b2.pop(0)
+                replace(x)
+            t1.append(x)
+    return faults
+
+
+def windowed_optimal_faults(pages, frame_count, window, tie_break):
+    frames = []
+    loaded = {}
+    last = {}
+    faults = 0
+    for i, page in enumerate(pages):
+        if page in frames:
+            last[page] = i
+            continue
+        faults += 1
+        if len(frames) < frame_count:
+            frames.append(page)
+        else:
+            ahead = pages[i + 1:i + 1 + window]
+
+            def key(slot):
+                q = frames[slot]
+                next_use = ahead.index(q) if q in ahead else len(pages)
+                tie = slot if tie_break == "lowest_slot" else (loaded[q] if tie_break == "fifo" else last[q])
+                return (-next_use, tie)
+
+            frames[min(range(len(frames)), key=key)] = page
+        loaded[page] = i
+        last[page] = i
+    return faults
+
+
+def aging(pages, frame_count, register_bits, tick_interval):
+    """(faults, registers after every step) with a full register copy per step."""
+    top = 1 << (register_bits - 1)
+    frames = [-1] * frame_count
+    registers = [0] * frame_count
+    bits = [0] * frame_count
+    faults = 0
+    history = []
+    for i, page in enumerate(pages):
+        if page in frames:
+            bits[frames.index(page)] = 1
+        else:
+            faults += 1
+            if -1 in frames:
+                slot = frames.index(-1)
+            else:
+                slot = min(range(frame_count), key=lambda s: (registers[s], s))
+            frames[slot] = page
+            registers[slot] = top
+            bits[slot] = 0
+        if (i + 1) % tick_interval == 0:
+            registers = [(r >> 1) | (top if b else 0) for r, b in zip(registers, bits)]
+            bits = [0] * frame_count
+        history.append(list(registers))
+    return faults, history
+
+
+def working_set(pages, window):
+    """(faults, resident set size after each reference)."""
+    faults = 0
+    sizes = []
+    for t, page in enumerate(pages):
+        if page not in pages[max(0, t - window):t]:
+            faults += 1
+        sizes.append(len(set(pages[max(0, t - window + 1):t + 1])))
+    return faults, sizes
+
+
+def pff(pages, threshold):
+    """(faults, resident set size after each reference)."""
+    resident = set()
+    last = {}
+    last_fault = None
+    faults = 0
+    sizes = []
+    for t, page in enumerate(pages):
+        if page not in resident:
+            faults += 1
+            if last_fault is not None and t - last_fault > threshold:
+                resident = {q for q in resident if last[q] >= last_fault}
+            last_fault = t
+            resident.add(page)
+        last[page] = t
+        sizes.append(len(resident))
+    return faults, sizes
+
+
+def sstf(requests, head):
+    pending = list(requests)
+    order = [head]
+    total = 0
+    current = head
+    while pending:
+        r = min(pending, key=lambda x: (abs(x - current), x))
+        pending.remove(r)
+        order.append(r)
+        total += abs(current - r)
+        current = r
+    return order, total
+
+
+def cscan(requests, head, disk_size):
+    requests = sorted(requests)
+    left = [r for r in requests if r < head]
+    right = [r for r in requests if r >= head]
+    order = [head]
+    total = 0
+    current = head
+    for r in right:
+        order.append(r)
+        total += abs(current - r)
+        current = r
+    if left:
+        if current != disk_size - 1:
+            order.append(disk_size - 1)
+            total += abs(current - (disk_size - 1))
+            current = disk_size - 1
+        order.append(0)
+        total += current
+        current = 0
+    for r in left:
+        order.append(r)
+        total += abs(current - r)
+        current = r
+    return order, total
+
+
+def clook(requests, head):
+    requests = sorted(requests)
+    left = [r for r in requests if r < head]
+    right = [r for r in requests if r >= head]
+    order = [head]
+    total = 0
+    current = head
+    for r in right:
+        order.append(r)
+        total += abs(current - r)
+        current = r
+    if left:
+        total += abs(current - left[0])
+        current = left[0]
+        for r in left:
+            order.append(r)
+            total += abs(current - r)
+            current = r
+    return order, total
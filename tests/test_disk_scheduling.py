@@ -0,0 +1,117 @@
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from disk_scheduling import DISK_ALGORITHMS, run_disk_algorithm
+from disk_scheduling.batch import batch_schedule
+from disk_scheduling.c_look import clook_schedule
+from disk_scheduling.c_scan import cscan_schedule
+from disk_scheduling.online import online_schedule
+from disk_scheduling.sstf import sstf_schedule
+from tests import reference
+
+
+def random_queues(seed, count, max_len=40, disk_size=200):
+    rng = random.Random(seed)
+    for _ in range(count):
+        n = rng.randrange(0, max_len)
+        requests = [rng.randrange(disk_size) for _ in range(n)]
+        yield requests, rng.randrange(disk_size), disk_size
+
+
+def test_cscan_matches_baseline():
+    for requests, head, disk_size in random_queues(1, 300):
+        order, total = cscan_schedule(requests, head, disk_size)
+        assert (list(order), total) == reference.cscan(requests, head, disk_size)
+
+
+def test_clook_matches_baseline():
+    for requests, head, _ in random_queues(2, 300):
+        order, total = clook_schedule(requests, head)
+        assert (list(order), total) == reference.clook(requests, head)
+
+
+def test_sstf_matches_reference():
+    for requests, head, _ in random_queues(3, 300):
+        order, total = sstf_schedule(requests, head)
+        assert (list(order), total) == reference.sstf(requests, head)
+
+
+def test_sstf_breaks_ties_towards_lower_cylinder():
+    assert sstf_schedule([40, 60], 50) == ([50, 40, 60], 30)
+
+
+@pytest.mark.parametrize("algorithm", ["C-SCAN", "C-LOOK"])
+def test_batch_matches_single_queue(algorithm):
+    queues = list(random_queues(4, 200))
+    requests_list = [q[0] for q in queues]
+    heads = [q[1] for q in queues]
+    disk_sizes = [q[2] for q in queues]
+    result = batch_schedule(requests_list, heads, disk_sizes, algorithm)
+    for (requests, head, disk_size), order, total in zip(queues, result["seek_orders"], result["total_seeks"]):
+        expected_order, expected_total = run_disk_algorithm(algorithm, requests, head, disk_size)
+        assert order.tolist() == list(expected_order)
+        assert total == expected_total
+
+
+def test_batch_accepts_numpy_queues():
+    queue = np.array([98, 183, 37, 122, 14, 124, 65, 67])
+    result = batch_schedule([queue], [53], [200])
+    assert result["seek_orders"][0].tolist() == list(cscan_schedule(queue.tolist(), 53, 200)[0])
+
+
+def test_batch_handles_empty_input():
+    assert batch_schedule([], [], [])["seek_orders"] == []
+    result = batch_schedule([[], []], [5, 0], [10, 10])
+    assert [o.tolist() for o in result["seek_orders"]] == [[5], [0]]
+    assert result["total_seeks"].tolist() == [0, 0]
+
+
+def test_batch_rejects_bad_input():
+    with pytest.raises(ValueError):
+        batch_schedule([[1, 2]], [-1], [10])
+    with pytest.raises(ValueError):
+        batch_schedule([[1, 2]], [10], [10])
+    with pytest.raises(ValueError):
+        batch_schedule([[1, -2]], [0], [10])
+    with pytest.raises(ValueError):
+        batch_schedule([[1]], [0], algorithm="C-SCAN")
+    with pytest.raises(ValueError):
+        batch_schedule([[1]], [0, 1], [10])
+
+
+@pytest.mark.parametrize("algorithm", ["C-SCAN", "C-LOOK"])
+def test_online_with_everything_at_time_zero_matches_offline(algorithm):
+    for requests, head, disk_size in random_queues(5, 200):
+        result = online_schedule([(0.0, r) for r in requests], disk_size, head, algorithm)
+        expected_order, expected_total = run_disk_algorithm(algorithm, requests, head, disk_size)
+        assert list(result["seek_order"]) == list(expected_order)
+        assert result["total_seek"] == expected_total
+        assert len(result["wait_times"]) == len(requests)
+
+
+def test_online_picks_up_requests_on_the_way():
+    # The head passes 30 at t=30, after the request arrives at t=10
+    result = online_schedule([(0.0, 50), (10.0, 30)], 100, head=0, algorithm="C-LOOK")
+    assert list(result["seek_order"]) == [0, 30, 50]
+    assert list(result["wait_times"]) == [50.0, 20.0]
+
+
+def test_online_rejects_unsorted_arrivals():
+    with pytest.raises(ValueError):
+        online_schedule([(5.0, 1), (1.0, 2)], 10)
+
+
+def test_every_registered_scheduler_serves_every_request():
+    for requests, head, disk_size in random_queues(6, 50):
+        for name in DISK_ALGORITHMS:
+            order, total = run_disk_algorithm(name, requests, head, disk_size)
+            order = list(order)
+            assert order[0] == head
+            served = Counter(order[1:])
+            served.subtract(requests)
+            # Sweeping schedulers may add disk-end markers, never drop a request
+            assert min(served.values(), default=0) >= 0
+            assert total == sum(abs(a - b) for a, b in zip(order, order[1:]))
@@ -0,0 +1,175 @@
+import random
+
+import pytest
+
+from page_replacement import PAGE_ALGORITHMS, VARIABLE_ALGORITHMS
+from page_replacement.aging import aging_page_replacement
+from page_replacement.arc import arc_page_replacement
+from page_replacement.lfu import lfu_page_replacement
+from page_replacement.lru import lru_page_replacement
+from page_replacement.optimal import optimal_page_replacement
+from page_replacement.pff import pff_page_replacement
+from page_replacement.replay import Replay
+from page_replacement.second_chance import second_chance_page_replacement
+from page_replacement.sweep import fault_curve
+from page_replacement.windowed_optimal import windowed_optimal_page_replacement
+from page_replacement.working_set import working_set_page_replacement
+from tests import reference
+
+
+def random_cases(seed, count, max_len=80, max_page=10, max_frames=6):
+    rng = random.Random(seed)
+    for _ in range(count):
+        n = rng.randrange(0, max_len)
+        pages = [rng.randrange(max_page) for _ in range(n)]
+        yield pages, rng.randrange(1, max_frames)
+
+
+def frames_of(result):
+    return [step["frame"] for step in result["steps"]]
+
+
+def test_optimal_matches_baseline():
+    for pages, frames in random_cases(1, 300):
+        result = optimal_page_replacement(pages, frames, verbose=False)
+        expected = reference.optimal(pages, frames)
+        assert result["page_faults"] == expected["page_faults"]
+        assert result["hits"] == expected["hits"]
+        assert [(s["page"], s["fault"]) for s in result["steps"]] == \
+               [(s["page"], s["fault"]) for s in expected["steps"]]
+        assert frames_of(result) == frames_of(expected)
+
+
+def test_second_chance_matches_baseline():
+    for pages, frames in random_cases(2, 300):
+        result = second_chance_page_replacement(pages, frames, verbose=False)
+        expected = reference.second_chance(pages, frames)
+        assert result["page_faults"] == expected["page_faults"]
+        assert result["hits"] == expected["hits"]
+        assert frames_of(result) == frames_of(expected)
+        assert [s["ref_bits"] for s in result["steps"]] == [s["ref_bits"] for s in expected["steps"]]
+
+
+@pytest.mark.parametrize("simulate, naive", [
+    (lru_page_replacement, reference.lru_faults),
+    (lfu_page_replacement, reference.lfu_faults),
+    (arc_page_replacement, reference.arc_faults),
+])
+def test_fault_counts_match_reference(simulate, naive):
+    for pages, frames in random_cases(3, 300):
+        result = simulate(pages, frames, summary_only=True, verbose=False)
+        assert result["page_faults"] == naive(pages, frames)
+        assert result["hits"] == len(pages) - result["page_faults"]
+
+
+@pytest.mark.parametrize("name", sorted(PAGE_ALGORITHMS))
+def test_compact_trace_matches_step_list(name):
+    simulate = PAGE_ALGORITHMS[name]
+    for pages, frames in random_cases(4, 40, max_len=600):
+        full = simulate(pages, frames, verbose=False)
+        compact = simulate(pages, frames, verbose=False, compact_trace=True)
+        assert compact["page_faults"] == full["page_faults"]
+        assert len(compact["steps"]) == len(full["steps"])
+        assert list(compact["steps"]) == full["steps"]
+
+
+@pytest.mark.parametrize("name", sorted(VARIABLE_ALGORITHMS))
+def test_variable_algorithms_refuse_compact_trace(name):
+    with pytest.raises(ValueError):
+        VARIABLE_ALGORITHMS[name]([1, 2, 1], 2, verbose=False, compact_trace=True)
+
+
+@pytest.mark.parametrize("tie_break", ["lowest_slot", "fifo", "lru"])
+def test_windowed_optimal_matches_reference(tie_break):
+    rng = random.Random(6)
+    for pages, frames in random_cases(6, 300, max_len=120):
+        window = rng.randrange(0, 20)
+        result = windowed_optimal_page_replacement(iter(pages), frames, window, tie_break,
+                                                   summary_only=True, verbose=False)
+        assert result["page_faults"] == reference.windowed_optimal_faults(pages, frames, window, tie_break)
+
+
+def test_windowed_optimal_with_full_window_is_optimal():
+    for pages, frames in random_cases(7, 200):
+        result = windowed_optimal_page_replacement(pages, frames, max(len(pages), 1), verbose=False)
+        expected = optimal_page_replacement(pages, frames, verbose=False)
+        assert result["page_faults"] == expected["page_faults"]
+        assert frames_of(result) == frames_of(expected)
+
+
+def test_windowed_optimal_reports_only_filled_frames():
+    result = windowed_optimal_page_replacement([1, 2, 1, 3], 3, verbose=False)
+    assert frames_of(result) == [[1], [1, 2], [1, 2], [1, 2, 3]]
+
+
+@pytest.mark.parametrize("algorithm", ["Optimal", "LRU", "LFU", "Second Chance", "Clock", "ARC",
+                                       "Aging", "Windowed Optimal"])
+def test_fault_curve_matches_single_runs(algorithm):
+    simulate = PAGE_ALGORITHMS[algorithm]
+    for pages, max_frames in random_cases(8, 15, max_len=200, max_page=14, max_frames=9):
+        curve = fault_curve(pages, max_frames, algorithm)
+        expected = [simulate(pages, f, summary_only=True, verbose=False)["page_faults"]
+                    for f in range(1, max_frames + 1)]
+        assert curve["page_faults"] == expected
+        assert curve["hits"] == [len(pages) - f for f in expected]
+
+
+def test_fault_curve_finds_belady_anomaly():
+    pages = [1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5]
+    # FIFO order with no second chances: Second Chance degrades to FIFO here
+    assert fault_curve(pages, 4, "Second Chance")["page_faults"][2:] == [9, 10]
+    assert 4 in fault_curve(pages, 4, "Second Chance")["belady_anomalies"]
+
+
+@pytest.mark.parametrize("algorithm", ["Optimal", "Second Chance"])
+def test_replay_edits_match_full_rerun(algorithm):
+    rng = random.Random(9)
+    for pages, frames in random_cases(9, 20, max_len=400):
+        if not pages:
+            continue
+        replay = Replay(pages, frames, algorithm, checkpoint_interval=16)
+        for _ in range(5):
+            position = rng.randrange(len(pages))
+            pages[position] = rng.randrange(10)
+            replay.set_page(position, pages[position])
+            expected = PAGE_ALGORITHMS[algorithm](pages, frames, verbose=False)
+            assert replay.result()["page_faults"] == expected["page_faults"]
+            assert [replay.step(t) for t in range(len(pages))] == expected["steps"]
+
+
+@pytest.mark.parametrize("register_bits, tick_interval", [(8, 1), (3, 1), (8, 3), (64, 2)])
+def test_aging_matches_dense_reference(register_bits, tick_interval):
+    rng = random.Random(10)
+    for pages, frames in random_cases(10, 60, max_len=300):
+        result = aging_page_replacement(pages, frames, register_bits, tick_interval, verbose=False)
+        faults, registers = reference.aging(pages, frames, register_bits, tick_interval)
+        assert result["page_faults"] == faults
+        history = result["aging_registers"]
+        assert len(history) == len(pages)
+        # Random order exercises both checkpoint restarts and the cursor
+        steps = list(range(len(pages)))
+        rng.shuffle(steps)
+        for step in steps + sorted(steps):
+            assert list(history.registers_at(step)) == registers[step]
+
+
+def test_aging_history_rejects_out_of_range_steps():
+    history = aging_page_replacement([1, 2, 3], 2, verbose=False)["aging_registers"]
+    with pytest.raises(IndexError):
+        history.registers_at(3)
+
+
+def test_working_set_matches_reference():
+    for pages, window in random_cases(11, 300, max_frames=12):
+        result = working_set_page_replacement(pages, window, verbose=False)
+        faults, sizes = reference.working_set(pages, window)
+        assert result["page_faults"] == faults
+        assert list(result["resident_set_sizes"]) == sizes
+
+
+def test_pff_matches_reference():
+    for pages, threshold in random_cases(12, 300, max_frames=8):
+        result = pff_page_replacement(pages, threshold, verbose=False)
+        faults, sizes = reference.pff(pages, threshold)
+        assert result["page_faults"] == faults
+        assert list(result["resident_set_sizes"]) == sizes
@@ -0,0 +1,54 @@
+import os
+from array import array
+
+import numpy as np
+
+from utils.result_cache import HASH_CHUNK, ResultCache, cache_key
+
+
+def test_key_ignores_the_container_type():
+    values = list(range(HASH_CHUNK + 10))
+    key = cache_key("LRU", {"frames": 3}, values)
+    assert cache_key("LRU", {"frames": 3}, array("q", values)) == key
+    assert cache_key("LRU", {"frames": 3}, np.array(values, dtype=np.int64)) == key
+    assert cache_key("LRU", {"frames": 3}, np.array(values, dtype=np.int32)) == key
+    assert cache_key("LRU", {"frames": 3}, iter(values)) == key
+    assert cache_key("LRU", {"frames": 4}, values) != key
+    assert cache_key("LFU", {"frames": 3}, values) != key
+    assert cache_key("LRU", {"frames": 3}, values[:-1]) != key
+
+
+def test_values_outside_int64_give_no_key_and_miss():
+    assert cache_key("LRU", {}, [1, 2**63]) is None
+    cache = ResultCache()
+    calls = []
+    for _ in range(2):
+        cache.call("LRU", {}, [1, 2**63], lambda: calls.append(1) or "result")
+    assert len(calls) == 2
+    assert cache.hits == 0
+
+
+def test_results_survive_on_disk(tmp_path):
+    first = ResultCache(directory=str(tmp_path))
+    key = cache_key("LRU", {}, [1, 2, 3])
+    first.put(key, {"page_faults": 3})
+    second = ResultCache(directory=str(tmp_path))
+    assert second.get(key) == {"page_faults": 3}
+    assert second.hits == 1
+
+
+def test_oversized_results_stay_in_memory(tmp_path):
+    cache = ResultCache(directory=str(tmp_path), max_disk_bytes=64)
+    key = cache_key("LRU", {}, [1])
+    cache.put(key, list(range(1000)))
+    assert cache.get(key) == list(range(1000))
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".pkl")]
+
+
+def test_memory_is_bounded():
+    cache = ResultCache(max_entries=2)
+    keys = [cache_key("LRU", {}, [i]) for i in range(3)]
+    for i, key in enumerate(keys):
+        cache.put(key, i)
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[2]) == 2
@@ -0,0 +1,43 @@
+import numpy as np
+
+from utils.validator import validate_reference_array, validate_request_array, validate_reference_string
+
+
+def test_reference_array_matches_list_parser():
+    ok, pages = validate_reference_array("7 0 1 2 0 3")
+    assert ok
+    assert pages.dtype == np.int64
+    assert pages.tolist() == validate_reference_string("7 0 1 2 0 3")[1]
+
+
+def test_values_outside_int64_are_rejected_not_clamped():
+    ok, message = validate_reference_array("1 99999999999999999999 2")
+    assert not ok
+    assert "index 1" in message
+    ok, message = validate_request_array("3 -99999999999999999999", 10)
+    assert not ok
+    assert "index 1" in message
+
+
+def test_int64_limits_are_accepted():
+    ok, pages = validate_reference_array(f"1 {2**63 - 1}")
+    assert ok
+    assert pages.tolist() == [1, 2**63 - 1]
+
+
+def test_slow_path_accepts_what_int_accepts():
+    ok, pages = validate_reference_array("1_000 2")
+    assert ok
+    assert pages.tolist() == [1000, 2]
+
+
+def test_bad_tokens_report_their_index():
+    ok, message = validate_reference_array("1 2 x 4")
+    assert not ok
+    assert "index 2" in message
+    ok, message = validate_reference_array("1 -5")
+    assert not ok
+    assert "index 1: -5" in message
+    ok, message = validate_request_array("1 2 300", 200)
+    assert not ok
+    assert "index 2: 300" in message
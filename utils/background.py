@@ -0,0 +1,119 @@
+import queue
+import threading
+
+from page_replacement.observer import Observer
+
+
+class Cancelled(Exception):
+    """Raised inside a background job once cancel() has been called."""
+
+
+class BackgroundTask:
+    """
+    Run work(report, is_cancelled) on a worker thread and hand the outcome
+    back to the Tk thread.
+
+    report(done, total) may be called from the worker as often as it likes;
+    the latest value reaches on_progress on the Tk thread. Exactly one of
+    on_done(result), on_cancel() or on_error(exception) is then called on
+    the Tk thread via widget.after(), never from the worker.
+
+    cancel() sets a flag the work function polls through is_cancelled() (or
+    raises Cancelled through progress_pages / ProgressObserver). Work that
+    cannot be interrupted still finishes, but its result is dropped.
+    """
+
+    def __init__(self, widget, work, on_done, on_progress=None, on_cancel=None, on_error=None, poll_ms=50):
+        self.widget = widget
+        self.work = work
+        self.on_done = on_done
+        self.on_progress = on_progress
+        self.on_cancel = on_cancel
+        self.on_error = on_error
+        self.poll_ms = poll_ms
+        self._cancelled = threading.Event()
+        self._updates = queue.Queue()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self.widget.after(self.poll_ms, self._poll)
+        return self
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _report(self, done, total):
+        self._updates.put(("progress", (done, total)))
+
+    def _run(self):
+        try:
+            result = self.work(self._report, self._cancelled.is_set)
+        except Cancelled:
+            self._updates.put(("cancelled", None))
+        except Exception as e:
+            self._updates.put(("error", e))
+        else:
+            self._updates.put(("cancelled", None) if self._cancelled.is_set() else ("done", result))
+
+    def _poll(self):
+        # Worker thread → UI thread hand-off
+        progress = None
+        while not self._updates.empty():
+            kind, payload = self._updates.get()
+            if kind == "progress":
+                progress = payload
+                continue
+            if kind == "done":
+                self.on_done(payload)
+            elif kind == "cancelled":
+                if self.on_cancel is not None:
+                    self.on_cancel()
+            elif self.on_error is not None:
+                self.on_error(payload)
+            return
+        if progress is not None and self.on_progress is not None:
+            self.on_progress(*progress)
+        self.widget.after(self.poll_ms, self._poll)
+
+
+def progress_pages(pages, report, is_cancelled, chunk_size=4096):
+    """
+    Iterate over pages in chunks, reporting progress and checking for
+    cancellation between chunks, so iterating simulators can be watched at
+    no per-reference cost.
+    """
+    total = len(pages)
+    for start in range(0, total, chunk_size):
+        if is_cancelled():
+            raise Cancelled()
+        yield from pages[start:start + chunk_size]
+        report(min(start + chunk_size, total), total)
+
+
+class ProgressObserver(Observer):
+    """
+    Same reporting for simulators that index pages (Optimal), via the step
+    hook. Unlike progress_pages this is not free: passing any observer turns
+    on every hook in _run_optimal for every reference, which costs a few
+    percent of the run time.
+    """
+
+    def __init__(self, total, report, is_cancelled, chunk_size=4096):
+        self.total = total
+        self.report = report
+        self.is_cancelled = is_cancelled
+        self.chunk_size = chunk_size
+        self.done = 0
+
+    def step(self, page, fault, slot, evicted, state):
+        self.done += 1
+        if self.done % self.chunk_size == 0:
+            if self.is_cancelled():
+                raise Cancelled()
+            self.report(self.done, self.total)
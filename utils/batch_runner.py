@@ -0,0 +1,124 @@
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+
+def page_jobs(traces, algorithms, frame_counts):
+    """
+    Grid of page-replacement jobs.
+
+    traces maps a trace name to either a list of page numbers or a path to a
+    text trace file (loaded inside the worker, so big traces are not pickled
+    once per job).
+    """
+    return [
+        {"kind": "page", "trace": name, "data": data, "algorithm": algo, "frames": frames}
+        for name, data in traces.items()
+        for algo in algorithms
+        for frames in frame_counts
+    ]
+
+
+def disk_jobs(queues, algorithms, heads, disk_sizes):
+    """Grid of disk-scheduling jobs; queues maps a name to a request list or path."""
+    return [
+        {"kind": "disk", "trace": name, "data": data, "algorithm": algo, "head": head, "disk_size": size}
+        for name, data in queues.items()
+        for algo in algorithms
+        for head in heads
+        for size in disk_sizes
+        if head < size
+    ]
+
+
+def _load(data):
+    if isinstance(data, str):
+        from utils.trace_loader import load_trace
+        return load_trace(data)
+    return data
+
+
+def run_job(job):
+    """
+    Run one job and return a row shaped like the GUI's vm_results /
+    disk_results entries, plus the trace name and parameters.
+    """
+    if job["kind"] == "page":
+        from page_replacement import PAGE_ALGORITHMS
+
+        pages = _load(job["data"])
+        result = PAGE_ALGORITHMS[job["algorithm"]](pages, job["frames"], summary_only=True, verbose=False)
+        return {
+            "trace": job["trace"],
+            "algorithm": job["algorithm"],
+            "frames": job["frames"],
+            "faults": result["page_faults"],
+            "hits": result["hits"],
+        }
+
+    from disk_scheduling import run_disk_algorithm
+
+    requests = list(_load(job["data"]))
+    _, total_seek = run_disk_algorithm(job["algorithm"], requests, job["head"], job["disk_size"])
+    return {
+        "trace": job["trace"],
+        "algorithm": job["algorithm"],
+        "head": job["head"],
+        "disk_size": job["disk_size"],
+        "seek_distance": total_seek,
+        "request_count": len(requests),
+    }
+
+
+class BatchRunner:
+    """
+    Spread a list of jobs over a process pool.
+
+    run() blocks until every job is done or cancel() is called (from any
+    thread), calling on_progress(done, total, row) as each job finishes.
+    Rows come back in job order; cancelled jobs are left out.
+    """
+
+    def __init__(self, jobs, max_workers=None):
+        self.jobs = list(jobs)
+        self.max_workers = max_workers
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def run(self, on_progress=None, poll_seconds=0.1):
+        results = [None] * len(self.jobs)
+        done = 0
+
+        pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = {pool.submit(run_job, job): i for i, job in enumerate(self.jobs)}
+            pending = set(futures)
+            # Wake up every poll_seconds so cancel() is seen even while every job is still running
+            while pending and not self._cancelled.is_set():
+                finished, pending = wait(pending, timeout=poll_seconds, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    row = future.result()
+                    results[futures[future]] = row
+                    done += 1
+                    if on_progress is not None:
+                        on_progress(done, len(self.jobs), row)
+        except BaseException:
+            # A failed job ends the batch: drop the rest instead of waiting for it
+            self._cancelled.set()
+            raise
+        finally:
+            # On cancel, drop queued jobs and return without waiting for the running ones
+            cancelled = self._cancelled.is_set()
+            pool.shutdown(wait=not cancelled, cancel_futures=cancelled)
+
+        return [row for row in results if row is not None]
+
+
+def run_batch(jobs, max_workers=None, on_progress=None):
+    """Headless shortcut: run every job and return the result rows."""
+    return BatchRunner(jobs, max_workers).run(on_progress)
@@ -0,0 +1,210 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from array import array
+from collections import OrderedDict
+from itertools import islice
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "os-algo-simulator")
+
+# Bump when the shape of cached results changes
+CACHE_VERSION = 1
+# Packages whose source is hashed into every key, so fixing a simulator
+# invalidates results it computed before the fix
+SALTED_PACKAGES = ("page_replacement", "disk_scheduling")
+
+# Values packed per step when hashing data that is not already an int64 buffer
+HASH_CHUNK = 1 << 16
+
+_code_salt = None
+
+
+def code_salt():
+    """sha256 hex digest of CACHE_VERSION and the simulator sources, computed once per process."""
+    global _code_salt
+    if _code_salt is None:
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        digest = hashlib.sha256(str(CACHE_VERSION).encode())
+        for package in SALTED_PACKAGES:
+            directory = os.path.join(root, package)
+            for name in sorted(os.listdir(directory)):
+                if name.endswith(".py"):
+                    digest.update(name.encode())
+                    with open(os.path.join(directory, name), "rb") as f:
+                        digest.update(f.read())
+        _code_salt = digest.hexdigest()
+    return _code_salt
+
+
+def cache_key(algorithm, params, data):
+    """
+    sha256 hex digest of an algorithm name, its parameters and its input,
+    salted with code_salt().
+
+    params must be JSON-serialisable; data is any sequence of integers
+    (list, array, NumPy array, memoryview over a trace) and is hashed as
+    packed int64 so a list and an array with the same values share a key.
+    int64 buffers are hashed in place; anything else is packed HASH_CHUNK
+    values at a time, so the trace is never copied whole.
+
+    Returns None when a value does not fit in int64; ResultCache treats a
+    None key as a miss and does not store under it.
+    """
+    digest = hashlib.sha256()
+    digest.update(code_salt().encode())
+    digest.update(b"\0")
+    digest.update(algorithm.encode())
+    digest.update(b"\0")
+    digest.update(json.dumps(params, sort_keys=True).encode())
+    digest.update(b"\0")
+
+    try:
+        view = memoryview(data)
+    except TypeError:
+        view = None
+    if view is not None and view.format in ("q", "l") and view.itemsize == 8 and view.c_contiguous:
+        digest.update(view.cast("B"))
+        return digest.hexdigest()
+
+    values = iter(data)
+    try:
+        while True:
+            chunk = array("q", islice(values, HASH_CHUNK))
+            if not chunk:
+                break
+            digest.update(chunk)
+    except OverflowError:
+        return None
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Bounded LRU of simulation results, optionally backed by a directory.
+
+    Parameters:
+        max_entries: results kept in memory
+        directory: where to pickle results so they survive restarts (None
+            keeps the cache in memory only)
+        max_disk_bytes: once the directory grows past this, the least
+            recently used files are deleted; a single result larger than
+            this is kept in memory only
+
+    Cached results are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, max_entries=64, directory=None, max_disk_bytes=64 << 20):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0.")
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".pkl")
+
+    def _remember(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key, default=None):
+        if key is None:
+            self.misses += 1
+            return default
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        if self.directory is not None:
+            path = self._path(key)
+            try:
+                with open(path, "rb") as f:
+                    value = pickle.load(f)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                pass
+            else:
+                # Bump the mtime so disk eviction sees the file as recently used
+                os.utime(path)
+                self._remember(key, value)
+                self.hits += 1
+                return value
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        if key is None:
+            return
+        self._remember(key, value)
+        if self.directory is None:
+            return
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(payload) > self.max_disk_bytes:
+            # Writing it would only make _evict_disk delete it again
+            return
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self._evict_disk()
+
+    def _evict_disk(self):
+        files = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pkl"):
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        files.sort()
+        for _, size, path in files:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def call(self, algorithm, params, data, func):
+        """Return the cached result for (algorithm, params, data), or compute it with func()."""
+        key = cache_key(algorithm, params, data)
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = func()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        self._entries.clear()
+        if self.directory is not None:
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(".pkl"):
+                    os.unlink(entry.path)
+
+
+_MISSING = object()
+_default = None
+
+
+def default_cache():
+    """Process-wide cache persisted under ~/.cache/os-algo-simulator."""
+    global _default
+    if _default is None:
+        try:
+            _default = ResultCache(directory=DEFAULT_CACHE_DIR)
+        except OSError:
+            _default = ResultCache()
+    return _default
@@ -0,0 +1,197 @@
+import atexit
+import os
+import sqlite3
+import time
+
+DEFAULT_DB_PATH = os.path.join(os.path.expanduser("~"), ".local", "share", "os-algo-simulator", "results.db")
+
+VM_COLUMNS = ("algorithm", "trace", "frames", "faults", "hits")
+DISK_COLUMNS = ("algorithm", "trace", "head", "disk_size", "seek_distance", "request_count")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS vm_runs (
+    id INTEGER PRIMARY KEY,
+    created REAL NOT NULL,
+    algorithm TEXT NOT NULL,
+    trace TEXT,
+    frames INTEGER,
+    faults INTEGER NOT NULL,
+    hits INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS vm_runs_trace ON vm_runs (trace, frames, algorithm);
+CREATE INDEX IF NOT EXISTS vm_runs_algorithm ON vm_runs (algorithm);
+
+CREATE TABLE IF NOT EXISTS disk_runs (
+    id INTEGER PRIMARY KEY,
+    created REAL NOT NULL,
+    algorithm TEXT NOT NULL,
+    trace TEXT,
+    head INTEGER,
+    disk_size INTEGER,
+    seek_distance INTEGER NOT NULL,
+    request_count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS disk_runs_trace ON disk_runs (trace, head, disk_size, algorithm);
+CREATE INDEX IF NOT EXISTS disk_runs_algorithm ON disk_runs (algorithm);
+"""
+
+
+class ResultTable:
+    """
+    List-like view of one results table.
+
+    append() buffers rows and writes them in batches; extend() writes a
+    whole batch in one transaction. len() is a COUNT query and page() reads
+    one slice of rows, so nothing is kept in memory between calls. Rows are
+    the same dicts the GUIs used to keep in vm_results / disk_results;
+    missing columns are stored as NULL and come back as None.
+    """
+
+    def __init__(self, store, table, columns):
+        self._store = store
+        self.table = table
+        self.columns = columns
+        self._pending = []
+        self._insert = (
+            f"INSERT INTO {table} (created, {', '.join(columns)}) "
+            f"VALUES (?, {', '.join('?' * len(columns))})"
+        )
+
+    def _values(self, row):
+        return (time.time(), *(row.get(c) for c in self.columns))
+
+    def append(self, row):
+        self._pending.append(self._values(row))
+        if len(self._pending) >= self._store.batch_size:
+            self.flush()
+
+    def extend(self, rows):
+        self._pending.extend(self._values(row) for row in rows)
+        self.flush()
+
+    def flush(self):
+        if not self._pending:
+            return
+        with self._store.connection:
+            self._store.connection.executemany(self._insert, self._pending)
+        self._pending.clear()
+
+    def _query(self, sql, params=()):
+        self.flush()
+        cursor = self._store.connection.execute(sql, params)
+        names = [d[0] for d in cursor.description]
+        return [dict(zip(names, values)) for values in cursor]
+
+    def __len__(self):
+        self.flush()
+        return self._store.connection.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def page(self, offset=0, limit=50):
+        """Rows offset .. offset+limit-1 in insertion order."""
+        return self._query(
+            f"SELECT {', '.join(self.columns)} FROM {self.table} ORDER BY id LIMIT ? OFFSET ?",
+            (limit, offset),
+        )
+
+    def clear(self):
+        self._pending.clear()
+        with self._store.connection:
+            self._store.connection.execute(f"DELETE FROM {self.table}")
+
+
+class ResultsStore:
+    """
+    Run history in an SQLite file.
+
+    Parameters:
+        path: database file, created with its directory if missing
+            (":memory:" for a throwaway store)
+        batch_size: appended rows buffered before an INSERT
+
+    vm and disk are ResultTables that stand in for the old vm_results and
+    disk_results lists. Buffered rows are written on any read, on close()
+    and at interpreter exit.
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH, batch_size=200):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.batch_size = batch_size
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(_SCHEMA)
+        self.vm = ResultTable(self, "vm_runs", VM_COLUMNS)
+        self.disk = ResultTable(self, "disk_runs", DISK_COLUMNS)
+        atexit.register(self.close)
+
+    def flush(self):
+        self.vm.flush()
+        self.disk.flush()
+
+    def close(self):
+        if self.connection is None:
+            return
+        self.flush()
+        self.connection.close()
+        self.connection = None
+        atexit.unregister(self.close)
+
+    def vm_summary(self):
+        """Runs and mean/min/max page faults per algorithm."""
+        return self.vm._query(
+            "SELECT algorithm, COUNT(*) AS runs, AVG(faults) AS mean, MIN(faults) AS min, MAX(faults) AS max "
+            "FROM vm_runs GROUP BY algorithm ORDER BY mean"
+        )
+
+    def disk_summary(self):
+        """Runs and mean/min/max seek distance per algorithm."""
+        return self.disk._query(
+            "SELECT algorithm, COUNT(*) AS runs, AVG(seek_distance) AS mean, MIN(seek_distance) AS min, "
+            "MAX(seek_distance) AS max FROM disk_runs GROUP BY algorithm ORDER BY mean"
+        )
+
+    def best_vm_per_trace(self, offset=0, limit=50):
+        """
+        For every (trace, frames) the algorithm with the lowest mean faults
+        (ties go to the alphabetically first). Runs without a trace name
+        are left out.
+        """
+        return self.vm._query(
+            "SELECT trace, frames, algorithm, mean FROM ("
+            "  SELECT trace, frames, algorithm, AVG(faults) AS mean,"
+            "    ROW_NUMBER() OVER (PARTITION BY trace, frames ORDER BY AVG(faults), algorithm) AS rank"
+            "  FROM vm_runs WHERE trace IS NOT NULL GROUP BY trace, frames, algorithm"
+            ") WHERE rank = 1 ORDER BY trace, frames LIMIT ? OFFSET ?",
+            (limit, offset),
+        )
+
+    def best_disk_per_trace(self, offset=0, limit=50):
+        """For every (trace, head, disk_size) the algorithm with the lowest mean seek."""
+        return self.disk._query(
+            "SELECT trace, head, disk_size, algorithm, mean FROM ("
+            "  SELECT trace, head, disk_size, algorithm, AVG(seek_distance) AS mean,"
+            "    ROW_NUMBER() OVER (PARTITION BY trace, head, disk_size"
+            "                       ORDER BY AVG(seek_distance), algorithm) AS rank"
+            "  FROM disk_runs WHERE trace IS NOT NULL GROUP BY trace, head, disk_size, algorithm"
+            ") WHERE rank = 1 ORDER BY trace, head, disk_size LIMIT ? OFFSET ?",
+            (limit, offset),
+        )
+
+    def count_vm_traces(self):
+        return self.vm._query(
+            "SELECT COUNT(*) AS n FROM (SELECT 1 FROM vm_runs WHERE trace IS NOT NULL GROUP BY trace, frames)"
+        )[0]["n"]
+
+    def count_disk_traces(self):
+        return self.disk._query(
+            "SELECT COUNT(*) AS n FROM (SELECT 1 FROM disk_runs WHERE trace IS NOT NULL "
+            "GROUP BY trace, head, disk_size)"
+        )[0]["n"]
+
+
+def open_store(path=DEFAULT_DB_PATH):
+    """ResultsStore at path, falling back to an in-memory one if the file can't be opened."""
+    try:
+        return ResultsStore(path)
+    except (OSError, sqlite3.Error):
+        return ResultsStore(":memory:")
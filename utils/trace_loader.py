@@ -0,0 +1,93 @@
+import mmap
+import os
+from array import array
+
+# Binary trace formats → memoryview / array type codes
+BINARY_FORMATS = {
+    "int32": "i",
+    "int64": "q",
+}
+
+
+def iter_text_trace(path, chunk_size=1 << 20):
+    """
+    Yield integers from a whitespace-separated text trace.
+
+    The file is read in fixed-size chunks and a token cut at a chunk
+    boundary is carried over, so only one chunk is in memory at a time.
+    """
+    carry = b""
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            chunk = carry + chunk
+            tokens = chunk.split()
+            # Last token may continue in the next chunk
+            if tokens and not chunk[-1:].isspace():
+                carry = tokens.pop()
+            else:
+                carry = b""
+            for token in tokens:
+                yield int(token)
+    if carry:
+        yield int(carry)
+
+
+def open_binary_trace(path, fmt="int32"):
+    """
+    Map a raw binary trace of native-endian int32/int64 values.
+
+    Returns a read-only memoryview over the mmap, which supports len() and
+    indexing without copying the file, so it can be handed straight to
+    optimal_page_replacement as well as the streaming simulators.
+    """
+    if fmt not in BINARY_FORMATS:
+        raise ValueError(f"Unknown binary format: {fmt}")
+    typecode = BINARY_FORMATS[fmt]
+
+    size = os.path.getsize(path)
+    if size == 0:
+        return memoryview(array(typecode))
+    if size % array(typecode).itemsize:
+        raise ValueError(f"File size is not a multiple of the {fmt} item size.")
+
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapped).cast(typecode)
+
+
+def iter_trace(path, fmt="text", chunk_size=1 << 20):
+    """Yield the values of a text or binary trace one at a time."""
+    if fmt == "text":
+        return iter_text_trace(path, chunk_size)
+    return iter(open_binary_trace(path, fmt))
+
+
+def load_trace(path, fmt="text", chunk_size=1 << 20):
+    """
+    Load a trace as an indexable sequence without building a Python list.
+
+    Binary traces are memory-mapped; text traces are parsed chunk by chunk
+    into a compact array('q').
+    """
+    if fmt == "text":
+        return array("q", iter_text_trace(path, chunk_size))
+    return open_binary_trace(path, fmt)
+
+
+def iter_reference_string(path, fmt="text", chunk_size=1 << 20):
+    """Yield page numbers from a trace file, rejecting negative pages."""
+    for index, page in enumerate(iter_trace(path, fmt, chunk_size)):
+        if page < 0:
+            raise ValueError(f"Page numbers must be non-negative integers (index {index}: {page}).")
+        yield page
+
+
+def iter_request_queue(path, disk_max, fmt="text", chunk_size=1 << 20):
+    """Yield cylinder requests from a trace file, checking the disk range."""
+    for index, request in enumerate(iter_trace(path, fmt, chunk_size)):
+        if request < 0 or request >= disk_max:
+            raise ValueError(f"Requests must be in range 0 to {disk_max - 1} (index {index}: {request}).")
+        yield request
@@ -43,4 +43,68 @@ def validate_request_queue(queue_str, disk_max):
     if any(r < 0 or r >= disk_max for r in requests):
         return False, f"❌ Requests must be in range 0 to {disk_max - 1}."
 
-    return True, requests
\ No newline at end of file
+    return True, requests
+
+# ✅ Bulk path for very long inputs: parse straight into a NumPy array
+def _parse_int_array(text):
+    import warnings
+    import numpy as np
+
+    with warnings.catch_warnings():
+        # Older NumPy only warns when parsing stops early
+        warnings.simplefilter("error")
+        try:
+            values = np.fromstring(text, dtype=np.int64, sep=" ")
+        except (ValueError, DeprecationWarning):
+            values = None
+    # NumPy clamps tokens outside int64 to its limits instead of failing,
+    # so a value at either limit is re-checked token by token
+    info = np.iinfo(np.int64)
+    if values is not None and not (values.size and (values.max() == info.max or values.min() == info.min)):
+        return values, None
+
+    # Slow path: int() accepts tokens NumPy rejects (e.g. "1_000") and
+    # catches the clamped ones, so parse each token and either build the
+    # array or report where the bad one is
+    values = []
+    for index, token in enumerate(text.split()):
+        try:
+            value = int(token)
+        except ValueError:
+            return None, index
+        if not -2**63 <= value < 2**63:
+            return None, index
+        values.append(value)
+    return np.array(values, dtype=np.int64), None
+
+
+def validate_reference_array(ref_str):
+    """Like validate_reference_string, but returns an int64 NumPy array."""
+    if not ref_str.strip():
+        return False, "Reference string is empty."
+
+    pages, bad_index = _parse_int_array(ref_str)
+    if pages is None:
+        return False, f"Reference string must contain only integers (index {bad_index})."
+
+    negative = pages < 0
+    if negative.any():
+        index = int(negative.argmax())
+        return False, f"Page numbers must be non-negative integers (index {index}: {pages[index]})."
+    return True, pages
+
+
+def validate_request_array(queue_str, disk_max):
+    """Like validate_request_queue, but returns an int64 NumPy array."""
+    if not queue_str.strip():
+        return False, "❌ Request queue is empty."
+
+    requests, bad_index = _parse_int_array(queue_str)
+    if requests is None:
+        return False, f"❌ Request queue must contain only integers (index {bad_index})."
+
+    out_of_range = (requests < 0) | (requests >= disk_max)
+    if out_of_range.any():
+        index = int(out_of_range.argmax())
+        return False, f"❌ Requests must be in range 0 to {disk_max - 1} (index {index}: {requests[index]})."
+    return True, requests